@@ -24,6 +24,13 @@ def anonymize(data):
     return response.status_code, response.content
 
 
+def anonymize_batch(data, headers=DEFAULT_HEADERS):
+    response = requests.post(
+        f"{ANONYMIZER_BASE_URL}/anonymize/batch", data=data, headers=headers
+    )
+    return response.status_code, response.content
+
+
 def anonymizers():
     response = requests.get(
         f"{ANONYMIZER_BASE_URL}/anonymizers", headers=DEFAULT_HEADERS
@@ -38,6 +45,13 @@ def analyze(data):
     return response.status_code, response.content
 
 
+def analyze_batch(data, headers=DEFAULT_HEADERS):
+    response = requests.post(
+        f"{ANALYZER_BASE_URL}/analyze/batch", data=data, headers=headers
+    )
+    return response.status_code, response.content
+
+
 def analyzer_supported_entities(data):
     response = requests.get(
         f"{ANALYZER_BASE_URL}/supportedentities?{data}", headers=DEFAULT_HEADERS
@@ -61,6 +75,13 @@ def deanonymize(data):
     return response.status_code, response.content
 
 
+def deanonymize_batch(data, headers=DEFAULT_HEADERS):
+    response = requests.post(
+        f"{ANONYMIZER_BASE_URL}/deanonymize/batch", data=data, headers=headers
+    )
+    return response.status_code, response.content
+
+
 def __get_redact_payload(color_fill):
     payload = {}
     if color_fill:
@@ -1,7 +1,7 @@
 import pytest
 
 from common.assertions import equal_json_strings
-from common.methods import analyze, analyzer_supported_entities
+from common.methods import analyze, analyze_batch, analyzer_supported_entities
 
 
 @pytest.mark.api
@@ -411,3 +411,61 @@ def test_given_ad_hoc_deny_list_recognizer_the_right_entities_are_returned():
      """
     assert response_status == 200
     assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_analyze_batch_request_then_one_line_per_request_is_returned():
+    request_body = """
+    [
+        {"text": "My phone number is 212-555-5555", "language": "en",
+         "entities": ["PHONE_NUMBER"]},
+        {"text": "", "language": "en"},
+        {"text": "My email is john@microsoft.com", "language": "en",
+         "entities": ["EMAIL_ADDRESS"]}
+    ]
+    """
+
+    response_status, response_content = analyze_batch(request_body)
+
+    expected_lines = [
+        """
+        {"index": 0, "results": [{"entity_type": "PHONE_NUMBER", "start": 19,
+         "end": 31, "score": 1.0, "analysis_explanation": null}]}
+        """,
+        """
+        {"index": 1, "error": "No text provided"}
+        """,
+        """
+        {"index": 2, "results": [{"entity_type": "EMAIL_ADDRESS", "start": 12,
+         "end": 30, "score": 1.0, "analysis_explanation": null}]}
+        """,
+    ]
+    response_lines = response_content.splitlines()
+    assert response_status == 200
+    assert len(response_lines) == len(expected_lines)
+    for expected_line, response_line in zip(expected_lines, response_lines):
+        assert equal_json_strings(expected_line, response_line)
+
+
+@pytest.mark.api
+def test_given_analyze_batch_ndjson_request_then_one_line_per_request_is_returned():
+    request_body = (
+        '{"text": "My email is john@microsoft.com", "language": "en", '
+        '"entities": ["EMAIL_ADDRESS"]}\n'
+        '{"text": "My email is jane@microsoft.com", "language": "en", '
+        '"entities": ["EMAIL_ADDRESS"]}\n'
+    )
+
+    response_status, response_content = analyze_batch(
+        request_body, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    expected_line = """
+    {"index": %d, "results": [{"entity_type": "EMAIL_ADDRESS", "start": 12,
+     "end": 30, "score": 1.0, "analysis_explanation": null}]}
+    """
+    response_lines = response_content.splitlines()
+    assert response_status == 200
+    assert len(response_lines) == 2
+    for index, response_line in enumerate(response_lines):
+        assert equal_json_strings(expected_line % index, response_line)
@@ -3,7 +3,13 @@ import json
 import pytest
 
 from common.assertions import equal_json_strings
-from common.methods import anonymize, anonymizers, deanonymize
+from common.methods import (
+    anonymize,
+    anonymize_batch,
+    anonymizers,
+    deanonymize,
+    deanonymize_batch,
+)
 
 
 @pytest.mark.api
@@ -302,3 +308,145 @@ def test_given_encrypt_called_then_decrypt_returns_the_original_encrypted_text()
 
     decrypted_text = json.loads(decrypted_text_response)["text"]
     assert decrypted_text == text_for_encryption
+
+
+@pytest.mark.api
+def test_given_anonymize_batch_called_then_one_result_per_item_is_returned():
+    request_body = """
+    {
+        "anonymizers": {
+            "DEFAULT": { "type": "replace", "new_value": "ANONYMIZED" }
+        },
+        "items": [
+            {
+                "text": "hello Jane",
+                "analyzer_results": [
+                    { "start": 6, "end": 10, "score": 0.8, "entity_type": "NAME" }
+                ]
+            },
+            {
+                "text": "bad",
+                "analyzer_results": [
+                    { "start": 6, "end": 10, "score": 0.8, "entity_type": "NAME" }
+                ]
+            }
+        ]
+    }
+    """
+
+    response_status, response_content = anonymize_batch(request_body)
+
+    expected_response = """
+    [
+        {"index": 0, "text": "hello ANONYMIZED", "items": [
+            {"start": 6, "end": 16, "entity_type": "NAME", "text": "ANONYMIZED",
+             "operator": "replace"}]},
+        {"index": 1,
+         "error": "Invalid analyzer result, start: 6 and end: 10, while text length is only 3."}
+    ]
+    """
+    assert response_status == 200
+    assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_anonymize_batch_called_with_ndjson_accept_then_one_line_per_item_is_returned():
+    request_body = """
+    {
+        "items": [
+            {
+                "text": "hello Jane",
+                "analyzer_results": [
+                    { "start": 6, "end": 10, "score": 0.8, "entity_type": "NAME" }
+                ]
+            },
+            { "text": "hello world", "analyzer_results": [] }
+        ]
+    }
+    """
+    headers = {"Content-Type": "application/json", "Accept": "application/x-ndjson"}
+
+    response_status, response_content = anonymize_batch(request_body, headers)
+
+    expected_lines = [
+        """
+        {"index": 0, "text": "hello <NAME>", "items": [
+            {"start": 6, "end": 12, "entity_type": "NAME", "text": "<NAME>",
+             "operator": "replace"}]}
+        """,
+        """
+        {"index": 1, "text": "hello world", "items": []}
+        """,
+    ]
+    response_lines = response_content.decode().splitlines()
+    assert response_status == 200
+    assert len(response_lines) == len(expected_lines)
+    for expected_line, response_line in zip(expected_lines, response_lines):
+        assert equal_json_strings(expected_line, response_line)
+
+
+@pytest.mark.api
+def test_given_anonymize_batch_called_with_invalid_operator_then_invalid_input_response_returned():
+    request_body = """
+    {
+        "anonymizers": {
+            "DEFAULT": { "type": "hash", "hash_type": "md4" }
+        },
+        "items": [
+            { "text": "hello world", "analyzer_results": [] }
+        ]
+    }
+    """
+
+    response_status, response_content = anonymize_batch(request_body)
+
+    assert response_status == 422
+    assert "error" in json.loads(response_content)
+
+
+@pytest.mark.api
+def test_given_encrypt_batch_called_then_decrypt_batch_returns_the_original_texts():
+    texts = ["My name is Chloë", "Call Bob please"]
+    anonymize_request = {
+        "anonymizers": {"DEFAULT": {"type": "encrypt", "key": "1111111111111111"}},
+        "items": [
+            {
+                "text": texts[0],
+                "analyzer_results": [
+                    {"start": 11, "end": 16, "score": 0.8, "entity_type": "NAME"}
+                ],
+            },
+            {
+                "text": texts[1],
+                "analyzer_results": [
+                    {"start": 5, "end": 8, "score": 0.8, "entity_type": "NAME"}
+                ],
+            },
+        ],
+    }
+    _, anonymize_response_content = anonymize_batch(json.dumps(anonymize_request))
+    anonymized_items = json.loads(anonymize_response_content)
+
+    deanonymize_request = {
+        "deanonymizers": {"DEFAULT": {"type": "decrypt", "key": "1111111111111111"}},
+        "items": [
+            {
+                "text": item["text"],
+                "anonymizer_results": [
+                    {
+                        "start": result["start"],
+                        "end": result["end"],
+                        "entity_type": result["entity_type"],
+                    }
+                    for result in item["items"]
+                ],
+            }
+            for item in anonymized_items
+        ],
+    }
+    response_status, response_content = deanonymize_batch(
+        json.dumps(deanonymize_request)
+    )
+
+    assert response_status == 200
+    assert [item["text"] for item in json.loads(response_content)] == texts
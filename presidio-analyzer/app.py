@@ -4,16 +4,26 @@ import logging
 import os
 from logging.config import fileConfig
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Iterator, Iterable, List, Dict, Union
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, stream_with_context
 from werkzeug.exceptions import HTTPException
 
 from presidio_analyzer.analyzer_engine import AnalyzerEngine
 from presidio_analyzer.analyzer_request import AnalyzerRequest
+from presidio_analyzer.json_encoder import (
+    encode_json_list,
+    encode_json_object,
+    encode_json_value,
+)
+from presidio_analyzer.recognizer_result import RecognizerResult
 
 DEFAULT_PORT = "3000"
 
+DEFAULT_BATCH_SIZE = "32"
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
 LOGGING_CONF_FILE = "logging.ini"
 
 WELCOME_MESSAGE = r"""
@@ -39,6 +49,7 @@ class Server:
         self.logger.info("Starting analyzer engine")
         self.engine = AnalyzerEngine()
         self.logger.info(WELCOME_MESSAGE)
+        self.batch_size = int(os.environ.get("BATCH_SIZE", DEFAULT_BATCH_SIZE))
 
         @self.app.route("/health")
         def health() -> str:
@@ -68,11 +79,7 @@ class Server:
                 )
 
                 return Response(
-                    json.dumps(
-                        recognizer_result_list,
-                        default=lambda o: o.to_dict(),
-                        sort_keys=True,
-                    ),
+                    self.__results_to_json(recognizer_result_list),
                     content_type="application/json",
                 )
             except TypeError as te:
@@ -90,6 +97,28 @@ class Server:
                 )
                 return jsonify(error=e.args[0]), 500
 
+        @self.app.route("/analyze/batch", methods=["POST"])
+        def analyze_batch() -> Tuple[Response, int]:
+            """
+            Execute the analyzer function on a batch of requests.
+
+            The body is either a JSON array of analyze requests,
+            or an NDJSON stream (one analyze request per line).
+            The response is streamed as NDJSON, one line per request, in order.
+            """
+            if request.mimetype == NDJSON_MIMETYPE:
+                records = self.__read_ndjson(request.stream)
+            else:
+                records = request.get_json()
+                if not isinstance(records, list):
+                    return jsonify(error="Expected a list of analyze requests"), 400
+
+            lines = self.__analyze_records(records)
+            return (
+                Response(stream_with_context(lines), content_type=NDJSON_MIMETYPE),
+                200,
+            )
+
         @self.app.route("/recognizers", methods=["GET"])
         def recognizers() -> Tuple[str, int]:
             """Return a list of supported recognizers."""
@@ -123,6 +152,122 @@ class Server:
         def http_exception(e):
             return jsonify(error=e.description), e.code
 
+    @staticmethod
+    def __read_ndjson(stream: Iterable[bytes]) -> Iterator[Union[Dict, Exception]]:
+        """Read records lazily from an NDJSON stream, skipping empty lines."""
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield e
+
+    def __analyze_records(
+        self, records: Iterable[Union[Dict, Exception]]
+    ) -> Iterator[str]:
+        """
+        Analyze request records, yielding an NDJSON line per record.
+
+        Consecutive records of the same language are passed through the NLP
+        engine together, in batches of at most batch_size records,
+        so only one batch is held in memory at a time.
+        """
+        batch: List[Tuple[int, AnalyzerRequest]] = []
+        for index, record in enumerate(records):
+            try:
+                req_data = self.__parse_batch_record(record)
+            except Exception as e:
+                # flush the pending batch first, to keep the results in order
+                yield from self.__analyze_requests(batch)
+                batch = []
+                yield self.__to_ndjson_line(index=index, error=e.args[0])
+                continue
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or batch[0][1].language != req_data.language
+            ):
+                yield from self.__analyze_requests(batch)
+                batch = []
+            batch.append((index, req_data))
+
+        yield from self.__analyze_requests(batch)
+
+    def __parse_batch_record(self, record: Union[Dict, Exception]) -> AnalyzerRequest:
+        if isinstance(record, Exception):
+            raise Exception(f"Failed to parse request. {record}")
+        if not isinstance(record, dict):
+            raise Exception("Request should be a JSON object")
+
+        req_data = AnalyzerRequest(record)
+        if not req_data.text:
+            raise Exception("No text provided")
+        if not req_data.language:
+            raise Exception("No language provided")
+        if req_data.language not in self.engine.supported_languages:
+            raise Exception(f"Language {req_data.language} is not supported")
+        return req_data
+
+    def __analyze_requests(
+        self, batch: List[Tuple[int, AnalyzerRequest]]
+    ) -> Iterator[str]:
+        """Analyze a batch of requests of the same language, in one NLP pass."""
+        if not batch:
+            return
+
+        texts = [req_data.text for _, req_data in batch]
+        nlp_artifacts_batch = self.engine.nlp_engine.process_batch(
+            texts, batch[0][1].language, batch_size=len(texts)
+        )
+        for (index, req_data), (_, nlp_artifacts) in zip(batch, nlp_artifacts_batch):
+            try:
+                recognizer_result_list = self.engine.analyze(
+                    text=req_data.text,
+                    language=req_data.language,
+                    correlation_id=req_data.correlation_id,
+                    score_threshold=req_data.score_threshold,
+                    entities=req_data.entities,
+                    return_decision_process=req_data.return_decision_process,
+                    ad_hoc_recognizers=req_data.ad_hoc_recognizers,
+                    nlp_artifacts=nlp_artifacts,
+                )
+                yield self.__to_ndjson_line(index=index, results=recognizer_result_list)
+            except Exception as e:
+                self.logger.error(
+                    f"A fatal error occurred during execution of "
+                    f"AnalyzerEngine.analyze(). {e}"
+                )
+                yield self.__to_ndjson_line(index=index, error=e.args[0])
+
+    @staticmethod
+    def __results_to_json(results: List[RecognizerResult]) -> str:
+        return encode_json_list(result.to_json() for result in results)
+
+    @staticmethod
+    def __to_ndjson_line(**fields) -> str:
+        encoded_fields = []
+        for name, value in sorted(fields.items()):
+            if name == "results":
+                encoded_value = Server.__results_to_json(value)
+            else:
+                encoded_value = encode_json_value(
+                    value, default=lambda o: o.to_dict(), sort_keys=True
+                )
+            encoded_fields.append((name, encoded_value))
+        return encode_json_object(encoded_fields) + "\n"
+
+
+def create_app() -> Flask:
+    """
+    Create the analyzer Flask app, for serving with a WSGI server.
+
+    Used by gunicorn (see gunicorn.conf.py), which loads the app and
+    its models once before forking the worker processes.
+    """
+    server = Server()
+    return server.app
+
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", DEFAULT_PORT))
@@ -0,0 +1,85 @@
+"""
+Load test for the analyzer REST service.
+
+Sends concurrent /analyze requests and reports the throughput and latency.
+
+Usage (with the service running, e.g. `gunicorn --config gunicorn.conf.py`):
+
+    python benchmarks/load_test.py --url http://localhost:3000 \
+        --concurrency 8 --requests 1000
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+DEFAULT_TEXT = (
+    "My name is John Smith, my phone number is 212-555-5555 "
+    "and my credit card number is 4012888888881881"
+)
+
+
+def send_request(url: str, payload: bytes) -> Tuple[float, bool]:
+    """Send a single request and return its latency and whether it succeeded."""
+    http_request = urllib.request.Request(
+        url, data=payload, headers={"Content-Type": "application/json"}
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(http_request) as response:
+            response.read()
+            success = response.status == 200
+    except Exception:
+        success = False
+    return time.perf_counter() - start, success
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    """Return the latency below which the given percent of requests fall."""
+    index = min(len(latencies) - 1, int(len(latencies) * percent / 100))
+    return latencies[index]
+
+
+def run_load_test(url: str, text: str, concurrency: int, requests: int) -> None:
+    """Run the load test and print a report."""
+    payload = json.dumps({"text": text, "language": "en"}).encode("utf-8")
+    analyze_url = url.rstrip("/") + "/analyze"
+
+    # warm up
+    send_request(analyze_url, payload)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(
+            executor.map(lambda _: send_request(analyze_url, payload), range(requests))
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, success in results if not success)
+
+    print(f"requests:     {requests} ({errors} errors)")
+    print(f"concurrency:  {concurrency}")
+    print(f"requests/sec: {requests / elapsed:.1f}")
+    print(f"mean latency: {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"p50 latency:  {percentile(latencies, 50) * 1000:.1f} ms")
+    print(f"p99 latency:  {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+def main():
+    """Parse the command line arguments and run the load test."""
+    parser = argparse.ArgumentParser(description="Analyzer service load test")
+    parser.add_argument("--url", default="http://localhost:3000")
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    run_load_test(args.url, args.text, args.concurrency, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Benchmark scanning the predefined patterns one by one against a combined scan.
+
+AnalyzerEngine runs each PatternRecognizer, which scans the text once per
+Pattern. This compares that loop with scanning all the patterns of the
+registry together, on long documents:
+
+* combined: one pass of an alternation of all the patterns (with the
+  `regex` module's overlapped search) finds the positions where any pattern
+  matches, and the match of every pattern at those positions is read with
+  one regex of a lookahead group per pattern. The results are identical
+  to the loop's.
+* alternation: a single finditer of an alternation with a group per pattern.
+  It reads the text once, but a match of one pattern hides the matches of
+  the other patterns which overlap it, so results are lost.
+
+Patterns which look ahead over the rest of the text (e.g. `(?=.*`) are
+quadratic in the text length and dominate the time, so the documents are
+also scanned without them. The slowest patterns are listed at the end.
+
+Usage (from the presidio-analyzer folder):
+
+    python benchmarks/pattern_scan_benchmark.py
+"""
+import random
+import timeit
+
+import regex as re
+
+from presidio_analyzer import PatternRecognizer, RecognizerRegistry
+
+FLAGS = re.DOTALL | re.MULTILINE
+
+SENTENCES = [
+    "The patient John Smith was admitted on the third of May.",
+    "Please charge card 4095-2609-9393-4932 for the visit.",
+    "Contact john.smith@example.com or call (212) 555-1234 for details.",
+    "Requests came from 192.168.0.1 and were logged by the server.",
+    "His social security number is 078-05-1120, keep it private.",
+    "The report is available at https://www.example.com/reports today.",
+    "Nothing of interest happened during the rest of the afternoon.",
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod.",
+]
+
+
+def get_patterns():
+    """Get the patterns of the predefined English pattern recognizers.
+
+    Recognizers overriding analyze are left out, as they scan on their own.
+    """
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers()
+    return [
+        pattern
+        for recognizer in registry.recognizers
+        if isinstance(recognizer, PatternRecognizer)
+        and recognizer.supported_language == "en"
+        and type(recognizer).analyze is PatternRecognizer.analyze
+        for pattern in recognizer.patterns
+    ]
+
+
+def scoped_regex(regex):
+    """Turn leading inline flags, e.g. (?i), into flags scoped to the regex."""
+    match = re.match(r"\(\?([imsx]+)\)", regex)
+    if not match:
+        return regex
+    return f"(?{match.group(1)}:{regex[match.end():]})"
+
+
+def loop_scan(patterns, text):
+    """Scan the text once per pattern, as PatternRecognizer does."""
+    return sorted(
+        (index, match.start(), match.end())
+        for index, pattern in enumerate(patterns)
+        for match in pattern.compiled_regex(FLAGS).finditer(text)
+        if match.end() > match.start()
+    )
+
+
+class CombinedScan:
+    """Scan the text for all the patterns together."""
+
+    def __init__(self, patterns):
+        regexes = [scoped_regex(pattern.regex) for pattern in patterns]
+        self.count = len(regexes)
+        self.any_pattern = re.compile(
+            "|".join(f"(?:{regex})" for regex in regexes), FLAGS
+        )
+        self.all_patterns = re.compile(
+            "".join(
+                f"(?:(?=(?P<p{index}>{regex}))|)" for index, regex in enumerate(regexes)
+            ),
+            FLAGS,
+        )
+
+    def scan(self, text):
+        """Return the same matches as loop_scan."""
+        results = []
+        ends = [0] * self.count
+        for candidate in self.any_pattern.finditer(text, overlapped=True):
+            position = candidate.start()
+            match = self.all_patterns.match(text, position)
+            for index in range(self.count):
+                start, end = match.span(f"p{index}")
+                # As in finditer, a pattern's matches do not overlap each other
+                if start >= ends[index] and end > start:
+                    results.append((index, start, end))
+                    ends[index] = end
+        return sorted(results)
+
+
+class AlternationScan:
+    """Scan the text once with an alternation of all the patterns."""
+
+    def __init__(self, patterns):
+        self.alternation = re.compile(
+            "|".join(
+                f"(?P<p{index}>{scoped_regex(pattern.regex)})"
+                for index, pattern in enumerate(patterns)
+            ),
+            FLAGS,
+        )
+
+    def scan(self, text):
+        """Return the matches of the first pattern matching at each position."""
+        return sorted(
+            (int(match.lastgroup[1:]), match.start(), match.end())
+            for match in self.alternation.finditer(text)
+            if match.end() > match.start()
+        )
+
+
+def create_document(length, seed=42):
+    """Create a document of about length characters from the sample sentences."""
+    rnd = random.Random(seed)
+    sentences = []
+    size = 0
+    while size < length:
+        sentence = rnd.choice(SENTENCES)
+        sentences.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def time_scans(patterns, lengths):
+    """Time the scans of the patterns on documents of increasing length."""
+    combined = CombinedScan(patterns)
+    alternation = AlternationScan(patterns)
+    for length in lengths:
+        text = create_document(length)
+        expected = loop_scan(patterns, text)
+        assert combined.scan(text) == expected
+        missed = len(set(expected) - set(alternation.scan(text)))
+
+        number = 3
+        loop_time = timeit.timeit(lambda: loop_scan(patterns, text), number=number)
+        combined_time = timeit.timeit(lambda: combined.scan(text), number=number)
+        alternation_time = timeit.timeit(
+            lambda: alternation.scan(text), number=number
+        )
+        print(
+            f"{len(text):>7} chars  loop: {loop_time / number * 1000:9.2f} ms  "
+            f"combined: {combined_time / number * 1000:9.2f} ms  "
+            f"alternation: {alternation_time / number * 1000:9.2f} ms  "
+            f"({missed} of {len(expected)} matches missed)"
+        )
+
+
+def main():
+    """Time the loop and the combined scans, and list the slowest patterns."""
+    patterns = get_patterns()
+    print(f"All {len(patterns)} patterns:")
+    time_scans(patterns, (5000, 20000, 50000))
+
+    linear_patterns = [
+        pattern
+        for pattern in patterns
+        if "(?=.*" not in pattern.regex and "(?!.*" not in pattern.regex
+    ]
+    print(
+        f"Without the {len(patterns) - len(linear_patterns)} patterns "
+        "looking ahead over the rest of the text:"
+    )
+    time_scans(linear_patterns, (5000, 20000, 50000, 200000))
+
+    print("Slowest patterns on 20000 chars:")
+    text = create_document(20000)
+    pattern_times = [
+        (
+            timeit.timeit(
+                lambda: list(pattern.compiled_regex(FLAGS).finditer(text)), number=1
+            ),
+            pattern.name,
+        )
+        for pattern in patterns
+    ]
+    for pattern_time, name in sorted(pattern_times, reverse=True)[:5]:
+        print(f"{pattern_time * 1000:9.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark serializing analyzer results to JSON, as the REST API does.
+
+Compares json.dumps with a default function creating a dict from
+each object to the schema driven RecognizerResult.to_json.
+
+Usage (from the presidio-analyzer folder):
+
+    python benchmarks/serialization_benchmark.py
+"""
+import json
+import time
+
+from presidio_analyzer import AnalysisExplanation, RecognizerResult
+
+RESPONSE_COUNT = 100000
+RESULTS_PER_RESPONSE = 3
+
+
+def create_results(with_explanation):
+    """Create the results of a small analyze response."""
+    results = []
+    for index in range(RESULTS_PER_RESPONSE):
+        explanation = None
+        if with_explanation:
+            explanation = AnalysisExplanation(
+                "PatternRecognizer", 0.5, "pattern", r"\d{3}-\d{4}", None
+            )
+            explanation.set_improved_score(0.85)
+        results.append(
+            RecognizerResult("PERSON", index * 10, index * 10 + 8, 0.85, explanation)
+        )
+    return results
+
+
+def json_dumps(results):
+    """Serialize the results with json.dumps."""
+    return json.dumps(results, default=lambda o: o.to_dict(), sort_keys=True)
+
+
+def to_json(results):
+    """Serialize the results with RecognizerResult.to_json."""
+    return "[" + ", ".join(result.to_json() for result in results) + "]"
+
+
+def timed(name, function, results):
+    """Serialize the results RESPONSE_COUNT times and print the duration."""
+    start = time.perf_counter()
+    for _ in range(RESPONSE_COUNT):
+        output = function(results)
+    print(f"{name:<35} {time.perf_counter() - start:8.2f} s")
+    return output
+
+
+def main():
+    """Run the benchmark."""
+    print(f"{RESPONSE_COUNT} responses, {RESULTS_PER_RESPONSE} results each")
+    for with_explanation in (False, True):
+        results = create_results(with_explanation)
+        suffix = ", with explanation" if with_explanation else ""
+        expected = timed("json.dumps" + suffix, json_dumps, results)
+        assert timed("to_json" + suffix, to_json, results) == expected
+
+
+if __name__ == "__main__":
+    main()
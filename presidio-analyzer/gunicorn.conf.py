@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for serving the analyzer in production.
+
+Run with: gunicorn --config gunicorn.conf.py
+
+Settings can be overridden with environment variables:
+PORT, WORKERS, WORKER_THREADS and WORKER_TIMEOUT.
+"""
+import gc
+import os
+
+wsgi_app = "app:create_app()"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '3000')}"
+workers = int(os.environ.get("WORKERS", "1"))
+threads = int(os.environ.get("WORKER_THREADS", "1"))
+timeout = int(os.environ.get("WORKER_TIMEOUT", "120"))
+
+# Load the app, including the NLP models and recognizers, once in the master
+# process before forking the workers, so workers share its memory pages
+# copy-on-write instead of each loading the models again
+preload_app = True
+
+
+def when_ready(server):  # noqa D103
+    # Move the objects loaded so far to a permanent generation,
+    # so the garbage collector does not write to (and copy) their pages
+    # in the worker processes
+    gc.freeze()
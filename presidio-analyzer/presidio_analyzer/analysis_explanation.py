@@ -1,5 +1,7 @@
 from typing import Dict
 
+from presidio_analyzer.json_encoder import encode_json_value
+
 
 class AnalysisExplanation:
     """
@@ -61,4 +63,36 @@ class AnalysisExplanation:
 
         :return: a dictionary
         """
-        return self.__dict__
+        return {
+            "recognizer": self.recognizer,
+            "pattern_name": self.pattern_name,
+            "pattern": self.pattern,
+            "original_score": self.original_score,
+            "score": self.score,
+            "textual_explanation": self.textual_explanation,
+            "score_context_improvement": self.score_context_improvement,
+            "supportive_context_word": self.supportive_context_word,
+            "validation_result": self.validation_result,
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize self to a JSON string, with sorted keys.
+
+        The output is identical to json.dumps(self.to_dict(), sort_keys=True).
+
+        :return: a JSON string
+        """
+        return (
+            f'{{"original_score": {encode_json_value(self.original_score)}, '
+            f'"pattern": {encode_json_value(self.pattern)}, '
+            f'"pattern_name": {encode_json_value(self.pattern_name)}, '
+            f'"recognizer": {encode_json_value(self.recognizer)}, '
+            f'"score": {encode_json_value(self.score)}, '
+            f'"score_context_improvement": '
+            f"{encode_json_value(self.score_context_improvement)}, "
+            f'"supportive_context_word": '
+            f"{encode_json_value(self.supportive_context_word)}, "
+            f'"textual_explanation": {encode_json_value(self.textual_explanation)}, '
+            f'"validation_result": {encode_json_value(self.validation_result)}}}'
+        )
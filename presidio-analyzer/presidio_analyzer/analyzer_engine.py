@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import List, Optional
+from typing import List, Optional, Iterable, Iterator
 
 from presidio_analyzer import (
     RecognizerRegistry,
@@ -8,7 +8,7 @@ from presidio_analyzer import (
     EntityRecognizer,
 )
 from presidio_analyzer.app_tracer import AppTracer
-from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider
+from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider, NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -114,6 +114,7 @@ class AnalyzerEngine:
         score_threshold: Optional[float] = None,
         return_decision_process: Optional[bool] = False,
         ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
     ) -> List[RecognizerResult]:
         """
         Find PII entities in text using different PII recognizers for a given language.
@@ -129,6 +130,8 @@ class AnalyzerEngine:
         returned in the response.
         :param ad_hoc_recognizers: List of recognizers which will be used only
         for this specific request.
+        :param nlp_artifacts: precomputed NlpArtifacts of the text.
+        If None, the NLP engine is called to create them.
         :return: an array of the found entities in the text
 
         :example:
@@ -154,13 +157,14 @@ class AnalyzerEngine:
         )
 
         if all_fields:
-            # Since all_fields=True, list all entities by iterating
-            # over all recognizers
-            entities = self.get_supported_entities(language=language)
+            # Since all_fields=True, list all entities
+            # supported by the registry's recognizers
+            entities = self.registry.get_supported_entities(language=language)
 
         # run the nlp pipeline over the given text, store the results in
         # a NlpArtifacts instance
-        nlp_artifacts = self.nlp_engine.process_text(text, language)
+        if nlp_artifacts is None:
+            nlp_artifacts = self.nlp_engine.process_text(text, language)
 
         if self.log_decision_process:
             self.app_tracer.trace(
@@ -196,6 +200,65 @@ class AnalyzerEngine:
 
         return results
 
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ) -> Iterator[List[RecognizerResult]]:
+        """
+        Find PII entities in a batch of texts.
+
+        The texts are passed through the NLP engine in batches,
+        and the recognizers are then run on each text separately.
+        Results are returned lazily, in the same order as the input texts.
+
+        :param texts: an iterable of texts to analyze
+        :param language: the language of the texts
+        :param entities: List of PII entities that should be looked for in the texts.
+        If entities=None then all entities are looked for.
+        :param correlation_id: cross call ID for this request
+        :param score_threshold: A minimum value for which
+        to return an identified entity
+        :param return_decision_process: Whether the analysis decision process steps
+        returned in the response.
+        :param ad_hoc_recognizers: List of recognizers which will be used only
+        for this specific request.
+        :param batch_size: Number of texts to buffer when running the NLP pipeline
+        :param n_process: Number of processes to use for the NLP pipeline
+        :return: a generator of lists of found entities, one list per input text
+
+        :example:
+
+        >>> from presidio_analyzer import AnalyzerEngine
+
+        >>> analyzer = AnalyzerEngine()
+        >>> texts = ["My phone number is 212-555-5555", "No PII here"]
+        >>> results = analyzer.analyze_batch(texts=texts, language="en", entities=["PHONE_NUMBER"]) # noqa D501
+        >>> print(list(results))
+        [[type: PHONE_NUMBER, start: 19, end: 31, score: 0.85], []]
+        """
+        nlp_artifacts_batch = self.nlp_engine.process_batch(
+            texts, language, batch_size=batch_size, n_process=n_process
+        )
+        for text, nlp_artifacts in nlp_artifacts_batch:
+            yield self.analyze(
+                text=text,
+                language=language,
+                entities=entities,
+                correlation_id=correlation_id,
+                score_threshold=score_threshold,
+                return_decision_process=return_decision_process,
+                ad_hoc_recognizers=ad_hoc_recognizers,
+                nlp_artifacts=nlp_artifacts,
+            )
+
     def __remove_low_scores(
         self, results: List[RecognizerResult], score_threshold: float = None
     ) -> List[RecognizerResult]:
@@ -0,0 +1,284 @@
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Dict, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class DenyListMatcher:
+    """
+    Find the words of a deny list in a text using the Aho-Corasick algorithm.
+
+    Words are matched literally, and only as whole words:
+    a match has to start at the beginning of the text or of a line,
+    or after a space, and end at the end of the text or of a line,
+    or before a space.
+    When several words match at the same position, the one appearing
+    first in the deny list is returned. Matches do not overlap.
+
+    Matching time is linear in the length of the text
+    (plus the number of candidate matches), regardless of the number of words.
+    If the optional pyahocorasick package is installed, it is used
+    instead of the pure Python automaton, which is faster to build
+    and uses less memory for large deny lists.
+
+    :param deny_list: The words to detect. Can be any iterable,
+    e.g. a generator reading the words from a file, and is consumed once.
+    """
+
+    SEPARATORS = (" ", "\n")
+
+    def __init__(self, deny_list: Iterable[str]):
+        self.words: List[str] = []
+        self.__automaton = self.__create_automaton(deny_list, self.words)
+        self.__ignore_case_automaton = None
+
+    def __len__(self):
+        """Return the number of unique words."""
+        return len(self.words)
+
+    def finditer(
+        self, text: str, ignore_case: bool = False
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Find the deny list words in the text.
+
+        :param text: The text to search in
+        :param ignore_case: Whether to match words case insensitively
+        :return: An iterator over the (start, end) indices of the matches
+        """
+        if ignore_case:
+            if self.__ignore_case_automaton is None:
+                self.__ignore_case_automaton = self.__create_automaton(
+                    (self.__lower(word) for word in self.words)
+                )
+            automaton = self.__ignore_case_automaton
+            text = self.__lower(text)
+        else:
+            automaton = self.__automaton
+
+        # Keep the first word in the deny list for each start index,
+        # like a regex alternation of the words would
+        best_matches: Dict[int, int] = {}
+        for start, word_index in automaton.iter_matches(text, self.SEPARATORS):
+            if word_index < best_matches.get(start, word_index + 1):
+                best_matches[start] = word_index
+
+        last_end = 0
+        for start in sorted(best_matches):
+            if start < last_end:
+                continue
+            end = start + automaton.lengths[best_matches[start]]
+            yield start, end
+            last_end = end
+
+    @staticmethod
+    def read_deny_list(file_path: str, encoding: str = "utf-8") -> Iterator[str]:
+        """
+        Read a deny list from a text file with one word per line.
+
+        Empty lines are skipped.
+
+        :param file_path: Path to the deny list file
+        :param encoding: The file's encoding
+        :return: An iterator over the words in the file
+        """
+        with open(file_path, encoding=encoding) as deny_list_file:
+            for line in deny_list_file:
+                word = line.rstrip("\r\n")
+                if word:
+                    yield word
+
+    @staticmethod
+    def __create_automaton(
+        deny_list: Iterable[str], words: Optional[List[str]] = None
+    ) -> "_Automaton":
+        if ahocorasick:
+            return _AhoCorasickAutomaton(deny_list, words)
+        return _Automaton(deny_list, words)
+
+    @staticmethod
+    def __lower(text: str) -> str:
+        """Lower case a text while keeping the indices of its characters."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # Some characters are lower cased into multiple characters
+        return "".join(char if len(char.lower()) > 1 else char.lower() for char in text)
+
+
+class _Automaton:
+    """
+    Pure Python Aho-Corasick automaton over a list of words.
+
+    States are integers, with 0 as the root. Transitions are kept in a single
+    dict keyed by state and character, and per state values in arrays,
+    to keep the memory footprint of large deny lists low.
+
+    :param deny_list: The words to build the automaton from
+    :param words: A list to append the unique words to
+    """
+
+    CHAR_BITS = 21  # enough for all unicode code points
+
+    def __init__(self, deny_list: Iterable[str], words: Optional[List[str]] = None):
+        # length of each word, by its index in the deny list
+        self.lengths: List[int] = []
+
+        self.transitions: Dict[int, int] = {}
+        self.parents = array("q", [0])
+        self.chars = array("l", [0])
+        self.depths = array("l", [0])
+        # index of the word ending at each state, -1 if none
+        self.word_indices = array("q", [-1])
+
+        for word in deny_list:
+            if word and self.__add_word(word) and words is not None:
+                words.append(word)
+
+        self.failures = array("q", bytes(8 * len(self.depths)))
+        # the nearest state on the failure path which ends a word
+        self.outputs = array("q", bytes(8 * len(self.depths)))
+        self.__build_failures()
+
+    def __add_word(self, word: str) -> bool:
+        state = 0
+        for char in word:
+            key = state << self.CHAR_BITS | ord(char)
+            next_state = self.transitions.get(key)
+            if next_state is None:
+                next_state = len(self.depths)
+                self.transitions[key] = next_state
+                self.parents.append(state)
+                self.chars.append(ord(char))
+                self.depths.append(self.depths[state] + 1)
+                self.word_indices.append(-1)
+            state = next_state
+
+        self.lengths.append(len(word))
+        if self.word_indices[state] != -1:
+            # duplicates keep the index of their first occurrence
+            return False
+        self.word_indices[state] = len(self.lengths) - 1
+        return True
+
+    def __build_failures(self):
+        # states in breadth first order, so parents are handled before children
+        states = sorted(range(1, len(self.depths)), key=self.depths.__getitem__)
+        for state in states:
+            parent = self.parents[state]
+            failure = 0
+            if parent != 0:
+                char = self.chars[state]
+                failure = self.failures[parent]
+                while True:
+                    next_state = self.transitions.get(
+                        failure << self.CHAR_BITS | char
+                    )
+                    if next_state is not None:
+                        failure = next_state
+                        break
+                    if failure == 0:
+                        break
+                    failure = self.failures[failure]
+
+            self.failures[state] = failure
+            if self.word_indices[failure] != -1:
+                self.outputs[state] = failure
+            else:
+                self.outputs[state] = self.outputs[failure]
+
+    def iter_matches(
+        self, text: str, separators: Tuple[str, ...]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Find all whole word matches in the text, including overlapping ones.
+
+        :param text: The text to search in
+        :param separators: Characters separating words
+        :return: An iterator over the start index and word index of the matches
+        """
+        transitions = self.transitions
+        failures = self.failures
+        outputs = self.outputs
+        depths = self.depths
+        word_indices = self.word_indices
+        char_bits = self.CHAR_BITS
+        text_length = len(text)
+
+        state = 0
+        for index, char in enumerate(text):
+            code = ord(char)
+            while True:
+                next_state = transitions.get(state << char_bits | code)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if state == 0:
+                    break
+                state = failures[state]
+
+            if state == 0:
+                continue
+            end = index + 1
+            if end != text_length and text[end] not in separators:
+                continue
+
+            match_state = state if word_indices[state] != -1 else outputs[state]
+            while match_state:
+                start = end - depths[match_state]
+                if start == 0 or text[start - 1] in separators:
+                    yield start, word_indices[match_state]
+                match_state = outputs[match_state]
+
+
+class _AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton over a list of words, using pyahocorasick.
+
+    :param deny_list: The words to build the automaton from
+    :param words: A list to append the unique words to
+    """
+
+    def __init__(self, deny_list: Iterable[str], words: Optional[List[str]] = None):
+        # length of each word, by its index in the deny list
+        self.lengths: List[int] = []
+
+        self.automaton = ahocorasick.Automaton()
+        for word in deny_list:
+            if not word:
+                continue
+            self.lengths.append(len(word))
+            if word in self.automaton:
+                # duplicates keep the index of their first occurrence
+                continue
+            self.automaton.add_word(word, len(self.lengths) - 1)
+            if words is not None:
+                words.append(word)
+
+        if self.lengths:
+            self.automaton.make_automaton()
+
+    def iter_matches(
+        self, text: str, separators: Tuple[str, ...]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Find all whole word matches in the text, including overlapping ones.
+
+        :param text: The text to search in
+        :param separators: Characters separating words
+        :return: An iterator over the start index and word index of the matches
+        """
+        if not self.lengths:
+            return
+
+        text_length = len(text)
+        for end_index, word_index in self.automaton.iter(text):
+            end = end_index + 1
+            if end != text_length and text[end] not in separators:
+                continue
+            start = end - self.lengths[word_index]
+            if start == 0 or text[start - 1] in separators:
+                yield start, word_index
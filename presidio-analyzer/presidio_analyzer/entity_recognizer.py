@@ -1,6 +1,7 @@
 import copy
 import logging
 from abc import abstractmethod
+from bisect import bisect_left, bisect_right
 from typing import List, Dict
 
 from presidio_analyzer import RecognizerResult
@@ -149,42 +150,49 @@ class EntityRecognizer:
         :param recognizer_context_words: The words the current recognizer
                                          supports (words to lookup)
         """
-        # create a deep copy of the results object so we can manipulate it
-        results = copy.deepcopy(raw_results)
-
         # Sanity
         if nlp_artifacts is None:
             logger.warning("[%s]. NLP artifacts were not provided", self.name)
-            return results
+            return list(raw_results)
         if recognizer_context_words is None or recognizer_context_words == []:
             logger.info(
                 "recognizer '%s' does not support context " "enhancement", self.name
             )
-            return results
+            return list(raw_results)
 
-        for result in results:
+        results = []
+        for raw_result in raw_results:
             # extract lemmatized context from the surrounding of the match
 
-            word = text[result.start : result.end]
+            word = text[raw_result.start : raw_result.end]
 
             surrounding_words = self.__extract_surrounding_words(
-                nlp_artifacts=nlp_artifacts, word=word, start=result.start
+                nlp_artifacts=nlp_artifacts, word=word, start=raw_result.start
             )
 
             supportive_context_word = self.__find_supportive_word_in_context(
                 surrounding_words, recognizer_context_words
             )
-            if supportive_context_word != "":
-                result.score += self.CONTEXT_SIMILARITY_FACTOR
-                result.score = max(result.score, self.MIN_SCORE_WITH_CONTEXT_SIMILARITY)
-                result.score = min(result.score, EntityRecognizer.MAX_SCORE)
-
-                # Update the explainability object with context information
-                # helped improving the score
-                result.analysis_explanation.set_supportive_context_word(
-                    supportive_context_word
-                )
-                result.analysis_explanation.set_improved_score(result.score)
+            if supportive_context_word == "":
+                results.append(raw_result)
+                continue
+
+            # copy only the results whose score changes,
+            # so the raw results are not modified
+            result = copy.copy(raw_result)
+            result.analysis_explanation = copy.copy(raw_result.analysis_explanation)
+
+            result.score += self.CONTEXT_SIMILARITY_FACTOR
+            result.score = max(result.score, self.MIN_SCORE_WITH_CONTEXT_SIMILARITY)
+            result.score = min(result.score, EntityRecognizer.MAX_SCORE)
+
+            # Update the explainability object with context information
+            # helped improving the score
+            result.analysis_explanation.set_supportive_context_word(
+                supportive_context_word
+            )
+            result.analysis_explanation.set_improved_score(result.score)
+            results.append(result)
         return results
 
     @staticmethod
@@ -231,96 +239,35 @@ class EntityRecognizer:
         return word
 
     @staticmethod
-    def __add_n_words(
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-        is_backward: bool,
+    def __get_context_words(
+        token_index: int, nlp_artifacts: NlpArtifacts
     ) -> List[str]:
         """
-        Prepare a string of context words.
-
-        Return a list of words which surrounds a lemma at a given index.
-        The words will be collected only if exist in the filtered array
-
-        :param index: index of the lemma that its surrounding words we want
-        :param n_words: number of words to take
-        :param lemmas: array of lemmas
-        :param lemmatized_filtered_keywords: the array of filtered
-               lemmas from the original sentence,
-        :param is_backward: if true take the preceeding words, if false,
-                            take the successing words
+        Return the keywords surrounding the token at a given index.
+
+        Takes the CONTEXT_PREFIX_COUNT keywords before the token
+        and the CONTEXT_SUFFIX_COUNT keywords after it.
+        The token itself is of no interest to us...however we want to
+        consider it anyway for cases were it is attached with no spaces
+        to an interesting context word, so we allow it and add 1 to
+        the number of collected words in each direction.
+
+        :param token_index: index of the token that its surrounding words we want
+        :param nlp_artifacts: nlp artifacts of the text
+        :return: The lower cased keyword lemmas
         """
-        i = index
-        context_words = []
-        # The entity itself is no interest to us...however we want to
-        # consider it anyway for cases were it is attached with no spaces
-        # to an interesting context word, so we allow it and add 1 to
-        # the number of collected words
-
-        # collect at most n words (in lower case)
-        remaining = n_words + 1
-        while 0 <= i < len(lemmas) and remaining > 0:
-            lower_lemma = lemmas[i].lower()
-            if lower_lemma in lemmatized_filtered_keywords:
-                context_words.append(lower_lemma)
-                remaining -= 1
-            i = i - 1 if is_backward else i + 1
-        return context_words
-
-    def __add_n_words_forward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self.__add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, False
-        )
+        keyword_indices = nlp_artifacts.get_keyword_indices()
 
-    def __add_n_words_backward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self.__add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, True
+        backward_end = bisect_right(keyword_indices, token_index)
+        backward_start = max(
+            0, backward_end - (EntityRecognizer.CONTEXT_PREFIX_COUNT + 1)
         )
+        forward_start = bisect_left(keyword_indices, token_index)
+        forward_end = forward_start + EntityRecognizer.CONTEXT_SUFFIX_COUNT + 1
 
-    @staticmethod
-    def _find_index_of_match_token(
-        word: str, start: int, tokens, tokens_indices: List[int]  # noqa ANN001
-    ) -> int:
-        found = False
-        # we use the known start index of the original word to find the actual
-        # token at that index, we are not checking for equivilance since the
-        # token might be just a substring of that word (e.g. for phone number
-        # 555-124564 the first token might be just '555' or for a match like '
-        # rocket' the actual token will just be 'rocket' hence the misalignment
-        # of indices)
-        # Note: we are iterating over the original tokens (not the lemmatized)
-        i = -1
-        for i, token in enumerate(tokens, 0):
-            # Either we found a token with the exact location, or
-            # we take a token which its characters indices covers
-            # the index we are looking for.
-            if (tokens_indices[i] == start) or (start < tokens_indices[i] + len(token)):
-                # found the interesting token, the one that around it
-                # we take n words, we save the matching lemma
-                found = True
-                break
-
-        if not found:
-            raise ValueError(
-                "Did not find word '" + word + "' "
-                "in the list of tokens although it "
-                "is expected to be found"
-            )
-        return i
+        context_indices = keyword_indices[backward_start:backward_end]
+        context_indices.extend(keyword_indices[forward_start:forward_end])
+        return [nlp_artifacts.lemmas[i].lower() for i in context_indices]
 
     def __extract_surrounding_words(
         self, nlp_artifacts: NlpArtifacts, word: str, start: int
@@ -343,36 +290,20 @@ class EntityRecognizer:
             # context
             return [""]
 
-        # Get the already prepared words in the given text, in their
-        # LEMMATIZED version
-        lemmatized_keywords = nlp_artifacts.keywords
-
         # since the list of tokens is not necessarily aligned
         # with the actual index of the match, we look for the
         # token index which corresponds to the match
-        token_index = EntityRecognizer._find_index_of_match_token(
-            word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices
-        )
+        token_index = nlp_artifacts.get_token_index(start)
+        if token_index is None:
+            raise ValueError(
+                "Did not find word '" + word + "' "
+                "in the list of tokens although it "
+                "is expected to be found"
+            )
 
         # index i belongs to the PII entity, take the preceding n words
         # and the successing m words into a context list
-
-        backward_context = self.__add_n_words_backward(
-            token_index,
-            EntityRecognizer.CONTEXT_PREFIX_COUNT,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-        forward_context = self.__add_n_words_forward(
-            token_index,
-            EntityRecognizer.CONTEXT_SUFFIX_COUNT,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-
-        context_list = []
-        context_list.extend(backward_context)
-        context_list.extend(forward_context)
+        context_list = self.__get_context_words(token_index, nlp_artifacts)
         context_list = list(set(context_list))
         logger.debug("Context list is: %s", " ".join(context_list))
         return context_list
@@ -387,26 +318,60 @@ class EntityRecognizer:
         :param results: List[RecognizerResult]
         :return: List[RecognizerResult]
         """
-        results = list(set(results))
+        results = list(dict.fromkeys(results))
         results = sorted(results, key=lambda x: (-x.score, x.start, -(x.end - x.start)))
-        filtered_results = []
 
+        # Results are kept in descending score order, so a result is removed
+        # if it is contained in a previously kept result of the same type
+        starts: Dict[str, List[int]] = {}
+        for result in results:
+            starts.setdefault(result.entity_type, []).append(result.start)
+        kept_per_type = {
+            entity_type: _ContainmentIndex(entity_starts)
+            for entity_type, entity_starts in starts.items()
+        }
+
+        filtered_results = []
         for result in results:
             if result.score == 0:
                 continue
 
-            to_keep = result not in filtered_results  # equals based comparison
-            if to_keep:
-                for filtered in filtered_results:
-                    # If result is contained in one of the other results
-                    if (
-                        result.contained_in(filtered)
-                        and result.entity_type == filtered.entity_type
-                    ):
-                        to_keep = False
-                        break
-
-            if to_keep:
+            kept = kept_per_type[result.entity_type]
+            if not kept.contains(result.start, result.end):
+                kept.add(result.start, result.end)
                 filtered_results.append(result)
 
         return filtered_results
+
+
+class _ContainmentIndex:
+    """
+    Index of intervals, for checking whether an interval is contained in any of them.
+
+    A Fenwick tree over the possible interval starts holds the maximal end
+    of the intervals starting at or before each start, so both adding an interval
+    and checking for containment take O(log n).
+
+    :param starts: All the starts of the intervals which will be added or checked
+    """
+
+    def __init__(self, starts: List[int]):
+        self.starts = sorted(set(starts))
+        self.max_ends = [-1] * (len(self.starts) + 1)
+
+    def add(self, start: int, end: int) -> None:
+        """Add an interval to the index."""
+        i = bisect_left(self.starts, start) + 1
+        while i < len(self.max_ends):
+            if self.max_ends[i] < end:
+                self.max_ends[i] = end
+            i += i & -i
+
+    def contains(self, start: int, end: int) -> bool:
+        """Return true if the interval is contained in one of the added intervals."""
+        i = bisect_right(self.starts, start)
+        while i > 0:
+            if self.max_ends[i] >= end:
+                return True
+            i -= i & -i
+        return False
@@ -1,6 +1,8 @@
 import json
-from typing import List
+from bisect import bisect_right
+from typing import List, Optional
 
+from spacy.attrs import LEMMA, IDX
 from spacy.tokens import Doc, Span
 
 
@@ -16,16 +18,101 @@ class NlpArtifacts:
         self,
         entities: List[Span],
         tokens: Doc,
-        tokens_indices: List[int],
-        lemmas: List[str],
+        tokens_indices: Optional[List[int]],
+        lemmas: Optional[List[str]],
         nlp_engine,  # noqa ANN001
         language: str,
     ):
         self.entities = entities
         self.tokens = tokens
-        self.lemmas = lemmas
-        self.tokens_indices = tokens_indices
-        self.keywords = self.set_keywords(nlp_engine, lemmas, language)
+
+        # lemmas, tokens indices and keywords are computed on first access.
+        # If not provided, lemmas and tokens indices are read from the spaCy Doc
+        self._lemmas = lemmas
+        self._tokens_indices = tokens_indices
+        self._keywords = None
+        self._nlp_engine = nlp_engine
+        self._language = language
+
+        # Lookup structures for context enhancement, computed on first use
+        self._token_ends: Optional[List[int]] = None
+        self._keyword_indices: Optional[List[int]] = None
+
+    @property
+    def lemmas(self) -> List[str]:
+        """Return the lemma of each token."""
+        if self._lemmas is None:
+            self.__read_doc_arrays()
+        return self._lemmas
+
+    @lemmas.setter
+    def lemmas(self, lemmas: List[str]) -> None:
+        self._lemmas = lemmas
+
+    @property
+    def tokens_indices(self) -> List[int]:
+        """Return the character offset of each token in the text."""
+        if self._tokens_indices is None:
+            self.__read_doc_arrays()
+        return self._tokens_indices
+
+    @tokens_indices.setter
+    def tokens_indices(self, tokens_indices: List[int]) -> None:
+        self._tokens_indices = tokens_indices
+
+    @property
+    def keywords(self) -> List[str]:
+        """Return the lemmas which can be used as context words."""
+        if self._keywords is None:
+            self._keywords = self.set_keywords(
+                self._nlp_engine, self.lemmas, self._language
+            )
+        return self._keywords
+
+    @keywords.setter
+    def keywords(self, keywords: List[str]) -> None:
+        self._keywords = keywords
+
+    def __read_doc_arrays(self) -> None:
+        """Read the lemmas and tokens indices from the Doc in a single pass."""
+        array = self.tokens.to_array([LEMMA, IDX])
+        if self._lemmas is None:
+            strings = self.tokens.vocab.strings
+            self._lemmas = [strings[lemma] for lemma in array[:, 0].tolist()]
+        if self._tokens_indices is None:
+            self._tokens_indices = array[:, 1].tolist()
+
+    def get_token_index(self, start: int) -> Optional[int]:
+        """
+        Return the index of the token covering or following a character index.
+
+        This is the first token which ends after the given index.
+
+        :param start: A character index in the text
+        :return: The token index, or None if all tokens end before the index
+        """
+        if self._token_ends is None:
+            self._token_ends = [
+                index + len(token)
+                for index, token in zip(self.tokens_indices, self.tokens)
+            ]
+        token_index = bisect_right(self._token_ends, start)
+        if token_index == len(self._token_ends):
+            return None
+        return token_index
+
+    def get_keyword_indices(self) -> List[int]:
+        """
+        Return the indices of the tokens whose lemma is a keyword, in order.
+
+        :return: A sorted list of token indices
+        """
+        if self._keyword_indices is None:
+            keywords = set(self.keywords)
+            self._keyword_indices = [
+                i for i, lemma in enumerate(self.lemmas) if lemma.lower() in keywords
+            ]
+        return self._keyword_indices
 
     @staticmethod
     def set_keywords(
@@ -38,33 +125,37 @@ class NlpArtifacts:
         """
         if not nlp_engine:
             return []
-        keywords = [
-            k.lower()
-            for k in lemmas
-            if not nlp_engine.is_stopword(k, language)
-            and not nlp_engine.is_punct(k, language)
-            and k != "-PRON-"
-            and k != "be"
-        ]
-
-        # best effort, try even further to break tokens into sub tokens,
-        # this can result in reducing false negatives
-        keywords = [i.split(":") for i in keywords]
-
-        # splitting the list can, if happened, will result in list of lists,
-        # we flatten the list
-        keywords = [item for sublist in keywords for item in sublist]
+
+        # stopword and punctuation checks are done once per distinct lemma
+        is_keyword = {}
+        keywords = []
+        for k in lemmas:
+            keyword = is_keyword.get(k)
+            if keyword is None:
+                keyword = (
+                    not nlp_engine.is_stopword(k, language)
+                    and not nlp_engine.is_punct(k, language)
+                    and k != "-PRON-"
+                    and k != "be"
+                )
+                is_keyword[k] = keyword
+            if keyword:
+                # best effort, try even further to break tokens into sub tokens,
+                # this can result in reducing false negatives
+                keywords.extend(k.lower().split(":"))
+
         return keywords
 
     def to_json(self) -> str:
         """Convert nlp artifacts to json."""
 
-        return_dict = self.__dict__.copy()
-
         # Converting spaCy tokens and spans to string as they are not serializable
-        if "tokens" in return_dict:
-            return_dict["tokens"] = [token.text for token in self.tokens]
-        if "entities" in return_dict:
-            return_dict["entities"] = [entity.text for entity in self.entities]
+        return_dict = {
+            "entities": [entity.text for entity in self.entities],
+            "tokens": [token.text for token in self.tokens],
+            "lemmas": self.lemmas,
+            "tokens_indices": self.tokens_indices,
+            "keywords": self.keywords,
+        }
 
         return json.dumps(return_dict)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional, Tuple
 
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
@@ -15,6 +16,29 @@ class NlpEngine(ABC):
     def process_text(self, text: str, language: str) -> NlpArtifacts:
         """Execute the NLP pipeline on the given text and language."""
 
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """
+        Execute the NLP pipeline on a batch of texts.
+
+        The default implementation calls process_text on each text.
+        Engines which support batched processing should override it.
+
+        :param texts: An iterable of texts to process
+        :param language: The language of the texts
+        :param batch_size: Number of texts to buffer per batch
+        :param n_process: Number of processes to use
+        :return: A generator of (text, NlpArtifacts) tuples,
+        in the same order as the input texts
+        """
+        for text in texts:
+            yield text, self.process_text(text, language)
+
     @abstractmethod
     def is_stopword(self, word: str, language: str) -> bool:
         """
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Iterator, Tuple
 
 import spacy
 from spacy.language import Language
@@ -43,6 +43,30 @@ class SpacyNlpEngine(NlpEngine):
         doc = self.nlp[language](text)
         return self._doc_to_nlp_artifact(doc, language)
 
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """
+        Execute the SpaCy NLP pipeline on a batch of texts using nlp.pipe.
+
+        :param texts: An iterable of texts to process
+        :param language: The language of the texts
+        :param batch_size: Number of texts to buffer per batch
+        (spaCy's default is used if None)
+        :param n_process: Number of processes to use
+        :return: A generator of (text, NlpArtifacts) tuples,
+        in the same order as the input texts
+        """
+        docs = self.nlp[language].pipe(
+            texts, batch_size=batch_size, n_process=n_process
+        )
+        for doc in docs:
+            yield doc.text, self._doc_to_nlp_artifact(doc, language)
+
     def is_stopword(self, word: str, language: str) -> bool:
         """
         Return true if the given word is a stop word.
@@ -69,14 +93,13 @@ class SpacyNlpEngine(NlpEngine):
         return self.nlp[language]
 
     def _doc_to_nlp_artifact(self, doc: Doc, language: str) -> NlpArtifacts:
-        lemmas = [token.lemma_ for token in doc]
-        tokens_indices = [token.idx for token in doc]
         entities = doc.ents
+        # lemmas and tokens indices are read lazily from the doc
         return NlpArtifacts(
             entities=entities,
             tokens=doc,
-            tokens_indices=tokens_indices,
-            lemmas=lemmas,
+            tokens_indices=None,
+            lemmas=None,
             nlp_engine=self,
             language=language,
         )
@@ -1,6 +1,26 @@
 import json
+from functools import lru_cache
 from typing import Dict
 
+import regex as re
+
+REGEX_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_regex(regex: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regex and cache the compiled object.
+
+    The cache is shared across all patterns and recognizers,
+    and is bounded so that ad-hoc patterns do not grow it indefinitely.
+
+    :param regex: the regex pattern to compile
+    :param flags: regex flags
+    :return: the compiled regex
+    """
+    return re.compile(regex, flags=flags)
+
 
 class Pattern:
     """
@@ -17,6 +37,31 @@ class Pattern:
         self.regex = regex
         self.score = score
 
+    @property
+    def regex(self) -> str:
+        """Return the regex pattern string."""
+        return self._regex
+
+    @regex.setter
+    def regex(self, regex: str) -> None:
+        self._regex = regex
+        self._compiled_regex = {}
+
+    def compiled_regex(self, flags: int = 0) -> re.Pattern:
+        """
+        Return the compiled regex for the given flags.
+
+        The regex is compiled lazily, on first use with a given set of flags.
+
+        :param flags: regex flags
+        :return: the compiled regex
+        """
+        compiled = self._compiled_regex.get(flags)
+        if compiled is None:
+            compiled = compile_regex(self.regex, flags)
+            self._compiled_regex[flags] = compiled
+        return compiled
+
     def to_dict(self) -> Dict:
         """
         Turn this instance into a dictionary.
@@ -1,6 +1,6 @@
 import datetime
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable
 
 import regex as re
 
@@ -11,6 +11,7 @@ from presidio_analyzer import (
     EntityRecognizer,
     AnalysisExplanation,
 )
+from presidio_analyzer.deny_list_matcher import DenyListMatcher
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -22,17 +23,23 @@ class PatternRecognizer(LocalRecognizer):
 
     :param patterns: A list of patterns to detect
     :param deny_list: A list of words to detect,
-    in case our recognizer uses a predefined list of words (deny list)
+    in case our recognizer uses a predefined list of words (deny list).
+    Any iterable of words can be used, e.g. `DenyListMatcher.read_deny_list`
+    for reading a large deny list from a file
     :param context: list of context words
     """
 
+    # The regex reported in the explanation of a deny list match,
+    # matching the found word as a whole word (as the deny list matcher does)
+    DENY_LIST_REGEX = r"(?:^|(?<= ))({})(?:(?= )|$)"
+
     def __init__(
         self,
         supported_entity: str,
         name: str = None,
         supported_language: str = "en",
         patterns: List[Pattern] = None,
-        deny_list: List[str] = None,
+        deny_list: Iterable[str] = None,
         context: List[str] = None,
         version: str = "0.0.1",
     ):
@@ -58,12 +65,19 @@ class PatternRecognizer(LocalRecognizer):
             self.patterns = patterns
         self.context = context
 
-        if deny_list:
-            deny_list_pattern = self.__deny_list_to_regex(deny_list)
-            self.patterns.append(deny_list_pattern)
-            self.deny_list = deny_list
-        else:
-            self.deny_list = []
+        self.deny_list = deny_list
+
+    @property
+    def deny_list(self) -> List[str]:
+        """Return the words in the deny list."""
+        if self.deny_list_matcher is None:
+            return []
+        return self.deny_list_matcher.words
+
+    @deny_list.setter
+    def deny_list(self, deny_list: Optional[Iterable[str]]) -> None:
+        # The words are only kept by the matcher, not copied
+        self.deny_list_matcher = DenyListMatcher(deny_list) if deny_list else None
 
     def load(self):  # noqa D102
         pass
@@ -86,7 +100,7 @@ class PatternRecognizer(LocalRecognizer):
         """
         results = []
 
-        if self.patterns:
+        if self.patterns or self.deny_list_matcher:
             pattern_result = self.__analyze_patterns(text, regex_flags)
 
             if pattern_result and self.context:
@@ -101,19 +115,6 @@ class PatternRecognizer(LocalRecognizer):
 
         return results
 
-    @staticmethod
-    def __deny_list_to_regex(deny_list: List[str]) -> Pattern:
-        """
-        Convert a list of word to a matching regex.
-
-        To be analyzed by the regex engine as a part of the analyze logic.
-
-        :param deny_list: the list of words to detect
-        :return:the regex of the words for detection
-        """
-        regex = r"(?:^|(?<= ))(" + "|".join(deny_list) + r")(?:(?= )|$)"
-        return Pattern(name="deny_list", regex=regex, score=1.0)
-
     def validate_result(self, pattern_text: str) -> Optional[bool]:
         """
         Validate the pattern logic e.g., by running checksum on a detected pattern.
@@ -179,7 +180,7 @@ class PatternRecognizer(LocalRecognizer):
         results = []
         for pattern in self.patterns:
             match_start_time = datetime.datetime.now()
-            matches = re.finditer(pattern.regex, text, flags=flags)
+            matches = pattern.compiled_regex(flags).finditer(text)
             match_time = datetime.datetime.now() - match_start_time
             logger.debug(
                 "--- match_time[%s]: %s.%s seconds",
@@ -190,38 +191,90 @@ class PatternRecognizer(LocalRecognizer):
 
             for match in matches:
                 start, end = match.span()
-                current_match = text[start:end]
-
-                # Skip empty results
-                if current_match == "":
-                    continue
+                pattern_result = self.build_pattern_result(text, pattern, start, end)
+                if pattern_result:
+                    results.append(pattern_result)
 
-                score = pattern.score
+        results.extend(self.analyze_deny_list(text, flags))
 
-                validation_result = self.validate_result(current_match)
-                description = self.build_regex_explanation(
-                    self.name, pattern.name, pattern.regex, score, validation_result
-                )
-                pattern_result = RecognizerResult(
-                    self.supported_entities[0], start, end, score, description
-                )
+        results = EntityRecognizer.remove_duplicates(results)
+        return results
 
-                if validation_result is not None:
-                    if validation_result:
-                        pattern_result.score = EntityRecognizer.MAX_SCORE
-                    else:
-                        pattern_result.score = EntityRecognizer.MIN_SCORE
+    def analyze_deny_list(
+        self, text: str, flags: int = None
+    ) -> List[RecognizerResult]:
+        """
+        Find the words in the provided deny-list.
 
-                invalidation_result = self.invalidate_result(current_match)
-                if invalidation_result is not None and invalidation_result:
-                    pattern_result.score = EntityRecognizer.MIN_SCORE
+        Words are matched as whole words, separated by spaces or new lines.
 
-                if pattern_result.score > EntityRecognizer.MIN_SCORE:
-                    results.append(pattern_result)
+        :param text: text to analyze
+        :param flags: regex flags, only IGNORECASE is used
+        :return: A list of RecognizerResult
+        """
+        if not self.deny_list_matcher:
+            return []
 
-        results = EntityRecognizer.remove_duplicates(results)
+        ignore_case = bool(flags and flags & re.IGNORECASE)
+        results = []
+        for start, end in self.deny_list_matcher.finditer(text, ignore_case):
+            deny_list_pattern = Pattern(
+                name="deny_list",
+                regex=self.DENY_LIST_REGEX.format(re.escape(text[start:end])),
+                score=1.0,
+            )
+            pattern_result = self.build_pattern_result(
+                text, deny_list_pattern, start, end
+            )
+            if pattern_result:
+                results.append(pattern_result)
         return results
 
+    def build_pattern_result(
+        self, text: str, pattern: Pattern, start: int, end: int
+    ) -> Optional[RecognizerResult]:
+        """
+        Create a result from a match of one of this recognizer's patterns.
+
+        Runs the validation and invalidation logic on the matched text.
+
+        :param text: text the pattern was matched on
+        :param pattern: the matching pattern
+        :param start: start index of the match
+        :param end: end index of the match
+        :return: A RecognizerResult, or None if the match is empty
+        or its score is zero
+        """
+        current_match = text[start:end]
+
+        # Skip empty results
+        if current_match == "":
+            return None
+
+        score = pattern.score
+
+        validation_result = self.validate_result(current_match)
+        description = self.build_regex_explanation(
+            self.name, pattern.name, pattern.regex, score, validation_result
+        )
+        pattern_result = RecognizerResult(
+            self.supported_entities[0], start, end, score, description
+        )
+
+        if validation_result is not None:
+            if validation_result:
+                pattern_result.score = EntityRecognizer.MAX_SCORE
+            else:
+                pattern_result.score = EntityRecognizer.MIN_SCORE
+
+        invalidation_result = self.invalidate_result(current_match)
+        if invalidation_result is not None and invalidation_result:
+            pattern_result.score = EntityRecognizer.MIN_SCORE
+
+        if pattern_result.score > EntityRecognizer.MIN_SCORE:
+            return pattern_result
+        return None
+
     def to_dict(self) -> Dict:
         """Serialize instance into a dictionary."""
         return_dict = super().to_dict()
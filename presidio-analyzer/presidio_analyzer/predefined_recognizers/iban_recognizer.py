@@ -11,6 +11,7 @@ from presidio_analyzer import (
     EntityRecognizer,
 )
 from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.pattern import compile_regex
 from presidio_analyzer.predefined_recognizers.iban_patterns import (
     regex_per_country,
     BOS,
@@ -135,7 +136,7 @@ class IbanRecognizer(PatternRecognizer):
         """
         results = []
         for pattern in self.patterns:
-            matches = re.finditer(pattern.regex, text, flags=self.flags)
+            matches = pattern.compiled_regex(self.flags).finditer(text)
 
             for match in matches:
                 for grp_num in reversed(range(1, len(match.groups()) + 1)):
@@ -194,7 +195,7 @@ class IbanRecognizer(PatternRecognizer):
             country_regex = regex_per_country.get(country_code, "")
             if bos_eos and country_regex:
                 country_regex = bos_eos[0] + country_regex + bos_eos[1]
-            return country_regex and re.match(country_regex, iban, flags=flags)
+            return country_regex and compile_regex(country_regex, flags).match(iban)
 
         return False
 
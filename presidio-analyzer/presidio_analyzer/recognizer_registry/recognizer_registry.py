@@ -1,6 +1,5 @@
-import copy
 import logging
-from typing import Optional, List, Iterable, Union, Type
+from typing import Optional, List, Iterable, Union, Type, Dict, Tuple
 
 from presidio_analyzer import EntityRecognizer
 from presidio_analyzer.nlp_engine import NlpEngine, SpacyNlpEngine, StanzaNlpEngine
@@ -33,6 +32,9 @@ class RecognizerRegistry:
     """
     Detect, register and hold all recognizers to be used by the analyzer.
 
+    Recognizers are indexed by language and entity on first use.
+    The index is rebuilt after recognizers are added or removed.
+
     :param recognizers: An optional list of recognizers,
     that will be available instead of the predefined recognizers
     """
@@ -44,6 +46,16 @@ class RecognizerRegistry:
         else:
             self.recognizers = []
 
+    @property
+    def recognizers(self) -> List[EntityRecognizer]:
+        """Return the list of registered recognizers."""
+        return self._recognizers
+
+    @recognizers.setter
+    def recognizers(self, recognizers: List[EntityRecognizer]) -> None:
+        self._recognizers = recognizers
+        self._invalidate_index()
+
     def load_predefined_recognizers(
         self, languages: Optional[List[str]] = None, nlp_engine: NlpEngine = None
     ) -> None:
@@ -90,6 +102,8 @@ class RecognizerRegistry:
             ]
             self.recognizers.extend(all_recognizers)
 
+        self._invalidate_index()
+
     @staticmethod
     def _get_nlp_recognizer(
         nlp_engine: NlpEngine,
@@ -123,7 +137,7 @@ class RecognizerRegistry:
         :param ad_hoc_recognizers: Additional recognizers provided by the user
         as part of the request
         :return: A list of the recognizers which supports the supplied entities
-        and language
+        and language. The list may be cached and should not be modified
         """
         if language is None:
             raise ValueError("No language provided")
@@ -131,26 +145,27 @@ class RecognizerRegistry:
         if entities is None and all_fields is False:
             raise ValueError("No entities provided")
 
-        all_possible_recognizers = copy.copy(self.recognizers)
-        if ad_hoc_recognizers:
-            all_possible_recognizers.extend(ad_hoc_recognizers)
+        language_index, entity_index = self.__get_index()
 
-        # filter out unwanted recognizers
-        to_return = set()
         if all_fields:
-            to_return = [
-                rec
-                for rec in all_possible_recognizers
-                if language == rec.supported_language
-            ]
-        else:
-            for entity in entities:
-                subset = [
+            to_return = language_index.get(language, [])
+            if ad_hoc_recognizers:
+                to_return = to_return + [
                     rec
-                    for rec in all_possible_recognizers
-                    if entity in rec.supported_entities
-                    and language == rec.supported_language
+                    for rec in ad_hoc_recognizers
+                    if language == rec.supported_language
                 ]
+        else:
+            to_return = []
+            for entity in entities:
+                subset = entity_index.get((language, entity), [])
+                if ad_hoc_recognizers:
+                    subset = subset + [
+                        rec
+                        for rec in ad_hoc_recognizers
+                        if entity in rec.supported_entities
+                        and language == rec.supported_language
+                    ]
 
                 if not subset:
                     logger.warning(
@@ -159,8 +174,13 @@ class RecognizerRegistry:
                         entity,
                         language,
                     )
+                elif not to_return:
+                    to_return = subset
                 else:
-                    to_return.update(set(subset))
+                    # recognizers supporting multiple entities are returned once
+                    to_return = to_return + [
+                        rec for rec in subset if rec not in to_return
+                    ]
 
         logger.debug(
             "Returning a total of %s recognizers",
@@ -170,7 +190,17 @@ class RecognizerRegistry:
         if not to_return:
             raise ValueError("No matching recognizers were found to serve the request.")
 
-        return list(to_return)
+        return to_return
+
+    def get_supported_entities(self, language: str) -> List[str]:
+        """
+        Return the entities supported by the registry's recognizers of a language.
+
+        :param language: the requested language
+        :return: List of entity names. The list is cached and should not be modified
+        """
+        self.__get_index()
+        return self._supported_entities.get(language, [])
 
     def add_recognizer(self, recognizer: EntityRecognizer) -> None:
         """
@@ -182,6 +212,7 @@ class RecognizerRegistry:
             raise ValueError("Input is not of type EntityRecognizer")
 
         self.recognizers.append(recognizer)
+        self._invalidate_index()
 
     def remove_recognizer(self, recognizer_name: str) -> None:
         """
@@ -198,3 +229,44 @@ class RecognizerRegistry:
             recognizer_name,
         )
         self.recognizers = new_recognizers
+
+    def _invalidate_index(self) -> None:
+        """Clear the recognizers index, to be rebuilt on next use."""
+        self._language_index = None
+        self._entity_index = None
+        self._supported_entities = None
+        self._indexed_count = 0
+
+    def __get_index(
+        self,
+    ) -> Tuple[
+        Dict[str, List[EntityRecognizer]], Dict[Tuple[str, str], List[EntityRecognizer]]
+    ]:
+        if self._language_index is None or self.__is_index_outdated():
+            self.__build_index()
+        return self._language_index, self._entity_index
+
+    def __is_index_outdated(self) -> bool:
+        # Recognizers added directly to the list, without add_recognizer
+        return self._indexed_count != len(self.recognizers)
+
+    def __build_index(self) -> None:
+        """Index the recognizers by language and by (language, entity)."""
+        language_index = {}
+        entity_index = {}
+        supported_entities = {}
+        for rec in self.recognizers:
+            language = rec.supported_language
+            language_index.setdefault(language, []).append(rec)
+            language_entities = supported_entities.setdefault(language, [])
+            for entity in rec.supported_entities:
+                recognizers = entity_index.setdefault((language, entity), [])
+                if not recognizers or recognizers[-1] is not rec:
+                    recognizers.append(rec)
+                if entity not in language_entities:
+                    language_entities.append(entity)
+
+        self._language_index = language_index
+        self._entity_index = entity_index
+        self._supported_entities = supported_entities
+        self._indexed_count = len(self.recognizers)
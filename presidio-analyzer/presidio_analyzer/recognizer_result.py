@@ -2,6 +2,7 @@ import logging
 from typing import Dict
 
 from presidio_analyzer import AnalysisExplanation
+from presidio_analyzer.json_encoder import encode_json_value
 
 
 class RecognizerResult:
@@ -46,7 +47,34 @@ class RecognizerResult:
 
         :return: a dictionary
         """
-        return self.__dict__
+        return {
+            "entity_type": self.entity_type,
+            "start": self.start,
+            "end": self.end,
+            "score": self.score,
+            "analysis_explanation": self.analysis_explanation,
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize self to a JSON string, with sorted keys.
+
+        The output is identical to json.dumps(self, default=lambda o: o.to_dict(),
+        sort_keys=True), without creating intermediate dictionaries.
+
+        :return: a JSON string
+        """
+        if self.analysis_explanation is None:
+            analysis_explanation = "null"
+        else:
+            analysis_explanation = self.analysis_explanation.to_json()
+        return (
+            f'{{"analysis_explanation": {analysis_explanation}, '
+            f'"end": {encode_json_value(self.end)}, '
+            f'"entity_type": {encode_json_value(self.entity_type)}, '
+            f'"score": {encode_json_value(self.score)}, '
+            f'"start": {encode_json_value(self.start)}}}'
+        )
 
     @classmethod
     def from_json(cls, data: Dict) -> "RecognizerResult":
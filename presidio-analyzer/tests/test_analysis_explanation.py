@@ -0,0 +1,31 @@
+import json
+
+from presidio_analyzer import AnalysisExplanation
+
+
+def create_analysis_explanation():
+    explanation = AnalysisExplanation(
+        recognizer="Résumé recognizer",
+        original_score=0.5,
+        pattern_name="résumé pattern",
+        pattern=r"\d+ \"😈\"",
+        validation_result=True,
+        textual_explanation="explanation",
+    )
+    explanation.set_improved_score(0.85)
+    explanation.set_supportive_context_word("résumé")
+    explanation.append_textual_explanation_line("another line")
+    return explanation
+
+
+def test_given_analysis_explanation_then_to_dict_contains_all_fields():
+    explanation = create_analysis_explanation()
+
+    assert explanation.to_dict() == vars(explanation)
+
+
+def test_given_analysis_explanation_then_to_json_is_identical_to_dumping_to_dict():
+    explanation = create_analysis_explanation()
+
+    expected = json.dumps(explanation.to_dict(), sort_keys=True)
+    assert explanation.to_json() == expected
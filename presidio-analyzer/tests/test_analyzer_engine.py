@@ -229,6 +229,56 @@ def test_when_removed_pattern_recognizer_then_doesnt_work(unit_test_guid):
     assert len(results) == 0
 
 
+def test_when_patterns_changed_after_analyze_then_new_patterns_are_used(
+    unit_test_guid,
+):
+    pattern_recognizer = PatternRecognizer(
+        "ROCKET",
+        name="Rocket recognizer",
+        patterns=[Pattern("rocket pattern", r"\W*(rocket)\W*", 0.8)],
+    )
+    mock_recognizer_registry = RecognizerRegistryMock()
+    mock_recognizer_registry.add_recognizer(pattern_recognizer)
+    analyze_engine = AnalyzerEngine(
+        registry=mock_recognizer_registry,
+        nlp_engine=NlpEngineMock(),
+    )
+    text = "rocket or shuttle"
+
+    def analyze():
+        return analyze_engine.analyze(
+            correlation_id=unit_test_guid,
+            text=text,
+            entities=["ROCKET"],
+            language="en",
+        )
+
+    results = analyze()
+    assert len(results) == 1
+    assert_result(results[0], "ROCKET", 0, 7, 0.8)
+
+    # Add a pattern to the recognizer which was already used
+    pattern_recognizer.patterns.append(Pattern("shuttle pattern", r"shuttle", 0.6))
+    results = sorted(analyze(), key=lambda result: result.start)
+    assert len(results) == 2
+    assert_result(results[1], "ROCKET", 10, 17, 0.6)
+
+    # Replace the patterns without changing their number
+    pattern_recognizer.patterns = [
+        Pattern("or pattern", r"\bor\b", 0.5),
+        Pattern("shuttle pattern", r"shuttle", 0.6),
+    ]
+    results = sorted(analyze(), key=lambda result: result.start)
+    assert len(results) == 2
+    assert_result(results[0], "ROCKET", 7, 9, 0.5)
+
+    # Change the regex of an existing pattern
+    pattern_recognizer.patterns[0].regex = r"rocket"
+    results = sorted(analyze(), key=lambda result: result.start)
+    assert len(results) == 2
+    assert_result(results[0], "ROCKET", 0, 6, 0.5)
+
+
 def test_when_analyze_with_language_then_returns_correct_response(
     loaded_analyzer_engine,
 ):
@@ -633,3 +683,82 @@ def test_ad_hoc_when_no_other_recognizers_are_requested_returns_only_ad_hoc_resu
     )
 
     assert "ZIP" in [resp.entity_type for resp in responses]
+
+
+def test_when_analyze_batch_then_results_are_in_input_order(loaded_registry):
+    analyzer_engine = AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=NlpEngineMock()
+    )
+    texts = [
+        "Credit card: 4095-2609-9393-4932",
+        "no pii here",
+        "Domain: microsoft.com",
+    ]
+
+    results = analyzer_engine.analyze_batch(
+        texts=texts, language="en", entities=["CREDIT_CARD", "DOMAIN_NAME"]
+    )
+    results = list(results)
+
+    assert len(results) == 3
+    assert len(results[0]) == 1
+    assert_result(results[0][0], "CREDIT_CARD", 13, 32, 1.0)
+    assert len(results[1]) == 0
+    assert len(results[2]) == 1
+    assert_result(results[2][0], "DOMAIN_NAME", 8, 21, 1.0)
+
+
+def test_when_analyze_batch_then_results_are_lazy(loaded_registry):
+    analyzer_engine = AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=NlpEngineMock()
+    )
+    consumed = []
+
+    def texts():
+        for text in ["Domain: microsoft.com", "Domain: github.com"]:
+            consumed.append(text)
+            yield text
+
+    results = analyzer_engine.analyze_batch(
+        texts=texts(), language="en", entities=["DOMAIN_NAME"]
+    )
+    assert consumed == []
+
+    first = next(results)
+    assert len(first) == 1
+    assert consumed == ["Domain: microsoft.com"]
+
+
+def test_when_analyze_batch_with_spacy_then_same_results_as_analyze(
+    loaded_registry, nlp_engine
+):
+    analyzer_engine = AnalyzerEngine(registry=loaded_registry, nlp_engine=nlp_engine)
+    texts = [
+        " Credit card: 4095-2609-9393-4932,  my phone is 425 8829090",
+        "My name is John Smith and my zip is 10023",
+        "",
+    ]
+    entities = ["CREDIT_CARD", "PHONE_NUMBER", "PERSON"]
+
+    batch_results = analyzer_engine.analyze_batch(
+        texts=texts, language="en", entities=entities, batch_size=2
+    )
+
+    for text, results in zip(texts, batch_results):
+        expected = analyzer_engine.analyze(text=text, language="en", entities=entities)
+        assert sorted(results, key=lambda r: r.start) == sorted(
+            expected, key=lambda r: r.start
+        )
+
+
+def test_when_process_batch_then_nlp_artifacts_match_process_text(nlp_engine):
+    texts = ["My name is John Smith", "I live in New York"]
+
+    batch = list(nlp_engine.process_batch(texts, language="en"))
+
+    assert [text for text, _ in batch] == texts
+    for text, nlp_artifacts in batch:
+        expected = nlp_engine.process_text(text, language="en")
+        assert nlp_artifacts.tokens_indices == expected.tokens_indices
+        assert nlp_artifacts.lemmas == expected.lemmas
+        assert nlp_artifacts.keywords == expected.keywords
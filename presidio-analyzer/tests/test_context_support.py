@@ -112,3 +112,44 @@ def test_when_context_custom_recognizer_then_succeed(nlp_engine, mock_nlp_artifa
     assert len(results_without_context) == len(results_with_context)
     for res_wo, res_w in zip(results_without_context, results_with_context):
         assert res_wo.score < res_w.score
+
+
+def test_when_context_enhanced_then_raw_results_not_modified(nlp_engine):
+    recognizer = UsSsnRecognizer()
+    text = "my ssn is 078-05-1120 and my number is 078-05-1121"
+    nlp_artifacts = nlp_engine.process_text(text, "en")
+    raw_results = recognizer.analyze(text, ["US_SSN"], None)
+    raw_scores = [result.score for result in raw_results]
+
+    results = recognizer.enhance_using_context(
+        text, raw_results, nlp_artifacts, recognizer.context
+    )
+
+    assert [result.score for result in raw_results] == raw_scores
+    assert all(
+        result.analysis_explanation.supportive_context_word == ""
+        for result in raw_results
+    )
+    assert results[0].score > raw_results[0].score
+    assert results[0].analysis_explanation.supportive_context_word == "ssn"
+
+
+def test_when_get_token_index_then_token_covering_or_following_returned():
+    # "my phone number is:(425) 882-9090"
+    tokens = ["my", "phone", "number", "is:(425", ")", "882", "-", "9090"]
+    tokens_indices = [0, 3, 9, 16, 23, 25, 28, 29]
+    nlp_artifacts = NlpArtifacts([], tokens, tokens_indices, tokens, None, "en")
+
+    assert nlp_artifacts.get_token_index(0) == 0
+    assert nlp_artifacts.get_token_index(2) == 1
+    assert nlp_artifacts.get_token_index(19) == 3
+    assert nlp_artifacts.get_token_index(25) == 5
+    assert nlp_artifacts.get_token_index(33) is None
+
+
+def test_when_get_keyword_indices_then_only_keyword_tokens_returned(nlp_engine):
+    lemmas = ["my", "social", "security", "card", "is", "here"]
+    tokens_indices = [0, 3, 10, 19, 24, 27]
+    nlp_artifacts = NlpArtifacts([], lemmas, tokens_indices, lemmas, nlp_engine, "en")
+
+    assert nlp_artifacts.get_keyword_indices() == [1, 2, 3]
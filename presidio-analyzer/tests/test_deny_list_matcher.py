@@ -0,0 +1,77 @@
+import pytest
+
+from presidio_analyzer import deny_list_matcher
+from presidio_analyzer.deny_list_matcher import DenyListMatcher
+
+
+@pytest.fixture(params=["pure_python", "pyahocorasick"], autouse=True)
+def automaton_backend(request, monkeypatch):
+    if request.param == "pure_python":
+        monkeypatch.setattr(deny_list_matcher, "ahocorasick", None)
+    elif deny_list_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+
+
+@pytest.mark.parametrize(
+    "deny_list, text, expected",
+    [
+        (["phone", "name"], "my phone number and my name", [(3, 8), (23, 27)]),
+        (["phone"], "my phones and telephone", []),
+        (["Mr."], "Mr. Smith and Mrs Smith", [(0, 3)]),
+        (["a+b", "(c)"], "a+b aab (c) c", [(0, 3), (8, 11)]),
+        (["John Smith"], "Hi John Smith\nJohn Smith", [(3, 13), (14, 24)]),
+        (["John", "John Smith"], "John Smith", [(0, 4)]),
+        (["John Smith", "John"], "John Smith", [(0, 10)]),
+        (["Mr", "Mr."], "Mr. Smith", [(0, 3)]),
+        (["a a"], "a a a a", [(0, 3), (4, 7)]),
+        (["word"], "word,word\tword", []),
+        (["", "x"], "x", [(0, 1)]),
+    ],
+)
+def test_when_deny_list_then_whole_words_found(deny_list, text, expected):
+    matcher = DenyListMatcher(deny_list)
+
+    assert list(matcher.finditer(text)) == expected
+
+
+def test_when_ignore_case_then_words_found_in_any_case():
+    matcher = DenyListMatcher(["john smith"])
+    text = "JOHN SMITH from İzmir and John Smith"
+
+    assert list(matcher.finditer(text)) == []
+    assert list(matcher.finditer(text, ignore_case=True)) == [(0, 10), (26, 36)]
+
+
+def test_when_duplicate_words_then_kept_once():
+    matcher = DenyListMatcher(["a", "b", "a"])
+
+    assert matcher.words == ["a", "b"]
+    assert len(matcher) == 2
+
+
+def test_when_deny_list_is_iterator_then_consumed_once():
+    words = (word for word in ["phone", "name"])
+    matcher = DenyListMatcher(words)
+
+    assert matcher.words == ["phone", "name"]
+    assert list(matcher.finditer("name")) == [(0, 4)]
+
+
+def test_when_deny_list_read_from_file_then_lines_are_words(tmp_path):
+    deny_list_file = tmp_path / "deny_list.txt"
+    deny_list_file.write_text("John Smith\n\nJane Doe\r\n", encoding="utf-8")
+
+    matcher = DenyListMatcher(DenyListMatcher.read_deny_list(str(deny_list_file)))
+
+    assert matcher.words == ["John Smith", "Jane Doe"]
+    assert list(matcher.finditer("Jane Doe met John Smith")) == [(0, 8), (13, 23)]
+
+
+def test_when_large_deny_list_then_words_found():
+    deny_list = [f"name{i}" for i in range(10000)]
+    matcher = DenyListMatcher(deny_list)
+
+    assert list(matcher.finditer("name12 and name9999 but not name10000")) == [
+        (0, 6),
+        (11, 19),
+    ]
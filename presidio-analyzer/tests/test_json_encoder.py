@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from presidio_analyzer.json_encoder import encode_json_value, encode_json_object, encode_json_list
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "value",
+    [
+        "", "text", "quote \" backslash \\ new line \n", "\x00\x1f", "Résumé 😈",
+        0, -5, 10 ** 30, 0.1, -0.0, 1e16, 1e-07,
+        float("nan"), float("inf"), float("-inf"),
+        True, False, None,
+        [1, "é", None], {"b": 1, "a": [2.5]},
+    ],
+    # fmt: on
+)
+def test_given_value_then_encoded_as_by_json_dumps(value):
+    assert encode_json_value(value) == json.dumps(value)
+    assert encode_json_value(value, sort_keys=True) == json.dumps(
+        value, sort_keys=True
+    )
+
+
+def test_given_object_which_is_not_serializable_then_default_is_used():
+    class Point:
+        def __init__(self):
+            self.x = 1
+
+    assert encode_json_value(Point(), default=lambda o: o.__dict__) == '{"x": 1}'
+    with pytest.raises(TypeError):
+        encode_json_value(Point())
+
+
+def test_given_encoded_fields_and_values_then_object_and_list_as_by_json_dumps():
+    encoded_object = encode_json_object(
+        [("b", encode_json_value("é")), ("a", encode_json_list(["1", "null"]))]
+    )
+
+    assert encoded_object == json.dumps({"b": "é", "a": [1, None]})
+    assert encode_json_object([]) == json.dumps({})
+    assert encode_json_list([]) == json.dumps([])
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+
+@pytest.fixture(scope="module")
+def text():
+    return "My credit card number is 4012888888881881, and my name is: John"
+
+
+def test_when_doc_then_lemmas_and_indices_read_from_doc(nlp_engine, text):
+    nlp_artifacts = nlp_engine.process_text(text, "en")
+
+    assert nlp_artifacts.lemmas == [token.lemma_ for token in nlp_artifacts.tokens]
+    assert nlp_artifacts.tokens_indices == [
+        token.idx for token in nlp_artifacts.tokens
+    ]
+
+
+def test_when_keywords_not_accessed_then_not_computed(nlp_engine, text):
+    class CountingNlpEngine:
+        calls = 0
+
+        def is_stopword(self, word, language):
+            CountingNlpEngine.calls += 1
+            return nlp_engine.is_stopword(word, language)
+
+        def is_punct(self, word, language):
+            return nlp_engine.is_punct(word, language)
+
+    doc = nlp_engine.nlp["en"](text)
+    nlp_artifacts = NlpArtifacts(doc.ents, doc, None, None, CountingNlpEngine(), "en")
+    assert CountingNlpEngine.calls == 0
+
+    keywords = nlp_artifacts.keywords
+
+    # stopwords are checked once per distinct lemma
+    assert CountingNlpEngine.calls == len(set(nlp_artifacts.lemmas))
+    assert nlp_artifacts.keywords is keywords
+
+
+def test_when_keywords_then_same_as_set_keywords(nlp_engine, text):
+    nlp_artifacts = nlp_engine.process_text(text, "en")
+
+    expected = NlpArtifacts.set_keywords(nlp_engine, nlp_artifacts.lemmas, "en")
+    assert nlp_artifacts.keywords == expected
+    assert "card" in nlp_artifacts.keywords
+    assert "be" not in nlp_artifacts.keywords
+
+
+def test_when_to_json_then_lazy_fields_included(nlp_engine, text):
+    nlp_artifacts = nlp_engine.process_text(text, "en")
+
+    nlp_artifacts_dict = json.loads(nlp_artifacts.to_json())
+
+    assert set(nlp_artifacts_dict.keys()) == {
+        "entities",
+        "tokens",
+        "lemmas",
+        "tokens_indices",
+        "keywords",
+    }
+    assert nlp_artifacts_dict["tokens_indices"][1] == 3
@@ -1,4 +1,5 @@
 import pytest
+import regex as re
 
 from presidio_analyzer import Pattern
 
@@ -27,3 +28,29 @@ def test_when_use_from_dict_return_pattern(my_pattern, my_pattern_dict):
     assert expected.name == actual.name
     assert expected.score == actual.score
     assert expected.regex == actual.regex
+
+
+def test_when_compiled_regex_then_compiled_once_per_flags(my_pattern):
+    compiled = my_pattern.compiled_regex(re.IGNORECASE)
+
+    assert compiled.pattern == my_pattern.regex
+    assert compiled.flags & re.IGNORECASE
+    assert my_pattern.compiled_regex(re.IGNORECASE) is compiled
+    assert my_pattern.compiled_regex(re.MULTILINE) is not compiled
+
+
+def test_when_same_regex_in_different_patterns_then_compiled_regex_is_shared():
+    pattern1 = Pattern(name="pattern 1", score=0.5, regex=r"\d{3}")
+    pattern2 = Pattern(name="pattern 2", score=0.6, regex=r"\d{3}")
+
+    assert pattern1.compiled_regex(re.DOTALL) is pattern2.compiled_regex(re.DOTALL)
+
+
+def test_when_regex_changes_then_compiled_regex_is_updated():
+    pattern = Pattern(name="my pattern", score=0.5, regex="abc")
+    assert pattern.compiled_regex().match("abc")
+
+    pattern.regex = "def"
+
+    assert pattern.compiled_regex().pattern == "def"
+    assert not pattern.compiled_regex().match("abc")
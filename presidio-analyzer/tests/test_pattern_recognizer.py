@@ -1,4 +1,5 @@
 import pytest
+import regex as re
 
 # https://www.datatrans.ch/showcase/test-cc-numbers
 # https://www.freeformatter.com/credit-card-number-generator-validator.html
@@ -105,3 +106,45 @@ def test_when_taken_from_dict_then_returns_instance():
     assert pattern_recognizer.patterns[1].name == "p2"
     assert pattern_recognizer.patterns[1].score == 0.8
     assert pattern_recognizer.patterns[1].regex == "([0-9]{1,9})"
+
+
+def test_when_deny_list_with_regex_characters_then_matched_literally():
+    test_recognizer = PatternRecognizer(
+        supported_entity="TITLE", deny_list=["Mr.", "Dr.", "(Prof)"]
+    )
+
+    results = test_recognizer.analyze("Mrs Smith, Dr. Jones and (Prof) Lee", None)
+
+    assert len(results) == 2
+    assert_result(results[0], "TITLE", 11, 14, 1.0)
+    assert_result(results[1], "TITLE", 25, 31, 1.0)
+
+
+def test_when_deny_list_then_explanation_has_the_regex_of_the_word():
+    test_recognizer = PatternRecognizer(
+        supported_entity="TITLE", deny_list=["Mr.", "(Prof)"]
+    )
+    text = "Mr. Smith and (Prof) Lee"
+
+    results = test_recognizer.analyze(text, None)
+
+    assert len(results) == 2
+    for result in results:
+        explanation = result.analysis_explanation
+        assert explanation.pattern_name == "deny_list"
+        regex = re.compile(explanation.pattern)
+        assert regex.match(text, result.start).span() == (result.start, result.end)
+    assert results[0].analysis_explanation.pattern == r"(?:^|(?<= ))(Mr\.)(?:(?= )|$)"
+
+
+def test_when_deny_list_then_serialized_and_not_in_patterns():
+    test_recognizer = PatternRecognizer(
+        supported_entity="TITLE", deny_list=(word for word in ["Mr", "Mrs", "Mr"])
+    )
+
+    assert test_recognizer.patterns == []
+    assert test_recognizer.deny_list == ["Mr", "Mrs"]
+
+    new_recognizer = PatternRecognizer.from_dict(test_recognizer.to_dict())
+    assert new_recognizer.deny_list == ["Mr", "Mrs"]
+    assert new_recognizer.patterns == []
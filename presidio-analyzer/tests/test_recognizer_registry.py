@@ -139,3 +139,48 @@ def test_when_remove_pattern_recognizer_then_item_removed():
 
     # Expects zero custom recognizers
     assert len(recognizer_registry.recognizers) == 0
+
+
+def test_when_recognizer_added_then_index_updated(mock_recognizer_registry):
+    registry = mock_recognizer_registry
+    assert registry.get_supported_entities("de") == ["PERSON", "ADDRESS"]
+
+    registry.add_recognizer(create_mock_pattern_recognizer("de", "ROCKET", "6"))
+
+    recognizers = registry.get_recognizers(language="de", entities=["ROCKET"])
+    assert [rec.name for rec in recognizers] == ["6"]
+    assert registry.get_supported_entities("de") == ["PERSON", "ADDRESS", "ROCKET"]
+
+
+def test_when_recognizer_removed_then_index_updated(mock_recognizer_registry):
+    registry = mock_recognizer_registry
+    assert len(registry.get_recognizers(language="he", entities=["ADDRESS"])) == 2
+
+    registry.remove_recognizer("4")
+
+    recognizers = registry.get_recognizers(language="he", entities=["ADDRESS"])
+    assert [rec.name for rec in recognizers] == ["5"]
+
+
+def test_when_recognizers_appended_to_list_then_index_updated(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    assert registry.get_supported_entities("es") == []
+
+    registry.recognizers.append(create_mock_pattern_recognizer("es", "PERSON", "6"))
+
+    assert registry.get_supported_entities("es") == ["PERSON"]
+
+
+def test_when_ad_hoc_recognizers_then_not_added_to_index(mock_recognizer_registry):
+    registry = mock_recognizer_registry
+    ad_hoc_recognizer = create_mock_pattern_recognizer("en", "PERSON", "ad hoc")
+
+    recognizers = registry.get_recognizers(
+        language="en", entities=["PERSON"], ad_hoc_recognizers=[ad_hoc_recognizer]
+    )
+    assert [rec.name for rec in recognizers] == ["1", "ad hoc"]
+
+    recognizers = registry.get_recognizers(language="en", entities=["PERSON"])
+    assert [rec.name for rec in recognizers] == ["1"]
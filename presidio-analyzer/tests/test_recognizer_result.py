@@ -1,6 +1,8 @@
+import json
+
 import pytest
 
-from presidio_analyzer import RecognizerResult
+from presidio_analyzer import RecognizerResult, AnalysisExplanation
 
 
 @pytest.mark.parametrize(
@@ -202,6 +204,48 @@ def test_given_recognizer_result_then_one_is_not_greater_then_another(start, end
     assert not first.__gt__(second)
 
 
+@pytest.mark.parametrize(
+    # fmt: off
+    "analysis_explanation",
+    [
+        None,
+        AnalysisExplanation("SpacyRecognizer", 0.85),
+        AnalysisExplanation(
+            "Résumé", 0.5, "pattern", r"\d+ \"😈\"", True, "explanation"
+        ),
+    ],
+    # fmt: on
+)
+def test_given_recognizer_result_then_to_json_is_identical_to_json_dumps(
+    analysis_explanation,
+):
+    result = RecognizerResult("PERSON", 3, 10, 0.85, analysis_explanation)
+    if analysis_explanation:
+        analysis_explanation.set_improved_score(1.0)
+        analysis_explanation.set_supportive_context_word("name")
+
+    expected = json.dumps(result, default=lambda o: o.__dict__, sort_keys=True)
+    assert result.to_json() == expected
+    assert json.dumps(result.to_dict(), default=lambda o: o.to_dict()) == json.dumps(
+        result, default=lambda o: o.__dict__
+    )
+
+
+def test_given_populated_recognizer_result_then_to_json_is_identical_to_to_dict():
+    explanation = AnalysisExplanation(
+        "Résumé", 0.5, "pattern", r"\d+ \"😈\"", True, "explanation"
+    )
+    explanation.set_improved_score(1.0)
+    explanation.set_supportive_context_word("name")
+    result = RecognizerResult("PERSON", 3, 10, 0.85, explanation)
+
+    assert result.to_dict().keys() == vars(result).keys()
+    expected = json.dumps(
+        result.to_dict(), default=lambda o: o.to_dict(), sort_keys=True
+    )
+    assert result.to_json() == expected
+
+
 def create_recognizer_result(entity_type: str, score: float, start: int, end: int):
     data = {"entity_type": entity_type, "score": score, "start": start, "end": end}
     return RecognizerResult.from_json(data)
@@ -1,8 +1,10 @@
 """REST API server for anonymizer."""
 import logging
 import os
+from itertools import islice, tee
 from logging.config import fileConfig
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from flask import Flask, request, jsonify, Response
 from werkzeug.exceptions import BadRequest, HTTPException
@@ -10,10 +12,21 @@ from werkzeug.exceptions import BadRequest, HTTPException
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.deanonymize_engine import DeanonymizeEngine
 from presidio_anonymizer.entities import InvalidParamException
+from presidio_anonymizer.entities.engine import PIIEntity
+from presidio_anonymizer.entities.engine.result import EngineResult
 from presidio_anonymizer.services.app_entities_convertor import AppEntitiesConvertor
+from presidio_anonymizer.services.json_encoder import (
+    encode_json_list,
+    encode_json_object,
+    encode_json_value,
+)
 
 DEFAULT_PORT = "3000"
 
+JSON_MIMETYPE = "application/json"
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
 LOGGING_CONF_FILE = "logging.ini"
 
 WELCOME_MESSAGE = r"""
@@ -83,6 +96,58 @@ class Server:
             return Response(deanonymized_response.to_json(),
                             mimetype="application/json")
 
+        @self.app.route("/anonymize/batch", methods=["POST"])
+        def anonymize_batch() -> Response:
+            """
+            Anonymize a batch of texts using the same anonymizers.
+
+            The body holds the anonymizers config, validated once for the batch,
+            and a list of items, each with a text and its analyzer results.
+            The response is streamed as a JSON array, or as NDJSON if requested
+            in the Accept header, with one object per item, in order.
+            """
+            content = request.get_json()
+            items = self.__get_batch_items(content)
+            anonymizers_config = AppEntitiesConvertor.operators_config_from_json(
+                content.get("anonymizers")
+            )
+            if AppEntitiesConvertor.check_custom_operator(anonymizers_config):
+                raise BadRequest("Custom type anonymizer is not supported")
+            self.anonymizer.validate_operators(anonymizers_config)
+
+            results = self.__operate_on_batch(
+                items,
+                lambda item: AppEntitiesConvertor.analyzer_results_from_json(
+                    item.get("analyzer_results")),
+                lambda texts, entities: self.anonymizer.anonymize_batch(
+                    texts, entities, anonymizers_config),
+            )
+            return self.__batch_response(results)
+
+        @self.app.route("/deanonymize/batch", methods=["POST"])
+        def deanonymize_batch() -> Response:
+            """
+            Deanonymize a batch of texts using the same deanonymizers.
+
+            The body holds the deanonymizers config, validated once for the batch,
+            and a list of items, each with a text and its anonymizer results.
+            The response is streamed as a JSON array, or as NDJSON if requested
+            in the Accept header, with one object per item, in order.
+            """
+            content = request.get_json()
+            items = self.__get_batch_items(content)
+            deanonymize_config = AppEntitiesConvertor.operators_config_from_json(
+                content.get("deanonymizers"))
+            self.deanonymize.validate_operators(deanonymize_config)
+
+            results = self.__operate_on_batch(
+                items,
+                AppEntitiesConvertor.deanonymize_entities_from_json,
+                lambda texts, entities: self.deanonymize.deanonymize_batch(
+                    texts, entities, deanonymize_config),
+            )
+            return self.__batch_response(results)
+
         @self.app.route("/anonymizers", methods=["GET"])
         def anonymizers():
             """Return a list of supported anonymizers."""
@@ -109,6 +174,91 @@ class Server:
             self.logger.error(f"A fatal error occurred during execution: {e}")
             return jsonify(error="Internal server error"), 500
 
+    @staticmethod
+    def __get_batch_items(content: Optional[Dict]) -> List:
+        if not content:
+            raise BadRequest("Invalid request json")
+        items = content.get("items")
+        if not isinstance(items, list):
+            raise BadRequest("Invalid request json, items must be a list")
+        return items
+
+    def __operate_on_batch(
+            self,
+            items: List,
+            entities_from_json: Callable[[Dict], List[PIIEntity]],
+            operate_batch: Callable[[Iterable[str], Iterable[List[PIIEntity]]],
+                                    Iterator[EngineResult]]
+    ) -> Iterator[Tuple[int, Optional[EngineResult], Optional[str]]]:
+        """
+        Operate on the batch items, yielding the result or the error of each item.
+
+        The items are operated on as a single batch. If an item fails,
+        a new batch is started from the item following it.
+        """
+        index = 0
+        while index < len(items):
+            texts, entities = tee(self.__parse_batch_items(
+                islice(items, index, None), entities_from_json))
+            try:
+                for result in operate_batch(
+                        (text for text, _ in texts),
+                        (item_entities for _, item_entities in entities)):
+                    yield index, result, None
+                    index += 1
+            except InvalidParamException as e:
+                yield index, None, e.err_msg
+                index += 1
+            except Exception as e:
+                self.logger.error(f"A fatal error occurred during execution: {e}")
+                yield index, None, "Internal server error"
+                index += 1
+
+    @staticmethod
+    def __parse_batch_items(
+            items: Iterable,
+            entities_from_json: Callable[[Dict], List[PIIEntity]]
+    ) -> Iterator[Tuple[str, List[PIIEntity]]]:
+        for item in items:
+            if not isinstance(item, dict):
+                raise InvalidParamException("Invalid input, item must be an object")
+            yield item.get("text"), entities_from_json(item)
+
+    def __batch_response(
+            self,
+            results: Iterator[Tuple[int, Optional[EngineResult], Optional[str]]]
+    ) -> Response:
+        if request.accept_mimetypes.best_match(
+                [JSON_MIMETYPE, NDJSON_MIMETYPE]) == NDJSON_MIMETYPE:
+            lines = (self.__batch_item_to_json(*result) + "\n" for result in results)
+            return Response(lines, mimetype=NDJSON_MIMETYPE)
+        return Response(self.__to_json_array(results), mimetype=JSON_MIMETYPE)
+
+    @staticmethod
+    def __to_json_array(
+            results: Iterator[Tuple[int, Optional[EngineResult], Optional[str]]]
+    ) -> Iterator[str]:
+        yield "["
+        for index, result, error in results:
+            separator = ", " if index else ""
+            yield separator + Server.__batch_item_to_json(index, result, error)
+        yield "]"
+
+    @staticmethod
+    def __batch_item_to_json(
+            index: int, result: Optional[EngineResult], error: Optional[str]
+    ) -> str:
+        if result is None:
+            return encode_json_object((
+                ("index", encode_json_value(index)),
+                ("error", encode_json_value(error)),
+            ))
+        return encode_json_object((
+            ("index", encode_json_value(index)),
+            ("text", encode_json_value(result.text)),
+            ("items", encode_json_list(item.to_json() for item in result.items)),
+        ))
+
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", DEFAULT_PORT))
@@ -0,0 +1,74 @@
+"""
+Benchmark the removal of conflicting results in AnonymizerEngine.
+
+Compares it to the previous implementation, which checked each result
+for conflicts against all other results, on 100 to 100k results.
+
+Usage (from the presidio-anonymizer folder):
+
+    python benchmarks/conflict_resolution_benchmark.py
+"""
+import random
+import timeit
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities.engine import RecognizerResult
+
+ENTITY_TYPES = ["IP_ADDRESS", "DATE_TIME", "PHONE_NUMBER", "PERSON"]
+SCORES = [0.3, 0.5, 0.6, 0.85, 1.0]
+# The previous implementation takes too long beyond this count
+MAX_PAIRWISE_COUNT = 10000
+
+
+def pairwise_remove_conflicts(analyzer_results):
+    """Remove conflicts by checking each result against all other results."""
+    unique_text_metadata_elements = []
+    other_elements = analyzer_results.copy()
+    for result in analyzer_results:
+        other_elements.remove(result)
+        if not any(
+            [result.has_conflict(other_element) for other_element in other_elements]
+        ):
+            other_elements.append(result)
+            unique_text_metadata_elements.append(result)
+    return unique_text_metadata_elements
+
+
+def create_results(count, seed=42):
+    """Create overlapping results, as found in a log file."""
+    rnd = random.Random(seed)
+    text_length = count * 10
+    results = []
+    for _ in range(count):
+        start = rnd.randrange(text_length)
+        end = start + rnd.randint(4, 20)
+        results.append(
+            RecognizerResult(rnd.choice(ENTITY_TYPES), start, end, rnd.choice(SCORES))
+        )
+    return results
+
+
+def main():
+    """Time both implementations on increasing numbers of results."""
+    engine = AnonymizerEngine()
+    for count in (100, 1000, 10000, 100000):
+        results = create_results(count)
+        number = 3
+        sweep_time = timeit.timeit(
+            lambda: engine._remove_conflicts_and_get_text_manipulation_data(results),
+            number=number,
+        )
+        line = f"{count:>7} results  sweep: {sweep_time / number * 1000:9.2f} ms"
+        if count <= MAX_PAIRWISE_COUNT:
+            pairwise_time = timeit.timeit(
+                lambda: pairwise_remove_conflicts(results), number=1
+            )
+            line += (
+                f"  pairwise: {pairwise_time * 1000:10.2f} ms"
+                f"  speedup: {pairwise_time / (sweep_time / number):8.1f}x"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
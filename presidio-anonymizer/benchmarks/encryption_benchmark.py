@@ -0,0 +1,81 @@
+"""
+Benchmark encrypt/decrypt round trips of 100k entities.
+
+Compares encrypting and decrypting each entity separately to the bulk
+AESCipher methods, and measures a round trip through the
+AnonymizerEngine and DeanonymizeEngine, which use the bulk methods.
+
+Usage (from the presidio-anonymizer folder):
+
+    python benchmarks/encryption_benchmark.py
+"""
+import time
+
+from presidio_anonymizer import AnonymizerEngine, DeanonymizeEngine
+from presidio_anonymizer.entities.engine import (
+    AnonymizerResult,
+    OperatorConfig,
+    RecognizerResult,
+)
+from presidio_anonymizer.operators.aes_cipher import AESCipher
+
+KEY = "WmZq4t7w!z%C&F)J"
+ENTITY_COUNT = 100000
+
+
+def per_entity_round_trip(texts):
+    """Encrypt and decrypt each text separately."""
+    key = KEY.encode("utf8")
+    encrypted = [AESCipher.encrypt(key, text) for text in texts]
+    return [AESCipher.decrypt(key, text) for text in encrypted]
+
+
+def bulk_round_trip(texts):
+    """Encrypt and decrypt all texts at once."""
+    key = KEY.encode("utf8")
+    encrypted = AESCipher.encrypt_bulk(key, texts)
+    return AESCipher.decrypt_bulk(key, encrypted)
+
+
+def engine_round_trip(text, analyzer_results):
+    """Encrypt all entities in a text, and decrypt them back."""
+    anonymized = AnonymizerEngine().anonymize(
+        text, analyzer_results, {"DEFAULT": OperatorConfig("encrypt", {"key": KEY})}
+    )
+    entities = [
+        AnonymizerResult(item.start, item.end, item.entity_type)
+        for item in anonymized.items
+    ]
+    return DeanonymizeEngine().deanonymize(
+        anonymized.text, entities, {"DEFAULT": OperatorConfig("decrypt", {"key": KEY})}
+    )
+
+
+def timed(name, function, *args):
+    """Run a function and print its duration."""
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{name:<25} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main():
+    """Run the benchmark."""
+    texts = [f"John Smith {index}" for index in range(ENTITY_COUNT)]
+    print(f"{ENTITY_COUNT} entities")
+    assert timed("per entity AESCipher", per_entity_round_trip, texts) == texts
+    assert timed("bulk AESCipher", bulk_round_trip, texts) == texts
+
+    text = " ".join(texts)
+    analyzer_results = []
+    start = 0
+    for entity_text in texts:
+        end = start + len(entity_text)
+        analyzer_results.append(RecognizerResult("PERSON", start, end, 0.8))
+        start = end + 1
+    result = timed("engines", engine_round_trip, text, analyzer_results)
+    assert result.text == text
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark hashing 100k entities with many repeated values.
+
+Compares the hash operator without and with an HMAC key,
+and with a cache of the digests of repeated values.
+
+Usage (from the presidio-anonymizer folder):
+
+    python benchmarks/hash_benchmark.py
+"""
+import time
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities.engine import OperatorConfig, RecognizerResult
+
+KEY = "WmZq4t7w!z%C&F)J"
+ENTITY_COUNT = 100000
+UNIQUE_VALUES = 1000
+
+
+def anonymize(text, analyzer_results, params):
+    """Hash all entities in a text with the given hash params."""
+    return AnonymizerEngine().anonymize(
+        text, analyzer_results, {"DEFAULT": OperatorConfig("hash", params)}
+    )
+
+
+def timed(name, function, *args):
+    """Run a function and print its duration."""
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{name:<25} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main():
+    """Run the benchmark."""
+    texts = [
+        f"user{index % UNIQUE_VALUES}@example.com" for index in range(ENTITY_COUNT)
+    ]
+    text = " ".join(texts)
+    analyzer_results = []
+    start = 0
+    for entity_text in texts:
+        end = start + len(entity_text)
+        analyzer_results.append(RecognizerResult("EMAIL_ADDRESS", start, end, 0.8))
+        start = end + 1
+
+    print(f"{ENTITY_COUNT} entities, {UNIQUE_VALUES} unique values")
+    sha256 = timed("sha256", anonymize, text, analyzer_results, {})
+    cached = timed(
+        "sha256, cached",
+        anonymize,
+        text,
+        analyzer_results,
+        {"cache_size": UNIQUE_VALUES},
+    )
+    assert sha256.text == cached.text
+
+    hmac = timed("hmac-sha256", anonymize, text, analyzer_results, {"key": KEY})
+    cached_hmac = timed(
+        "hmac-sha256, cached",
+        anonymize,
+        text,
+        analyzer_results,
+        {"key": KEY, "cache_size": UNIQUE_VALUES},
+    )
+    assert hmac.text == cached_hmac.text
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark anonymizing a large text file, entirely in memory and as a stream.
+
+Creates a text file of the requested size, with a regex based analyze function
+standing in for the analyzer, and reports the duration and peak memory
+of each approach.
+
+Usage (from the presidio-anonymizer folder):
+
+    python benchmarks/stream_benchmark.py --size-mb 50
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities.engine import RecognizerResult
+
+LINE = "My name is John Smith, my phone number is 212-555-5555 and I live in Paris\n"
+PATTERN = re.compile(r"\bJohn Smith\b|\b\d{3}-\d{3}-\d{4}\b")
+READ_SIZE = 65536
+
+
+def analyze(text):
+    """Find names and phone numbers in the text."""
+    return [
+        RecognizerResult("PII", match.start(), match.end(), 0.8)
+        for match in PATTERN.finditer(text)
+    ]
+
+
+def anonymize_in_memory(input_path, output_path):
+    """Read the entire file, anonymize it and write the output."""
+    with open(input_path) as input_file:
+        text = input_file.read()
+    result = AnonymizerEngine().anonymize(text, analyze(text))
+    with open(output_path, "w") as output_file:
+        output_file.write(result.text)
+
+
+def anonymize_stream(input_path, output_path):
+    """Read, anonymize and write the file chunk by chunk."""
+    with open(input_path) as input_file, open(output_path, "w") as output_file:
+        parts = iter(partial(input_file.read, READ_SIZE), "")
+        for chunk in AnonymizerEngine().anonymize_stream(parts, analyze):
+            output_file.write(chunk)
+
+
+def measured(name, function, *args):
+    """Run a function and print its duration, and its peak memory in a second run."""
+    start = time.perf_counter()
+    function(*args)
+    duration = time.perf_counter() - start
+
+    # tracing memory allocations slows the run down, so it is timed separately
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<12} {duration:8.2f} s {peak / 2 ** 20:10.1f} MB peak")
+
+
+def main():
+    """Parse the command line arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Stream anonymization benchmark")
+    parser.add_argument("--size-mb", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.txt")
+        with open(input_path, "w") as input_file:
+            for _ in range(args.size_mb * 2 ** 20 // len(LINE)):
+                input_file.write(LINE)
+
+        in_memory_path = os.path.join(directory, "in_memory.txt")
+        stream_path = os.path.join(directory, "stream.txt")
+        print(f"{args.size_mb} MB file")
+        measured("in memory", anonymize_in_memory, input_path, in_memory_path)
+        measured("stream", anonymize_stream, input_path, stream_path)
+
+        with open(in_memory_path) as in_memory, open(stream_path) as stream:
+            assert in_memory.read() == stream.read()
+
+
+if __name__ == "__main__":
+    main()
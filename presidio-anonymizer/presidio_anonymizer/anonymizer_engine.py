@@ -1,8 +1,12 @@
 """Handles the entire logic of the Presidio-anonymizer and text anonymizing."""
 import logging
-from typing import List, Dict, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, Callable
 
 from presidio_anonymizer.core.engine_base import EngineBase
+from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.entities.engine import OperatorConfig
 from presidio_anonymizer.entities.engine import RecognizerResult
 from presidio_anonymizer.entities.engine.result import EngineResult
@@ -10,6 +14,12 @@ from presidio_anonymizer.operators import OperatorType
 
 DEFAULT = "replace"
 
+DEFAULT_BATCH_SIZE = 100
+
+DEFAULT_CHUNK_SIZE = 100000
+
+DEFAULT_CHUNK_OVERLAP = 1000
+
 
 class AnonymizerEngine(EngineBase):
     """
@@ -17,6 +27,10 @@ class AnonymizerEngine(EngineBase):
 
     Handles the entire logic of the Presidio-anonymizer. Gets the original text
     and replaces the PII entities with the desired anonymizers.
+
+    The engine is thread safe: a single instance can be shared by multiple threads,
+    and the operator configs passed to it are not modified, so they can be
+    shared as well.
     """
 
     logger = logging.getLogger("presidio-anonymizer")
@@ -48,6 +62,184 @@ class AnonymizerEngine(EngineBase):
 
         return self._operate(text, analyzer_results, operators, OperatorType.Anonymize)
 
+    def anonymize_batch(
+            self,
+            texts: Iterable[str],
+            analyzer_results_per_text: Iterable[List[RecognizerResult]],
+            operators: Optional[Dict[str, OperatorConfig]] = None,
+            n_process: int = 1,
+            batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[EngineResult]:
+        """Anonymize a batch of texts using the same operators.
+
+        The operators are prepared and validated once for the entire batch,
+        instead of once per text.
+        Results are returned lazily, in the same order as the input texts.
+
+        :param texts: an iterable of texts to anonymize
+        :param analyzer_results_per_text: an iterable of the analyzer results
+        of each text, in the same order as the texts
+        :param operators: The configuration of the anonymizers we would like
+        to use for each entity e.g.: {"PHONE_NUMBER":OperatorConfig("redact", {})}
+        :param n_process: Number of processes to anonymize with. Using multiple
+        processes pays off for CPU heavy operators, such as hash and encrypt.
+        The operators are sent to the processes, so they have to be picklable
+        (custom operators using a lambda are not)
+        :param batch_size: Number of texts to send to a process at a time
+        :return: a generator of the anonymized texts and the information about
+        their anonymized entities, one per input text
+        """
+        records = self._zip_records(
+            texts, analyzer_results_per_text, "analyzer results")
+        if n_process > 1:
+            return self.__anonymize_in_processes(
+                records, operators, n_process, batch_size)
+        return self._anonymize_records(records, operators)
+
+    def anonymize_stream(
+            self,
+            texts: Iterable[str],
+            analyze: Callable[[str], List[RecognizerResult]],
+            operators: Optional[Dict[str, OperatorConfig]] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            overlap: int = DEFAULT_CHUNK_OVERLAP
+    ) -> Iterator[str]:
+        """Anonymize a text too large to be held in memory, chunk by chunk.
+
+        The text is read from an iterable of its parts, of any size
+        (e.g. the lines of a file, or blocks read from it), and split into chunks
+        of about chunk_size characters. Each chunk is analyzed together with
+        up to overlap characters before and after it, so PII entities and context
+        words crossing the chunk boundaries are found. A chunk is extended to the
+        end of an entity crossing its end, so entities are never split.
+        The anonymized chunks are returned lazily, so memory is bounded by the
+        chunk size (and the size of the text parts).
+
+        :param texts: an iterable of the parts of the text, e.g. an open file
+        :param analyze: a function returning the analyzer results of a text,
+        e.g. lambda text: analyzer_engine.analyze(text=text, language="en")
+        :param operators: The configuration of the anonymizers we would like
+        to use for each entity e.g.: {"PHONE_NUMBER":OperatorConfig("redact", {})}
+        :param chunk_size: Number of characters to anonymize at a time
+        :param overlap: Number of characters before and after each chunk
+        to analyze with it. Should be longer than the longest expected entity
+        :return: a generator of the anonymized chunks, to be concatenated
+        (e.g. written to a file) in order
+        """
+        if chunk_size <= 0:
+            raise InvalidParamException(
+                "Invalid input, chunk_size must be a positive number")
+        if overlap < 0:
+            raise InvalidParamException(
+                "Invalid input, overlap must be a non-negative number")
+
+        records = self.__analyze_chunks(texts, analyze, chunk_size, overlap)
+        for result in self._anonymize_records(records, operators):
+            yield result.text
+
+    def _anonymize_records(
+            self,
+            records: Iterable[Tuple[str, List[RecognizerResult]]],
+            operators: Optional[Dict[str, OperatorConfig]] = None
+    ) -> Iterator[EngineResult]:
+        """Anonymize (text, analyzer results) records, sharing the operators."""
+        operators = self.__check_or_add_default_operator(operators)
+        remove_conflicts = self._remove_conflicts_and_get_text_manipulation_data
+        return self._operate_records(
+            ((text, remove_conflicts(analyzer_results))
+             for text, analyzer_results in records),
+            operators,
+            OperatorType.Anonymize
+        )
+
+    @staticmethod
+    def _anonymize_records_in_process(
+            records: List[Tuple[str, List[RecognizerResult]]],
+            operators: Optional[Dict[str, OperatorConfig]]
+    ) -> List[EngineResult]:
+        """Anonymize a chunk of records in a worker process."""
+        return list(AnonymizerEngine()._anonymize_records(records, operators))
+
+    def __anonymize_in_processes(
+            self,
+            records: Iterator[Tuple[str, List[RecognizerResult]]],
+            operators: Optional[Dict[str, OperatorConfig]],
+            n_process: int,
+            batch_size: int
+    ) -> Iterator[EngineResult]:
+        with ProcessPoolExecutor(max_workers=n_process) as executor:
+            # Keep a bounded number of chunks in progress, and return their
+            # results in order
+            pending = deque()
+            while True:
+                chunk = list(islice(records, batch_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(
+                    AnonymizerEngine._anonymize_records_in_process, chunk, operators))
+                if len(pending) > 2 * n_process:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    @staticmethod
+    def __analyze_chunks(
+            texts: Iterable[str],
+            analyze: Callable[[str], List[RecognizerResult]],
+            chunk_size: int,
+            overlap: int
+    ) -> Iterator[Tuple[str, List[RecognizerResult]]]:
+        """Split a stream of text parts into analyzed chunks."""
+        parts = iter(texts)
+        exhausted = False
+        # The text read and not yet anonymized,
+        # following up to overlap characters of already anonymized text
+        buffer = ""
+        context_length = 0
+        while True:
+            window_length = context_length + chunk_size + overlap
+            read_parts = [buffer]
+            read_length = len(buffer)
+            while not exhausted and read_length < window_length:
+                part = next(parts, None)
+                if part is None:
+                    exhausted = True
+                else:
+                    read_parts.append(part)
+                    read_length += len(part)
+            buffer = "".join(read_parts)
+            if len(buffer) <= context_length:
+                return
+
+            window = buffer[:window_length]
+            if exhausted and len(buffer) <= window_length:
+                chunk_end = len(buffer)
+            else:
+                chunk_end = context_length + chunk_size
+
+            # Results starting in the context were handled with the previous chunk
+            results = sorted(
+                (result for result in analyze(window)
+                 if result.start >= context_length),
+                key=lambda result: result.start
+            )
+            for result in results:
+                if result.start < chunk_end < result.end:
+                    chunk_end = result.end
+
+            chunk_results = [
+                RecognizerResult(result.entity_type,
+                                 result.start - context_length,
+                                 result.end - context_length,
+                                 result.score)
+                for result in results if result.start < chunk_end
+            ]
+            yield buffer[context_length:chunk_end], chunk_results
+
+            context_start = max(0, chunk_end - overlap)
+            buffer = buffer[context_start:]
+            context_length = chunk_end - context_start
+
     def _remove_conflicts_and_get_text_manipulation_data(self, analyzer_results: List[
             RecognizerResult]) -> List[RecognizerResult]:
         """
@@ -58,34 +250,56 @@ class AnonymizerEngine(EngineBase):
         2. Have the same indices as other results but with larger score.
         :return: List
         """
+        # For each span, the result with the highest score conflicts with
+        # all others (the last one is kept for results with the same score)
+        best_per_span: Dict[Tuple[int, int], int] = {}
+        for index, result in enumerate(analyzer_results):
+            span = (result.start, result.end)
+            best_index = best_per_span.get(span)
+            if (
+                best_index is None
+                or result.score >= analyzer_results[best_index].score
+            ):
+                best_per_span[span] = index
+
+        # Sort the spans by start, longest first, so a span is contained in
+        # another span if it ends before the furthest end seen so far
+        kept_indices = set()
+        max_end = None
+        for start, end in sorted(best_per_span, key=lambda span: (span[0], -span[1])):
+            if max_end is not None and end <= max_end:
+                continue
+            kept_indices.add(best_per_span[(start, end)])
+            max_end = end
+
         unique_text_metadata_elements = []
-        # This list contains all elements which we need to check a single result
-        # against. If a result is dropped, it can also be dropped from this list
-        # since it is intersecting with another result and we selected the other one.
-        other_elements = analyzer_results.copy()
-        for result in analyzer_results:
-            other_elements.remove(result)
-            result_conflicted = self.__is_result_conflicted_with_other_elements(
-                other_elements, result)
-            if not result_conflicted:
-                other_elements.append(result)
+        for index, result in enumerate(analyzer_results):
+            if index in kept_indices:
                 unique_text_metadata_elements.append(result)
             else:
                 self.logger.debug(
-                    f"removing element {result} from results list due to conflict"
+                    "removing element %s from results list due to conflict", result
                 )
         return unique_text_metadata_elements
 
+    def validate_operators(
+            self, operators: Optional[Dict[str, OperatorConfig]]
+    ) -> None:
+        """
+        Validate the operator configs, without anonymizing a text.
+
+        Useful for failing early on invalid configs, before anonymizing a batch.
+
+        :param operators: The configuration of the anonymizers
+        """
+        operators = self.__check_or_add_default_operator(operators)
+        self._validate_operators(operators, OperatorType.Anonymize)
+
     def get_anonymizers(self) -> List[str]:
         """Return a list of supported anonymizers."""
         names = [p for p in self.operators_factory.get_anonymizers().keys()]
         return names
 
-    @staticmethod
-    def __is_result_conflicted_with_other_elements(other_elements, result):
-        return any([result.has_conflict(other_element) for other_element in
-                    other_elements])
-
     @staticmethod
     def __check_or_add_default_operator(operators: Dict[
         str, OperatorConfig]) -> \
@@ -94,5 +308,6 @@ class AnonymizerEngine(EngineBase):
         if not operators:
             return {"DEFAULT": default_operator}
         if not operators.get("DEFAULT"):
-            operators["DEFAULT"] = default_operator
+            # copy the operators, so the caller's dict is not modified
+            operators = {**operators, "DEFAULT": default_operator}
         return operators
@@ -1,13 +1,15 @@
 """Handle the entire text operations using the operators."""
 import logging
 from abc import ABC
-from typing import List, Dict
+from itertools import zip_longest
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 
 from presidio_anonymizer.core.text_replace_builder import TextReplaceBuilder
+from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.entities.engine import OperatorConfig
 from presidio_anonymizer.entities.engine import PIIEntity
 from presidio_anonymizer.entities.engine.result import EngineResult, OperatorResult
-from presidio_anonymizer.operators import OperatorsFactory, OperatorType
+from presidio_anonymizer.operators import OperatorsFactory, OperatorType, Operator
 
 
 class EngineBase(ABC):
@@ -21,7 +23,10 @@ class EngineBase(ABC):
                  text: str,
                  pii_entities: List[PIIEntity],
                  operators_metadata: Dict[str, OperatorConfig],
-                 operator_type: OperatorType) -> EngineResult:
+                 operator_type: OperatorType,
+                 validated_operators: Optional[Dict[int, Operator]] = None,
+                 entities_params: Optional[Dict[Tuple[int, str], Dict]] = None
+                 ) -> EngineResult:
         """
         Operate will do the operations required by the user over the text.
 
@@ -30,56 +35,246 @@ class EngineBase(ABC):
         :param operators_metadata: dictionary where the key is the entity_type and what
         :type operator_type: either anonymize or deanonymize
         we want to perform over this entity_type.
+        :param validated_operators: operators already validated, by the id of their
+        config, to share between calls with the same operators_metadata.
+        The caller is responsible for closing them. If not given, the operators
+        are created and closed by this call.
+        :param entities_params: operator params already created, by the id of their
+        config and the entity type, to share between calls with the same
+        operators_metadata.
         :return:
         """
         text_replace_builder = TextReplaceBuilder(original_text=text)
         engine_result = EngineResult()
         sorted_pii_entities = sorted(pii_entities, reverse=True)
-        for operator in sorted_pii_entities:
-            text_to_operate_on = text_replace_builder.get_text_in_position(
-                operator.start, operator.end
+        # Operators by the id of their config, validated once per call
+        close_operators = validated_operators is None
+        if close_operators:
+            validated_operators = {}
+        # Operator params by the id of their config and the entity type
+        if entities_params is None:
+            entities_params = {}
+
+        entities_operators = []
+        for entity in sorted_pii_entities:
+            operator_metadata = self.__get_entity_operator_metadata(
+                entity.entity_type, operators_metadata)
+            validated_operator = self.__get_validated_operator(
+                operator_metadata, operator_type, validated_operators
+            )
+            params = self.__get_entity_params(
+                entity.entity_type, operator_metadata, entities_params
             )
+            entities_operators.append((operator_metadata, validated_operator, params))
 
-            self.logger.debug(
-                f"performing operation {operator}"
+        changed_texts = None
+        if not self.__has_overlaps(sorted_pii_entities):
+            # The entities are all operated on the original text,
+            # so the entities sharing an operator can be operated on in bulk
+            changed_texts = self.__operate_in_bulk(
+                text_replace_builder, sorted_pii_entities, entities_operators
             )
-            operator_metadata = self.__get_entity_operator_metadata(
-                operator.entity_type, operators_metadata)
-            changed_text = self.__operate_on_text(
-                operator, text_to_operate_on, operator_metadata, operator_type
+
+        operations = []
+        for index, entity in enumerate(sorted_pii_entities):
+            operator_metadata, validated_operator, params = entities_operators[index]
+            if changed_texts is not None:
+                changed_text = changed_texts[index]
+            else:
+                # Overlapping entities are operated on the text replaced so far
+                text_to_operate_on = text_replace_builder.get_text_in_position(
+                    entity.start, entity.end
+                )
+                changed_text = self.__operate_on_text(
+                    entity, text_to_operate_on, params, validated_operator
+                )
+            text_replace_builder.replace_text(
+                changed_text, entity.start, entity.end
             )
-            index_from_end = text_replace_builder.replace_text_get_insertion_index(
-                changed_text, operator.start, operator.end
+            operations.append(
+                (changed_text, operator_metadata.operator_name, entity.entity_type)
             )
 
-            # The following creates an intermediate list of result entities,
-            # ordered from end to start, and the indexes will be normalized
-            # from start to end once the loop ends and the text length is deterministic.
-            result_item = OperatorResult(changed_text,
-                                         operator_metadata.operator_name,
-                                         0, index_from_end,
-                                         operator.entity_type)
+        # The result entities are ordered from end to start,
+        # with their indexes in the output text
+        positions = text_replace_builder.get_replacement_positions()
+        for (changed_text, operator_name, entity_type), (start, end) in zip(
+                operations, positions):
+            result_item = OperatorResult(changed_text, operator_name,
+                                         start, end, entity_type)
             engine_result.add_item(result_item)
 
         engine_result.set_text(text_replace_builder.output_text)
-        engine_result.normalize_item_indexes()
+        if close_operators:
+            self._close_operators(validated_operators)
         return engine_result
 
+    def _operate_records(
+            self,
+            records: Iterable[Tuple[str, List[PIIEntity]]],
+            operators_metadata: Dict[str, OperatorConfig],
+            operator_type: OperatorType
+    ) -> Iterator[EngineResult]:
+        """
+        Operate on (text, entities) records, sharing the operators between them.
+
+        The operators are validated once, and closed once all records are done.
+        """
+        validated_operators = {}
+        entities_params = {}
+        try:
+            for text, entities in records:
+                yield self._operate(text, entities, operators_metadata,
+                                    operator_type, validated_operators,
+                                    entities_params)
+        finally:
+            self._close_operators(validated_operators)
+
+    def _validate_operators(
+            self,
+            operators_metadata: Dict[str, OperatorConfig],
+            operator_type: OperatorType
+    ) -> None:
+        """Validate the operator configs, raising InvalidParamException if invalid."""
+        validated_operators = {}
+        try:
+            for operator_metadata in operators_metadata.values():
+                self.__get_validated_operator(
+                    operator_metadata, operator_type, validated_operators)
+        finally:
+            self._close_operators(validated_operators)
+
+    @staticmethod
+    def _zip_records(
+            texts: Iterable[str],
+            entities_per_text: Iterable[List[PIIEntity]],
+            entities_name: str
+    ) -> Iterator[Tuple[str, List[PIIEntity]]]:
+        """Zip texts with their entities, failing if their numbers differ."""
+        missing = object()
+        for text, entities in zip_longest(
+                texts, entities_per_text, fillvalue=missing):
+            if text is missing or entities is missing:
+                raise InvalidParamException(
+                    f"Invalid input, the number of texts and {entities_name} "
+                    "must be equal"
+                )
+            yield text, entities
+
+    @staticmethod
+    def _close_operators(validated_operators: Dict[int, Operator]) -> None:
+        """Close the operators once they are no longer used."""
+        for operator in validated_operators.values():
+            operator.close()
+
+    def __get_validated_operator(
+            self,
+            operator_metadata: OperatorConfig,
+            operator_type: OperatorType,
+            validated_operators: Dict[int, Operator]
+    ) -> Operator:
+        """
+        Get the operator of an operator config, validating the config on first use.
+
+        :param operator_metadata: the operator config.
+        :param operator_type: either anonymize or deanonymize.
+        :param validated_operators: the operators already validated,
+        by the id of their config.
+        :return: the operator.
+        """
+        operator = validated_operators.get(id(operator_metadata))
+        if operator is None:
+            operator_name = operator_metadata.operator_name
+            self.logger.debug(f"getting operator {operator_name}")
+            operator = self.operators_factory.create_operator_class(
+                operator_name, operator_type)
+            self.logger.debug(f"validating operator {operator}")
+            operator.validate(params=operator_metadata.params)
+            validated_operators[id(operator_metadata)] = operator
+        return operator
+
+    @staticmethod
+    def __get_entity_params(
+            entity_type: str,
+            operator_metadata: OperatorConfig,
+            entities_params: Dict[Tuple[int, str], Dict]
+    ) -> Dict:
+        """
+        Get the params to operate with on an entity of a given type.
+
+        The params of the operator config are copied with the entity type added,
+        so the operator config is never modified, and can be shared between threads.
+
+        :param entity_type: the type of the entity.
+        :param operator_metadata: the operator config.
+        :param entities_params: the params already created,
+        by the id of their config and the entity type.
+        :return: the operator params.
+        """
+        key = (id(operator_metadata), entity_type)
+        params = entities_params.get(key)
+        if params is None:
+            params = {**operator_metadata.params, "entity_type": entity_type}
+            entities_params[key] = params
+        return params
+
+    @staticmethod
+    def __has_overlaps(sorted_pii_entities: List[PIIEntity]) -> bool:
+        """Check if entities, sorted from end to start, overlap each other."""
+        return any(
+            preceding.end > entity.start
+            for entity, preceding in zip(sorted_pii_entities, sorted_pii_entities[1:])
+        )
+
+    def __operate_in_bulk(
+            self,
+            text_replace_builder: TextReplaceBuilder,
+            sorted_pii_entities: List[PIIEntity],
+            entities_operators: List[Tuple[OperatorConfig, Operator, Dict]]
+    ) -> List[str]:
+        """
+        Operate on the entities, calling each operator once with all of its texts.
+
+        :param text_replace_builder: the builder of the text, before any replacement.
+        :param sorted_pii_entities: the entities, which must not overlap.
+        :param entities_operators: the operator config, operator and params
+        of each entity.
+        :return: the changed text of each entity.
+        """
+        texts_to_operate_on = [
+            text_replace_builder.get_text_in_position(entity.start, entity.end)
+            for entity in sorted_pii_entities
+        ]
+
+        # Entity indexes by the id of their params, which are created once
+        # for each operator config and entity type
+        groups: Dict[int, List[int]] = {}
+        for index, (_, _, params) in enumerate(entities_operators):
+            groups.setdefault(id(params), []).append(index)
+
+        changed_texts = [None] * len(sorted_pii_entities)
+        for indexes in groups.values():
+            _, operator, params = entities_operators[indexes[0]]
+            self.logger.debug(
+                "operating on %d entities with %s", len(indexes), operator
+            )
+            group_changed_texts = operator.operate_bulk(
+                texts=[texts_to_operate_on[index] for index in indexes],
+                params=params
+            )
+            for index, changed_text in zip(indexes, group_changed_texts):
+                changed_texts[index] = changed_text
+        return changed_texts
+
     def __operate_on_text(
             self,
             text_metadata: PIIEntity,
             text_to_operate_on: str,
-            operator_metadata: OperatorConfig, operator_type: OperatorType
+            params: Dict,
+            operator: Operator
     ) -> str:
         entity_type = text_metadata.entity_type
-        self.logger.debug(f"getting operator for {entity_type}")
-        operator = self.operators_factory.create_operator_class(
-            operator_metadata.operator_name, operator_type)
-        self.logger.debug(f"validating operator {operator} for {entity_type}")
-        operator.validate(params=operator_metadata.params)
-        params = operator_metadata.params
-        params["entity_type"] = entity_type
-        self.logger.debug(f"operating on {entity_type} with {operator}")
+        self.logger.debug("operating on %s with %s", entity_type, operator)
         operated_on_text = operator.operate(params=params, text=text_to_operate_on)
         return operated_on_text
 
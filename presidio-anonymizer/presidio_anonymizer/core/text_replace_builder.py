@@ -1,18 +1,39 @@
 """Handles the original text and creates a new one according to changes requests."""
 import logging
+from typing import List, Tuple, Optional
 
 from presidio_anonymizer.entities import InvalidParamException
 
 
 class TextReplaceBuilder:
-    """Creates new text according to users request."""
+    """
+    Creates new text according to users request.
+
+    Replacements are made from the end of the text to its start.
+    They are only recorded, and the output text is created by joining
+    the replacements and the text between them once, when it is requested.
+    """
 
     def __init__(self, original_text: str):
         self.logger = logging.getLogger("presidio-anonymizer")
         self.__validate_text_not_empty(original_text)
-        self.output_text = original_text
+        self.original_text = original_text
         self.text_len = len(original_text)
         self.last_replacement_index = self.text_len
+        # (start, end, replacement text) of each replacement, in the order they
+        # were made. end is cut at the start of the previous replacement.
+        self.__replacements: List[Tuple[int, int, str]] = []
+        # length of the output text from the last replacement start to its end
+        self.__tail_len = 0
+        self.__output_text: Optional[str] = original_text
+        self.__positions: List[Tuple[int, int]] = []
+
+    @property
+    def output_text(self) -> str:
+        """Return the text with all replacements made so far."""
+        if self.__output_text is None:
+            self.__build_output()
+        return self.__output_text
 
     def __validate_text_not_empty(self, text: str):
         if not text:
@@ -28,8 +49,27 @@ class TextReplaceBuilder:
         :return: str - part of the original text
         """
         self.__validate_position_in_text(start, end)
+        if end <= self.last_replacement_index:
+            return self.original_text[start:end]
+        # The position overlaps text which was already replaced
         return self.output_text[start:end]
 
+    def replace_text(self, replacement_text: str, start: int, end: int) -> None:
+        """
+        Replace text in a specific position with the text.
+
+        :param replacement_text: new text to replace the old text according to indices
+        :param start: the startpoint to replace the text
+        :param end: the endpoint to replace the text
+        """
+        end_of_text_index = min(end, self.last_replacement_index)
+        self.__tail_len += (
+            self.last_replacement_index - end_of_text_index + len(replacement_text)
+        )
+        self.last_replacement_index = start
+        self.__replacements.append((start, end_of_text_index, replacement_text))
+        self.__output_text = None
+
     def replace_text_get_insertion_index(
             self, replacement_text: str, start: int, end: int
     ) -> int:
@@ -39,18 +79,40 @@ class TextReplaceBuilder:
         :param replacement_text: new text to replace the old text according to indices
         :param start: the startpoint to replace the text
         :param end: the endpoint to replace the text
-        :return: The index of inserted text
+        :return: The index of inserted text, from the end of the text
         """
-        end_of_text_index = min(end, self.last_replacement_index)
-        self.last_replacement_index = start
+        self.replace_text(replacement_text, start, end)
+        return self.__tail_len
+
+    def get_replacement_positions(self) -> List[Tuple[int, int]]:
+        """
+        Return the positions of the replacements in the output text.
+
+        :return: A list of (start, end) positions in the output text,
+        in the order the replacements were made
+        """
+        if self.__output_text is None:
+            self.__build_output()
+        return self.__positions
 
-        before_text = self.output_text[:start]
-        after_text = self.output_text[end_of_text_index:]
-        self.output_text = before_text + replacement_text + after_text
+    def __build_output(self):
+        """Join the replacements and the original text between them."""
+        segments = []
+        positions = []
+        output_len = 0
+        text_index = 0
+        for start, end, replacement_text in reversed(self.__replacements):
+            segments.append(self.original_text[text_index:start])
+            output_len += start - text_index
+            segments.append(replacement_text)
+            positions.append((output_len, output_len + len(replacement_text)))
+            output_len += len(replacement_text)
+            text_index = end
+        segments.append(self.original_text[text_index:])
 
-        # The replace algorithm is replacing the text from end to start.
-        # calculate and return the start point from the end.
-        return len(after_text) + len(replacement_text)
+        positions.reverse()
+        self.__positions = positions
+        self.__output_text = "".join(segments)
 
     def __validate_position_in_text(self, start: int, end: int):
         """Validate the start and end position match the text length."""
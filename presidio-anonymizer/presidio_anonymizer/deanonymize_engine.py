@@ -1,6 +1,6 @@
 """Deanonymize anonymized text by using deanonymize operators."""
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 
 from presidio_anonymizer.core.engine_base import EngineBase
 from presidio_anonymizer.entities.engine import OperatorConfig
@@ -10,7 +10,13 @@ from presidio_anonymizer.operators import OperatorType
 
 
 class DeanonymizeEngine(EngineBase):
-    """Deanonymize text that was previously anonymized."""
+    """
+    Deanonymize text that was previously anonymized.
+
+    The engine is thread safe: a single instance can be shared by multiple threads,
+    and the operator configs passed to it are not modified, so they can be
+    shared as well.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger("presidio-anonymizer")
@@ -31,6 +37,38 @@ class DeanonymizeEngine(EngineBase):
                              operators,
                              OperatorType.Deanonymize)
 
+    def deanonymize_batch(
+            self,
+            texts: Iterable[str],
+            entities_per_text: Iterable[List[AnonymizerResult]],
+            operators: Dict[str, OperatorConfig]
+    ) -> Iterator[EngineResult]:
+        """
+        Deanonymize a batch of texts using the same operators.
+
+        The operators are validated once for the entire batch, instead of once
+        per text. Results are returned lazily, in the same order as the input texts.
+
+        :param texts: an iterable of texts with encrypted entities
+        :param entities_per_text: an iterable of the encrypted entities of each text,
+        in the same order as the texts
+        :param operators: the operators to apply on the anonymizer result entities
+        :return: a generator of the deanonymized texts and the data about
+        their deanonymized entities, one per input text
+        """
+        records = self._zip_records(texts, entities_per_text, "entities")
+        return self._operate_records(records, operators, OperatorType.Deanonymize)
+
+    def validate_operators(self, operators: Dict[str, OperatorConfig]) -> None:
+        """
+        Validate the operator configs, without deanonymizing a text.
+
+        Useful for failing early on invalid configs, before deanonymizing a batch.
+
+        :param operators: the operators to apply on the anonymizer result entities
+        """
+        self._validate_operators(operators, OperatorType.Deanonymize)
+
     def get_deanonymizers(self) -> List[str]:
         """Return a list of supported deanonymizers."""
         names = [p for p in self.operators_factory.get_deanonymizers().keys()]
@@ -1,8 +1,11 @@
 """Handle a serializable anonymizer result."""
-import json
-from typing import List
+from typing import List, Dict
 
 from presidio_anonymizer.entities.engine.result import OperatorResult
+from presidio_anonymizer.services.json_encoder import (
+    encode_json_list,
+    encode_json_value,
+)
 
 
 class EngineResult:
@@ -38,9 +41,26 @@ class EngineResult:
             result_item.start = text_len - result_item.end
             result_item.end = result_item.start + len(result_item.text)
 
+    def to_dict(self) -> Dict:
+        """
+        Serialize self to dictionary.
+
+        :return: a dictionary
+        """
+        return {
+            "text": self.text,
+            "items": [item.to_dict() for item in self.items],
+        }
+
     def to_json(self) -> str:
-        """Return a json string serializing this instance."""
-        return json.dumps(self, default=lambda x: x.__dict__)
+        """
+        Return a json string serializing this instance.
+
+        The JSON is created from the known fields of the result and its items,
+        without creating intermediate dictionaries.
+        """
+        items = encode_json_list(item.to_json() for item in self.items)
+        return f'{{"text": {encode_json_value(self.text)}, "items": {items}}}'
 
     def __eq__(self, other) -> bool:
         """Verify two instances are equal.
@@ -1,3 +1,8 @@
+from typing import Dict
+
+from presidio_anonymizer.services.json_encoder import encode_json_value
+
+
 class OperatorResult:
     """A class to hold data for engines results either anonymize or deanonymize."""
 
@@ -9,6 +14,34 @@ class OperatorResult:
         self.text = text
         self.operator = operator_name
 
+    def to_dict(self) -> Dict:
+        """
+        Serialize self to dictionary.
+
+        :return: a dictionary
+        """
+        return {
+            "start": self.start,
+            "end": self.end,
+            "entity_type": self.entity_type,
+            "text": self.text,
+            "operator": self.operator,
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize self to a JSON string.
+
+        :return: a JSON string
+        """
+        return (
+            f'{{"start": {encode_json_value(self.start)}, '
+            f'"end": {encode_json_value(self.end)}, '
+            f'"entity_type": {encode_json_value(self.entity_type)}, '
+            f'"text": {encode_json_value(self.text, default=lambda x: x.__dict__)}, '
+            f'"operator": {encode_json_value(self.operator)}}}'
+        )
+
     def __eq__(self, other: 'OperatorResult') -> bool:
         """
         Verify two OperatorResults are equal.
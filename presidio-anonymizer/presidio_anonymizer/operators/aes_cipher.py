@@ -1,4 +1,5 @@
 import base64
+from typing import List
 
 from Crypto import Random
 from Crypto.Cipher import AES
@@ -42,6 +43,106 @@ class AESCipher:
         )
         return decrypted_text.decode("utf-8")
 
+    @staticmethod
+    def encrypt_bulk(key: bytes, texts: List[str]) -> List[str]:
+        """
+        Encrypts multiple texts using AES cypher in CBC mode.
+
+        Gives the same results as encrypting each text separately, but the key is
+        expanded once, the IVs of all texts are read at once, and the n-th blocks
+        of all texts are encrypted together.
+        :param key: AES encryption key in bytes.
+        :param texts: The texts for encryption.
+        :returns: The encrypted texts.
+        """
+        block_size = AES.block_size
+        padded_texts = [pad(text.encode("utf-8"), block_size) for text in texts]
+        ivs = Random.new().read(block_size * len(texts))
+        # CBC mode XORs each block with the previous encrypted block (the IV for
+        # the first block), so it is the same as encrypting the XORed blocks in
+        # ECB mode
+        cipher = AES.new(key, AES.MODE_ECB)
+
+        previous_blocks = [
+            ivs[index: index + block_size] for index in range(0, len(ivs), block_size)
+        ]
+        encrypted_texts = [[iv] for iv in previous_blocks]
+        remaining = list(range(len(texts)))
+        offset = 0
+        while remaining:
+            blocks = b"".join(
+                padded_texts[index][offset: offset + block_size] for index in remaining
+            )
+            encrypted_blocks = cipher.encrypt(
+                AESCipher.__xor(
+                    blocks, b"".join(previous_blocks[index] for index in remaining)
+                )
+            )
+            for position, index in enumerate(remaining):
+                block = encrypted_blocks[
+                    position * block_size: (position + 1) * block_size
+                ]
+                previous_blocks[index] = block
+                encrypted_texts[index].append(block)
+
+            offset += block_size
+            remaining = [
+                index for index in remaining if len(padded_texts[index]) > offset
+            ]
+
+        return [
+            base64.b64encode(b"".join(encrypted_text)).decode()
+            for encrypted_text in encrypted_texts
+        ]
+
+    @staticmethod
+    def decrypt_bulk(key: bytes, texts: List[str]) -> List[str]:
+        """
+        Decrypts multiple previously AES-CBC encrypted texts.
+
+        Gives the same results as decrypting each text separately, but the blocks
+        of all texts are decrypted together.
+        :param key: AES encryption key in bytes.
+        :param texts: The texts for decryption.
+        :returns: The decrypted texts.
+        """
+        block_size = AES.block_size
+        decoded_texts = [base64.b64decode(text) for text in texts]
+        if any(
+            len(decoded_text) < 2 * block_size or len(decoded_text) % block_size
+            for decoded_text in decoded_texts
+        ):
+            # Invalid texts, let the CBC mode raise the error
+            return [AESCipher.decrypt(key, text) for text in texts]
+
+        # CBC mode XORs each decrypted block with the previous encrypted block
+        # (the IV for the first block), so all blocks can be decrypted at once
+        # in ECB mode
+        cipher = AES.new(key, AES.MODE_ECB)
+        decrypted_blocks = AESCipher.__xor(
+            cipher.decrypt(
+                b"".join(decoded_text[block_size:] for decoded_text in decoded_texts)
+            ),
+            b"".join(decoded_text[:-block_size] for decoded_text in decoded_texts),
+        )
+
+        decrypted_texts = []
+        offset = 0
+        for decoded_text in decoded_texts:
+            length = len(decoded_text) - block_size
+            decrypted_text = unpad(
+                decrypted_blocks[offset: offset + length], block_size
+            )
+            decrypted_texts.append(decrypted_text.decode("utf-8"))
+            offset += length
+        return decrypted_texts
+
+    @staticmethod
+    def __xor(first: bytes, second: bytes) -> bytes:
+        return (
+            int.from_bytes(first, "big") ^ int.from_bytes(second, "big")
+        ).to_bytes(len(first), "big")
+
     @staticmethod
     def is_valid_key_size(key: bytes) -> bool:
         """
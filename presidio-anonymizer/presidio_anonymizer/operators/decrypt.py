@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.operators import Operator
@@ -26,6 +26,18 @@ class Decrypt(Operator):
         decrypted_text = AESCipher.decrypt(key=encoded_key, text=text)
         return decrypted_text
 
+    def operate_bulk(self, texts: List[str], params: Dict = None) -> List[str]:
+        """
+        Decrypt multiple texts with the same key.
+
+        :param texts: The texts for decryption.
+        :param params:
+            * *key* The key supplied by the user for the encryption.
+        :return: The decrypted texts
+        """
+        encoded_key = params.get(self.KEY).encode("utf8")
+        return AESCipher.decrypt_bulk(encoded_key, texts)
+
     def validate(self, params: Dict = None) -> None:
         """
         Validate Decrypt parameters.
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.operators import Operator, OperatorType
@@ -24,6 +24,18 @@ class Encrypt(Operator):
         encrypted_text = AESCipher.encrypt(encoded_key, text)
         return encrypted_text
 
+    def operate_bulk(self, texts: List[str], params: Dict = None) -> List[str]:
+        """
+        Encrypt multiple texts with the same key.
+
+        :param texts: The texts for encryption.
+        :param params:
+            * *key* The key supplied by the user for the encryption.
+        :return: The encrypted texts
+        """
+        encoded_key = params.get(self.KEY).encode("utf8")
+        return AESCipher.encrypt_bulk(encoded_key, texts)
+
     def validate(self, params: Dict = None) -> None:
         """
         Validate Encrypt parameters.
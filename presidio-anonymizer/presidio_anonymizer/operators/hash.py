@@ -1,32 +1,55 @@
 """Hashes the PII text entity."""
+import hmac
+from functools import lru_cache
 from hashlib import sha256, sha512, md5
-from typing import Dict
+from typing import Dict, List, Callable, Tuple, Optional
 
 from presidio_anonymizer.operators import Operator, OperatorType
-from presidio_anonymizer.services.validators import validate_parameter_in_range
+from presidio_anonymizer.services.validators import (
+    validate_parameter_in_range,
+    validate_type,
+)
+from presidio_anonymizer.entities import InvalidParamException
 
 
 class Hash(Operator):
-    """Hash given text with sha256/sha512/md5 algorithm."""
+    """
+    Hash given text with sha256/sha512/md5 algorithm.
+
+    If a key is given, the text is hashed with HMAC, using the key and the hash
+    algorithm. The keyed hash state is created once and copied for each text.
+
+    If a cache size is given, the digests of the last hashed texts are kept,
+    so repeated texts (e.g. the same email in many rows) are hashed once.
+    The operator is created once per engine call (or batch), so the cache
+    is scoped to it, and it is cleared when the operator is closed.
+    """
 
     HASH_TYPE = "hash_type"
+    KEY = "key"
+    CACHE_SIZE = "cache_size"
     SHA256 = "sha256"
     SHA512 = "sha512"
     MD5 = "md5"
 
+    HASH_FUNCTIONS = {SHA256: sha256, SHA512: sha512, MD5: md5}
+
+    def __init__(self):
+        # Hashing functions by their hash type, key and cache size
+        self.__hashers: Dict[Tuple[str, Optional[str], int], Callable] = {}
+
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
         Hash given value using sha256.
 
         :return: hashed original text
         """
-        hash_type = self._get_hash_type_or_default(params)
-        hash_switcher = {
-            self.SHA256: lambda s: sha256(s),
-            self.SHA512: lambda s: sha512(s),
-            self.MD5: lambda s: md5(s),
-        }
-        return hash_switcher.get(hash_type)(text.encode()).hexdigest()
+        return self.__get_hasher(params)(text)
+
+    def operate_bulk(self, texts: List[str], params: Dict = None) -> List[str]:
+        """Hash multiple texts, creating the hash state once."""
+        hasher = self.__get_hasher(params)
+        return [hasher(text) for text in texts]
 
     def validate(self, params: Dict = None) -> None:
         """Validate the hash type is string and in range of allowed hash types."""
@@ -36,7 +59,21 @@ class Hash(Operator):
             self.HASH_TYPE,
             str,
         )
-        pass
+        validate_type(params.get(self.KEY), self.KEY, str)
+        cache_size = params.get(self.CACHE_SIZE)
+        validate_type(cache_size, self.CACHE_SIZE, int)
+        if cache_size is not None and cache_size < 0:
+            raise InvalidParamException(
+                f"Invalid input, {self.CACHE_SIZE} must be a non-negative number"
+            )
+
+    def close(self) -> None:
+        """Clear the cached digests and hash states."""
+        for hasher in self.__hashers.values():
+            cache_clear = getattr(hasher, "cache_clear", None)
+            if cache_clear:
+                cache_clear()
+        self.__hashers.clear()
 
     def operator_name(self) -> str:
         """Return operator name."""
@@ -48,3 +85,33 @@ class Hash(Operator):
     def operator_type(self) -> OperatorType:
         """Return operator type."""
         return OperatorType.Anonymize
+
+    def __get_hasher(self, params: Dict) -> Callable[[str], str]:
+        """Get a function hashing a text, creating it on first use."""
+        hash_type = self._get_hash_type_or_default(params)
+        key = params.get(self.KEY)
+        cache_size = params.get(self.CACHE_SIZE) or 0
+        hasher_key = (hash_type, key, cache_size)
+        hasher = self.__hashers.get(hasher_key)
+        if hasher is None:
+            hasher = self.__create_hasher(self.HASH_FUNCTIONS[hash_type], key)
+            if cache_size:
+                hasher = lru_cache(maxsize=cache_size)(hasher)
+            self.__hashers[hasher_key] = hasher
+        return hasher
+
+    @staticmethod
+    def __create_hasher(
+        hash_function: Callable, key: Optional[str]
+    ) -> Callable[[str], str]:
+        if key is None:
+            return lambda text: hash_function(text.encode()).hexdigest()
+
+        keyed_hash = hmac.new(key.encode(), digestmod=hash_function)
+
+        def hash_with_key(text: str) -> str:
+            text_hash = keyed_hash.copy()
+            text_hash.update(text.encode())
+            return text_hash.hexdigest()
+
+        return hash_with_key
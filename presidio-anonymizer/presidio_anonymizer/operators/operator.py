@@ -1,7 +1,7 @@
 """Operator abstraction - each operator should implement this class."""
 from abc import abstractmethod, ABC
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 
 
 class OperatorType(Enum):
@@ -22,6 +22,23 @@ class Operator(ABC):
         """Operate method to be implemented in each operator."""
         pass
 
+    def operate_bulk(self, texts: List[str], params: Dict = None) -> List[str]:
+        """
+        Operate on multiple texts with the same parameters.
+
+        Calls operate on each text. Operators which can share work between
+        texts can override it.
+        """
+        return [self.operate(text=text, params=params) for text in texts]
+
+    def close(self) -> None:
+        """
+        Release the state kept by the operator between operate calls.
+
+        Called by the engines once they are done with the operator.
+        """
+        pass
+
     @abstractmethod
     def validate(self, params: Dict = None) -> None:
         """Validate each operator parameters."""
@@ -0,0 +1,75 @@
+"""Encode objects with a known set of fields to JSON strings."""
+import json
+import math
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Iterable, Tuple
+
+
+def _encode_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == math.inf:
+        return "Infinity"
+    if value == -math.inf:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+# Encoders of the JSON primitive types, by their exact type.
+# Subclasses (e.g. numpy floats) are encoded by json.dumps
+_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+def encode_json_value(
+    value: Any, default: Callable = None, sort_keys: bool = False
+) -> str:
+    """
+    Encode a value to a JSON string, identical to the output of json.dumps.
+
+    Strings, numbers, booleans and None are encoded directly,
+    other values are encoded with json.dumps.
+
+    :param value: The value to encode
+    :param default: A function returning a serializable version of objects
+    json.dumps can not serialize (as in json.dumps)
+    :param sort_keys: Whether to sort the keys of dictionaries (as in json.dumps)
+    :return: The JSON string
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    return json.dumps(value, default=default, sort_keys=sort_keys)
+
+
+def encode_json_object(encoded_fields: Iterable[Tuple[str, str]]) -> str:
+    """
+    Create a JSON object string from its already encoded field values.
+
+    :param encoded_fields: The (name, JSON string) pairs of the object's fields,
+    in the output order
+    :return: The JSON string, formatted as by json.dumps
+    """
+    return (
+        "{"
+        + ", ".join(
+            f"{encode_basestring_ascii(name)}: {encoded_value}"
+            for name, encoded_value in encoded_fields
+        )
+        + "}"
+    )
+
+
+def encode_json_list(encoded_values: Iterable[str]) -> str:
+    """
+    Create a JSON list string from its already encoded values.
+
+    :param encoded_values: The JSON strings of the list's values
+    :return: The JSON string, formatted as by json.dumps
+    """
+    return "[" + ", ".join(encoded_values) + "]"
@@ -302,3 +302,27 @@ def test_given_anonymize_with_encrypt_then_text_returned_with_encrypted_content(
     assert actual_encrypted_text != expected_encrypted_text
     actual_decrypted_text = AESCipher.decrypt(key.encode(), actual_encrypted_text)
     assert actual_decrypted_text == expected_encrypted_text
+
+
+def test_given_batch_in_processes_then_results_are_returned_in_order():
+    texts = [f"my name is person{i}" for i in range(50)]
+    analyzer_results_per_text = [
+        [RecognizerResult("PERSON", 11, len(text), 0.8)] for text in texts
+    ]
+    anonymizers_config = {"PERSON": OperatorConfig("hash", {"hash_type": "md5"})}
+    engine = AnonymizerEngine()
+
+    results = list(
+        engine.anonymize_batch(
+            texts,
+            analyzer_results_per_text,
+            anonymizers_config,
+            n_process=2,
+            batch_size=8,
+        )
+    )
+
+    assert results == [
+        engine.anonymize(text, analyzer_results, anonymizers_config)
+        for text, analyzer_results in zip(texts, analyzer_results_per_text)
+    ]
@@ -85,3 +85,54 @@ def test_given_request_deanonymizers_return_list():
     anon_list = engine.get_deanonymizers()
 
     assert anon_list == expected_list
+
+
+def test_given_batch_then_we_get_the_same_results_as_deanonymizing_each_text():
+    key = "WmZq4t7w!z%C&F)J"
+    texts = ["My name is Chloë", "Call Bob at 212-555-5555"]
+    analyzer_results_per_text = [
+        [RecognizerResult("PERSON", 11, 16, 0.8)],
+        [RecognizerResult("PERSON", 5, 8, 0.8),
+         RecognizerResult("PHONE_NUMBER", 12, 24, 0.8)],
+    ]
+    anonymized = list(AnonymizerEngine().anonymize_batch(
+        texts, analyzer_results_per_text,
+        {"DEFAULT": OperatorConfig("encrypt", {"key": key})}
+    ))
+    entities_per_text = [
+        [AnonymizerResult.from_operator_result(item) for item in result.items]
+        for result in anonymized
+    ]
+    engine = DeanonymizeEngine()
+    operators = {"DEFAULT": OperatorConfig(Decrypt.NAME, {"key": key})}
+
+    results = list(engine.deanonymize_batch(
+        (result.text for result in anonymized), entities_per_text, operators))
+
+    assert [result.text for result in results] == texts
+    for result, anonymized_result, entities in zip(
+            results, anonymized, entities_per_text):
+        assert result == engine.deanonymize(
+            anonymized_result.text, entities, operators)
+
+
+def test_given_batch_with_missing_entities_then_we_fail():
+    engine = DeanonymizeEngine()
+    results = engine.deanonymize_batch(["one", "two"], [[]], {})
+    with pytest.raises(
+            InvalidParamException,
+            match="Invalid input, the number of texts and entities must be equal",
+    ):
+        list(results)
+
+
+def test_given_invalid_operators_then_validate_operators_fails():
+    engine = DeanonymizeEngine()
+    engine.validate_operators(
+        {"PERSON": OperatorConfig(Decrypt.NAME, {"key": "WmZq4t7w!z%C&F)J"})})
+    with pytest.raises(
+            InvalidParamException,
+            match="Invalid input, key must be of length 128, 192 or 256 bits",
+    ):
+        engine.validate_operators(
+            {"PERSON": OperatorConfig(Decrypt.NAME, {"key": "1234"})})
@@ -0,0 +1,94 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from presidio_anonymizer import AnonymizerEngine, DeanonymizeEngine
+from presidio_anonymizer.entities.engine import (
+    AnonymizerResult,
+    OperatorConfig,
+    RecognizerResult,
+)
+
+KEY = "WmZq4t7w!z%C&F)J"
+ENTITY_TYPES = ["PERSON", "PHONE_NUMBER", "LOCATION", "EMAIL_ADDRESS"]
+TEXT = "word " * 40
+
+
+@pytest.fixture
+def short_switch_interval():
+    # switch threads as often as possible, to make races more likely
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def _analyzer_results(entity_type):
+    return [
+        RecognizerResult(entity_type, start, start + 4, 0.8)
+        for start in range(0, len(TEXT), 5)
+    ]
+
+
+def test_given_shared_engine_and_operators_then_concurrent_anonymize_is_correct(
+    short_switch_interval,
+):
+    engine = AnonymizerEngine()
+    operators = {
+        "DEFAULT": OperatorConfig("replace"),
+        "EMAIL_ADDRESS": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 2, "from_end": True}
+        ),
+        "LOCATION": OperatorConfig("custom", {"lambda": lambda text: text.upper()}),
+    }
+    expected = {
+        "PERSON": "<PERSON> " * 40,
+        "PHONE_NUMBER": "<PHONE_NUMBER> " * 40,
+        "LOCATION": "WORD " * 40,
+        "EMAIL_ADDRESS": "wo** " * 40,
+    }
+
+    def anonymize(index):
+        entity_type = ENTITY_TYPES[index % len(ENTITY_TYPES)]
+        result = engine.anonymize(TEXT, _analyzer_results(entity_type), operators)
+        return entity_type, result.text
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(anonymize, range(400)))
+
+    for entity_type, text in results:
+        assert text == expected[entity_type]
+    assert "entity_type" not in operators["DEFAULT"].params
+    assert set(operators) == {"DEFAULT", "EMAIL_ADDRESS", "LOCATION"}
+
+
+def test_given_shared_engines_then_concurrent_encrypt_and_decrypt_round_trip(
+    short_switch_interval,
+):
+    anonymizer = AnonymizerEngine()
+    deanonymizer = DeanonymizeEngine()
+    encrypt = {"DEFAULT": OperatorConfig("encrypt", {"key": KEY})}
+    decrypt = {"DEFAULT": OperatorConfig("decrypt", {"key": KEY})}
+
+    def round_trip(index):
+        entity_type = ENTITY_TYPES[index % len(ENTITY_TYPES)]
+        text = f"my name is person{index}"
+        encrypted = anonymizer.anonymize(
+            text, [RecognizerResult(entity_type, 11, len(text), 0.8)], encrypt
+        )
+        entities = [
+            AnonymizerResult(item.start, item.end, item.entity_type)
+            for item in encrypted.items
+        ]
+        decrypted = deanonymizer.deanonymize(encrypted.text, entities, decrypt)
+        return text, decrypted.text, decrypted.items[0].entity_type, entity_type
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(round_trip, range(200)))
+
+    for text, decrypted_text, decrypted_type, entity_type in results:
+        assert decrypted_text == text
+        assert decrypted_type == entity_type
+    assert encrypt["DEFAULT"].params == {"key": KEY}
+    assert decrypt["DEFAULT"].params == {"key": KEY}
@@ -19,6 +19,18 @@ def test_given_anonymize_then_aes_encrypt_called_and_its_result_is_returned(
     assert anonymized_text == expected_anonymized_text
 
 
+@mock.patch.object(AESCipher, "encrypt_bulk")
+def test_given_bulk_operate_then_aes_encrypt_bulk_called_once_with_the_encoded_key(
+        mock_encrypt_bulk,
+):
+    mock_encrypt_bulk.return_value = ["first", "second"]
+
+    texts = Encrypt().operate_bulk(texts=["a", "b"], params={"key": "key"})
+
+    assert texts == ["first", "second"]
+    mock_encrypt_bulk.assert_called_once_with(b"key", ["a", "b"])
+
+
 def test_given_verifying_an_valid_length_key_no_exceptions_raised():
     Encrypt().validate(params={"key": "128bitslengthkey"})
 
@@ -1,3 +1,6 @@
+from hashlib import sha256
+from unittest import mock
+
 import pytest
 
 from presidio_anonymizer.operators import Hash
@@ -123,6 +126,84 @@ def test_when_hash_type_is_empty_string_then_ipe_raised():
         Hash().validate(params)
 
 
+@pytest.mark.parametrize(
+    "text, hash_type, anonymized_text",
+    [
+        # fmt: off
+        (
+            "123456",
+            "sha256",
+            "4df81f55d708ae1720d5f65ef42f3475dc168fa23fde424ac5944f87c309b05f",
+        ),  # HMAC-Sha256 123456
+        (
+            "😈😈😈😈",
+            "sha256",
+            "b602291fd69e0a7e6a288115c79b02f9d72203e6a118a508d19645570a73ddd1",
+        ),  # HMAC-Sha256 'Unicode EmojiSources' character
+        ("123456", "md5", "0abf6bacd23c55fa6ab14eb44a7f5720"),  # HMAC-MD5 123456
+        # fmt: on
+    ],
+)
+def test_when_given_key_then_expected_hmac_string_returned(
+    text, hash_type, anonymized_text
+):
+    params = {"hash_type": hash_type, "key": "key"}
+    operator = Hash()
+
+    assert operator.operate(text=text, params=params) == anonymized_text
+    assert operator.operate_bulk(texts=[text, text], params=params) == [
+        anonymized_text,
+        anonymized_text,
+    ]
+
+
+def test_when_given_cache_size_then_repeated_texts_are_hashed_once():
+    counting_sha256 = mock.Mock(wraps=sha256)
+    operator = Hash()
+    params = {"cache_size": 2}
+
+    with mock.patch.dict(Hash.HASH_FUNCTIONS, {"sha256": counting_sha256}):
+        texts = operator.operate_bulk(
+            texts=["123456", "54321", "123456", "54321"], params=params
+        )
+        assert operator.operate(text="123456", params=params) == texts[0]
+        assert counting_sha256.call_count == 2
+
+        operator.close()
+        operator.operate(text="123456", params=params)
+        assert counting_sha256.call_count == 3
+
+    assert texts[0] == Hash().operate(text="123456", params={})
+    assert texts[1] == Hash().operate(text="54321", params={})
+
+
+def test_when_cache_size_is_exceeded_then_least_recently_used_text_is_hashed_again():
+    counting_sha256 = mock.Mock(wraps=sha256)
+    operator = Hash()
+    params = {"cache_size": 1}
+
+    with mock.patch.dict(Hash.HASH_FUNCTIONS, {"sha256": counting_sha256}):
+        operator.operate_bulk(texts=["1", "1", "2", "1"], params=params)
+
+    assert counting_sha256.call_count == 3
+
+
+def test_when_key_is_not_a_string_then_ipe_raised():
+    with pytest.raises(
+        InvalidParamException,
+        match="Invalid parameter value for key. Expecting 'string', but got 'number'.",
+    ):
+        Hash().validate({"key": 1})
+
+
+def test_when_cache_size_is_negative_then_ipe_raised():
+    with pytest.raises(
+        InvalidParamException,
+        match="Invalid input, cache_size must be a non-negative number",
+    ):
+        Hash().validate({"cache_size": -1})
+
+
 def test_when_validate_anonymizer_then_correct_name():
     assert Hash().operator_name() == "hash"
 
@@ -26,6 +26,37 @@ def test_given_valid_key_and_text_then_text_encryption_and_decryption_returns_sa
     assert text == decrypted_text
 
 
+@pytest.mark.parametrize(
+    # fmt: off
+    "key",
+    [
+        b'1111111111111111',  # 16 bits key
+        b'111111111111111111111111',  # 24 bits key
+        b'11111111111111111111111111111111',  # 32 bits key
+    ],
+    # fmt: on
+)
+def test_given_texts_then_bulk_encryption_and_decryption_match_single_text_methods(
+    key
+):
+    texts = ["", "text_for_encryption", "PII with a Résumé", "面汤", "😈😈😈😈",
+             "a text which is longer than a few AES blocks of 16 bytes"]
+
+    encrypted_texts = AESCipher.encrypt_bulk(key, texts)
+
+    assert len(set(encrypted_texts)) == len(texts)
+    assert [AESCipher.decrypt(key, text) for text in encrypted_texts] == texts
+    assert AESCipher.decrypt_bulk(key, encrypted_texts) == texts
+    assert AESCipher.decrypt_bulk(
+        key, [AESCipher.encrypt(key, text) for text in texts]
+    ) == texts
+
+
+def test_given_invalid_encrypted_text_then_bulk_decryption_raises_value_error():
+    with pytest.raises(ValueError, match="Incorrect IV length"):
+        AESCipher.decrypt_bulk(b"1111111111111111", ["abcd"])
+
+
 def test_given_invalid_key_length_then_value_error_raised():
     invalid_length_key = b"1111"
     with pytest.raises(ValueError, match="Incorrect AES key length"):
@@ -1,3 +1,6 @@
+import re
+import types
+from unittest import mock
 from typing import Dict, List
 
 import pytest
@@ -12,7 +15,7 @@ from presidio_anonymizer.entities.engine.result import \
     OperatorResult
 from presidio_anonymizer.entities.engine.result.engine_result import \
     EngineResult
-from presidio_anonymizer.operators import OperatorType
+from presidio_anonymizer.operators import OperatorType, Replace, Hash
 
 
 def test_given_request_anonymizers_return_list():
@@ -147,6 +150,231 @@ def test_given_several_results_then_we_filter_them_and_get_correct_mocked_result
     assert result.items[0].text == "text"
 
 
+def test_given_conflicting_results_then_we_keep_non_conflicting_in_input_order():
+    analyzer_results = [
+        RecognizerResult(start=30, end=40, score=0.5, entity_type="PHONE_NUMBER"),
+        RecognizerResult(start=0, end=10, score=0.7, entity_type="PERSON"),
+        RecognizerResult(start=0, end=10, score=0.7, entity_type="NAME"),
+        RecognizerResult(start=0, end=10, score=0.4, entity_type="LOCATION"),
+        RecognizerResult(start=2, end=8, score=0.9, entity_type="FIRST_NAME"),
+        RecognizerResult(start=5, end=15, score=0.6, entity_type="DATE_TIME"),
+        RecognizerResult(start=32, end=40, score=0.9, entity_type="US_BANK_NUMBER"),
+    ]
+
+    results = AnonymizerEngine()._remove_conflicts_and_get_text_manipulation_data(
+        analyzer_results
+    )
+
+    assert results == [
+        RecognizerResult(start=30, end=40, score=0.5, entity_type="PHONE_NUMBER"),
+        RecognizerResult(start=0, end=10, score=0.7, entity_type="NAME"),
+        RecognizerResult(start=5, end=15, score=0.6, entity_type="DATE_TIME"),
+    ]
+
+
+def test_given_several_entities_then_each_operator_config_is_validated_once():
+    calls = []
+
+    def to_upper(text):
+        calls.append(text)
+        return text.upper()
+
+    engine = AnonymizerEngine()
+    analyzer_results = [
+        RecognizerResult(start=0, end=4, score=0.8, entity_type="NAME"),
+        RecognizerResult(start=5, end=8, score=0.8, entity_type="NAME"),
+        RecognizerResult(start=9, end=13, score=0.8, entity_type="NAME"),
+    ]
+    result = engine.anonymize(
+        "jane bob dave",
+        analyzer_results,
+        {"NAME": OperatorConfig("custom", {"lambda": to_upper})},
+    )
+
+    assert result.text == "JANE BOB DAVE"
+    assert calls == ["PII", "dave", "bob", "jane"]
+
+
+def test_given_batch_then_we_get_the_same_results_as_anonymizing_each_text():
+    engine = AnonymizerEngine()
+    texts = ["my name is Jane", "please call 555-1234", "nothing here"]
+    analyzer_results_per_text = [
+        [RecognizerResult("NAME", 11, 15, 0.8)],
+        [
+            RecognizerResult("PHONE_NUMBER", 12, 20, 0.8),
+            RecognizerResult("NUMBER", 16, 20, 0.8),
+        ],
+        [],
+    ]
+    operators = {
+        "NAME": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 2, "from_end": True}
+        )
+    }
+
+    results = engine.anonymize_batch(texts, analyzer_results_per_text, operators)
+
+    assert isinstance(results, types.GeneratorType)
+    assert list(results) == [
+        engine.anonymize(text, analyzer_results, operators)
+        for text, analyzer_results in zip(texts, analyzer_results_per_text)
+    ]
+
+
+def test_given_batch_with_missing_analyzer_results_then_we_fail():
+    engine = AnonymizerEngine()
+    results = engine.anonymize_batch(["one", "two"], [[]])
+    with pytest.raises(
+            InvalidParamException,
+            match="Invalid input, the number of texts and analyzer results "
+                  "must be equal",
+    ):
+        list(results)
+
+
+def test_given_invalid_operators_then_validate_operators_fails():
+    engine = AnonymizerEngine()
+    engine.validate_operators(None)
+    engine.validate_operators({"PERSON": OperatorConfig("hash")})
+    with pytest.raises(
+            InvalidParamException,
+            match="Parameter hash_type value md4 is not in range of values",
+    ):
+        engine.validate_operators(
+            {"PERSON": OperatorConfig("hash", {"hash_type": "md4"})})
+
+
+def test_given_non_overlapping_entities_then_operate_bulk_is_called_per_entity_type():
+    engine = AnonymizerEngine()
+    analyzer_results = [
+        RecognizerResult(start=0, end=4, score=0.8, entity_type="NAME"),
+        RecognizerResult(start=9, end=13, score=0.8, entity_type="NAME"),
+        RecognizerResult(start=5, end=8, score=0.8, entity_type="CITY"),
+    ]
+    with mock.patch.object(
+            Replace, "operate_bulk", autospec=True,
+            side_effect=lambda self, texts, params: [t.upper() for t in texts]
+    ) as mock_operate_bulk:
+        result = engine.anonymize("jane bob dave", analyzer_results,
+                                  {"DEFAULT": OperatorConfig("replace")})
+
+    assert result.text == "JANE BOB DAVE"
+    called_texts = sorted(
+        call.kwargs["texts"] for call in mock_operate_bulk.call_args_list
+    )
+    assert called_texts == [["bob"], ["dave", "jane"]]
+
+
+def test_given_overlapping_entities_then_each_is_operated_on_the_replaced_text():
+    engine = AnonymizerEngine()
+    analyzer_results = [
+        RecognizerResult(start=0, end=6, score=0.8, entity_type="FIRST"),
+        RecognizerResult(start=4, end=9, score=0.8, entity_type="SECOND"),
+    ]
+    result = engine.anonymize(
+        "jane bob dave",
+        analyzer_results,
+        {"DEFAULT": OperatorConfig("custom", {"lambda": lambda text: f"[{text}]"})},
+    )
+
+    assert result.text == "[jane[ ][ bob ]dave"
+
+
+def test_given_anonymize_and_anonymize_batch_then_operators_are_closed_once():
+    engine = AnonymizerEngine()
+    analyzer_results = [
+        RecognizerResult(start=0, end=4, score=0.8, entity_type="NAME"),
+    ]
+    operators = {"DEFAULT": OperatorConfig("hash", {"cache_size": 10})}
+    with mock.patch.object(Hash, "close", autospec=True) as mock_close:
+        engine.anonymize("jane bob", analyzer_results, operators)
+        assert mock_close.call_count == 1
+
+        results = engine.anonymize_batch(
+            ["jane bob"] * 3, [analyzer_results] * 3, operators
+        )
+        assert len(list(results)) == 3
+        assert mock_close.call_count == 2
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "chunk_size, overlap, part_size",
+    [
+        (1, 20, 1),
+        (7, 20, 3),
+        (10, 30, 100),
+        (50, 20, 7),
+        (1000, 0, 1000),
+    ],
+    # fmt: on
+)
+def test_given_stream_then_we_get_the_same_text_as_anonymizing_the_entire_text(
+        chunk_size, overlap, part_size
+):
+    text = ("My name is John Smith, my phone is 212-555-5555.\n"
+            "John Smith's email is john@example.com, call 212-555-5555 ") * 5
+    parts = [text[i:i + part_size] for i in range(0, len(text), part_size)]
+    engine = AnonymizerEngine()
+    analyzed_windows = []
+
+    def analyze(window: str) -> List[RecognizerResult]:
+        analyzed_windows.append(window)
+        return _find_pii(window)
+
+    chunks = list(engine.anonymize_stream(
+        parts, analyze, chunk_size=chunk_size, overlap=overlap))
+
+    expected = engine.anonymize(text, _find_pii(text)).text
+    assert "".join(chunks) == expected
+    assert max(len(window) for window in analyzed_windows) <= \
+        chunk_size + 2 * overlap + part_size
+
+
+def test_given_entity_crossing_chunk_end_then_chunk_is_extended_to_its_end():
+    engine = AnonymizerEngine()
+    chunks = list(engine.anonymize_stream(
+        ["call ", "212-555", "-5555 ", "now"], _find_pii, chunk_size=8, overlap=13))
+
+    assert chunks == ["call <PHONE_NUMBER>", " now"]
+
+
+def test_given_empty_stream_then_nothing_is_returned():
+    engine = AnonymizerEngine()
+    assert list(engine.anonymize_stream(["", ""], _find_pii)) == []
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "chunk_size, overlap, message",
+    [
+        (0, 10, "Invalid input, chunk_size must be a positive number"),
+        (10, -1, "Invalid input, overlap must be a non-negative number"),
+    ],
+    # fmt: on
+)
+def test_given_invalid_chunk_size_or_overlap_then_we_fail(
+        chunk_size, overlap, message
+):
+    engine = AnonymizerEngine()
+    with pytest.raises(InvalidParamException, match=message):
+        list(engine.anonymize_stream(
+            ["text"], _find_pii, chunk_size=chunk_size, overlap=overlap))
+
+
+def _find_pii(text: str) -> List[RecognizerResult]:
+    patterns = {
+        "PERSON": r"\bJohn Smith\b",
+        "PHONE_NUMBER": r"\b\d{3}-\d{3}-\d{4}\b",
+        "EMAIL_ADDRESS": r"\b\w+@example\.com\b",
+    }
+    return [
+        RecognizerResult(entity_type, match.start(), match.end(), 0.8)
+        for entity_type, pattern in patterns.items()
+        for match in re.finditer(pattern, text)
+    ]
+
+
 def _operate(text: str,
              text_metadata: List[PIIEntity],
              operators: Dict[str, OperatorConfig],
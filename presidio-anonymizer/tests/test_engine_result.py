@@ -1,3 +1,5 @@
+import json
+
 from presidio_anonymizer.entities.engine.result import \
     OperatorResult
 from presidio_anonymizer.entities.engine.result.engine_result import \
@@ -54,3 +56,43 @@ def test_when_not_eq_called_then_instances_are_not_equal():
     res2.set_text("b")
 
     assert res.__eq__(res2) is False
+
+
+def test_when_to_json_then_output_is_identical_to_serializing_the_fields():
+    items = [
+        OperatorResult("<NAME>", "replace", 3, 9, "NAME"),
+        OperatorResult("Résumé \"😈\"", "custom", 10, 20, "TITLE"),
+    ]
+    res = EngineResult("My <NAME> Résumé \"😈\"\n", items)
+
+    assert res.to_json() == json.dumps(res, default=lambda x: x.__dict__)
+    assert EngineResult().to_json() == '{"text": null, "items": []}'
+
+
+def test_when_to_dict_then_fields_and_items_are_serialized():
+    res = EngineResult("a", [OperatorResult("b", "hash", 0, 1, "NAME")])
+
+    assert res.to_dict() == {
+        "text": "a",
+        "items": [
+            {
+                "start": 0,
+                "end": 1,
+                "entity_type": "NAME",
+                "text": "b",
+                "operator": "hash",
+            }
+        ],
+    }
+    assert json.loads(res.to_json()) == res.to_dict()
+
+
+def test_when_to_json_then_output_is_identical_to_dumping_to_dict():
+    items = [
+        OperatorResult("<NAME>", "replace", 3, 9, "NAME"),
+        OperatorResult("Résumé \"😈\"", "custom", 10, 20, "TITLE"),
+    ]
+    res = EngineResult("My <NAME> Résumé \"😈\"\n", items)
+
+    assert res.to_dict().keys() == vars(res).keys()
+    assert res.to_json() == json.dumps(res.to_dict())
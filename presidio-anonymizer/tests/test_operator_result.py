@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from presidio_anonymizer.entities.engine.result import OperatorResult
@@ -33,3 +35,10 @@ def test_given_idenctical_decrypt_results_item_they_are_equal():
 def test_given_changed_decrypt_results_item_they_are_equal(result_item):
     result_1 = OperatorResult("bla", "decrypt", 0, 3, "NAME")
     assert result_1 != result_item
+
+
+def test_given_operator_result_then_to_json_is_identical_to_dumping_to_dict():
+    result = OperatorResult("Résumé \"😈\"", "custom", 10, 20, "TITLE")
+
+    assert result.to_dict() == vars(result)
+    assert result.to_json() == json.dumps(result.to_dict())
@@ -65,3 +65,27 @@ def test_given_text_and_bad_indices_then_we_get_fail(original_text, start, end):
     )
     with pytest.raises(InvalidParamException, match=err_msg):
         text_replace_builder.get_text_in_position(start, end)
+
+
+def test_given_several_replacements_then_we_get_output_text_and_positions():
+    text_replace_builder = TextReplaceBuilder("My name is Jane Doe, call 555-1234")
+    text_replace_builder.replace_text("<PHONE>", 26, 34)
+    text_replace_builder.replace_text("<NAME>", 11, 19)
+    text_replace_builder.replace_text("I", 0, 2)
+
+    assert text_replace_builder.output_text == "I name is <NAME>, call <PHONE>"
+    assert text_replace_builder.get_replacement_positions() == [
+        (23, 30),
+        (10, 16),
+        (0, 1),
+    ]
+
+
+def test_given_overlapping_replacements_then_we_keep_the_later_replacement():
+    text_replace_builder = TextReplaceBuilder("hello world")
+    text_replace_builder.replace_text("<B>", 4, 11)
+    assert text_replace_builder.get_text_in_position(2, 6) == "ll<B"
+    text_replace_builder.replace_text("<A>", 2, 6)
+
+    assert text_replace_builder.output_text == "he<A><B>"
+    assert text_replace_builder.get_replacement_positions() == [(5, 8), (2, 5)]
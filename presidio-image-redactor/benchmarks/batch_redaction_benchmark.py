@@ -0,0 +1,77 @@
+"""
+Benchmark redacting a batch of scanned pages, one by one and as a batch.
+
+Creates pages of text with PII, and redacts them with redact (one page at a time)
+and with redact_batch, performing OCR on the pages with a pool of threads.
+Requires Tesseract to be installed. Tesseract uses multiple threads per image
+by default, set OMP_THREAD_LIMIT=1 to compare against a single threaded OCR.
+
+Usage (from the presidio-image-redactor folder):
+
+    python benchmarks/batch_redaction_benchmark.py
+"""
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from presidio_image_redactor import ImageRedactorEngine
+
+PAGE_COUNT = 40
+LINES_PER_PAGE = 20
+WORKERS = [1, 2, 4, 8]
+
+
+def create_page(index):
+    """Create an image of a page of text with PII."""
+    page = Image.new("RGB", (1200, 40 * LINES_PER_PAGE + 40), (255, 255, 255))
+    draw = ImageDraw.Draw(page)
+    font = ImageFont.load_default()
+    for line in range(LINES_PER_PAGE):
+        draw.text(
+            (20, 20 + 40 * line),
+            f"Customer {index}-{line} email is user{line}@example.com "
+            f"and phone number is 212-555-{1000 + line}",
+            fill=(0, 0, 0),
+            font=font,
+        )
+    return page.resize((page.width * 2, page.height * 2))
+
+
+def timed(name, function, *args):
+    """Run a function and print its duration."""
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{name:<25} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def redact_one_by_one(engine, pages):
+    """Redact each page separately."""
+    return [engine.redact(page) for page in pages]
+
+
+def redact_batch(engine, pages, n_workers):
+    """Redact the pages as a batch."""
+    return list(engine.redact_batch(pages, n_workers=n_workers))
+
+
+def main():
+    """Run the benchmark."""
+    pages = [create_page(index) for index in range(PAGE_COUNT)]
+    engine = ImageRedactorEngine()
+    # Load the NLP models before timing
+    engine.redact(pages[0])
+
+    print(f"{PAGE_COUNT} pages")
+    expected = timed("redact", redact_one_by_one, engine, pages)
+    for n_workers in WORKERS:
+        redacted = timed(
+            f"redact_batch, {n_workers} workers", redact_batch, engine, pages, n_workers
+        )
+        assert [page.tobytes() for page in redacted] == [
+            page.tobytes() for page in expected
+        ]
+
+
+if __name__ == "__main__":
+    main()
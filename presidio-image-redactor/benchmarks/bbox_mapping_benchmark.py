@@ -0,0 +1,75 @@
+"""
+Benchmark mapping analyzer results to bounding boxes on dense OCR pages.
+
+Maps the entities of a page with many OCR words (e.g. a dense scanned form)
+to the bounding boxes of their words.
+
+Usage (from the presidio-image-redactor folder):
+
+    python benchmarks/bbox_mapping_benchmark.py
+"""
+import random
+import time
+
+from presidio_analyzer import RecognizerResult
+
+from presidio_image_redactor import ImageAnalyzerEngine
+
+PAGES = [(1000, 100), (5000, 500), (20000, 2000)]
+REPEAT = 10
+
+
+def create_page(word_count, entity_count):
+    """Create the OCR results, text and analyzer results of a page."""
+    rand = random.Random(word_count)
+    words = [
+        rand.choice(["", "John", "Smith", "was", "born", "on", "1/1/1970", "ID:"])
+        for _ in range(word_count)
+    ]
+    ocr_result = {
+        "text": words,
+        "left": list(range(word_count)),
+        "top": [0] * word_count,
+        "width": [10] * word_count,
+        "height": [10] * word_count,
+    }
+    word_starts = []
+    pos = 0
+    for word in words:
+        word_starts.append(pos)
+        pos += len(word) + 1
+
+    word_indexes = [index for index, word in enumerate(words) if word]
+    analyzer_results = []
+    for index in sorted(rand.sample(word_indexes[:-1], entity_count)):
+        # Entities of one or two words
+        last = index + rand.choice([0, 1])
+        analyzer_results.append(
+            RecognizerResult(
+                "PERSON",
+                word_starts[index],
+                word_starts[last] + len(words[last]),
+                0.85,
+            )
+        )
+    return ocr_result, " ".join(words), analyzer_results
+
+
+def main():
+    """Run the benchmark."""
+    for word_count, entity_count in PAGES:
+        ocr_result, text, analyzer_results = create_page(word_count, entity_count)
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes(
+                analyzer_results, ocr_result, text
+            )
+        duration = (time.perf_counter() - start) / REPEAT
+        print(
+            f"{word_count:>6} words, {entity_count:>5} entities "
+            f"{duration * 1000:10.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ import logging
 
 from .ocr import OCR
 from .tesseract_ocr import TesseractOCR
+from .ocr_cache import OCRCache, MemoryOCRCache, DiskOCRCache
+from .cached_ocr import CachedOCR
+from .image_preprocessor import ImagePreprocessor
+from .preprocessing_ocr import PreprocessingOCR
 from .image_analyzer_engine import ImageAnalyzerEngine
 from .image_redactor_engine import ImageRedactorEngine
 from .image_pii_verify_engine import ImagePiiVerifyEngine
@@ -13,6 +17,12 @@ logging.getLogger("presidio-image-redactor").addHandler(logging.NullHandler())
 __all__ = [
     "OCR",
     "TesseractOCR",
+    "OCRCache",
+    "MemoryOCRCache",
+    "DiskOCRCache",
+    "CachedOCR",
+    "ImagePreprocessor",
+    "PreprocessingOCR",
     "ImageAnalyzerEngine",
     "ImageRedactorEngine",
     "ImagePiiVerifyEngine",
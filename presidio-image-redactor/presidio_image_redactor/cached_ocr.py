@@ -0,0 +1,88 @@
+import hashlib
+import threading
+from typing import Optional
+
+from PIL import Image
+
+from presidio_image_redactor.ocr import OCR
+from presidio_image_redactor.ocr_cache import OCRCache, MemoryOCRCache
+
+FILE_READ_SIZE = 1 << 20
+
+
+class CachedOCR(OCR):
+    """OCR class that caches the results of another OCR.
+
+    The results are cached by a hash of the image content and the OCR config,
+    so OCR is performed once for identical images (e.g. letterheads,
+    templated forms or re-submitted documents), whatever object they are
+    given as (PIL Image, numpy array or file path).
+
+    :param ocr: The OCR object performing OCR on images missing in the cache
+    :param cache: The cache to store the results in, e.g. MemoryOCRCache or
+    DiskOCRCache. Defaults to a MemoryOCRCache
+    :param ocr_config: A description of the configuration of the OCR object
+    (e.g. its language and settings), included in the cache keys, so results
+    of different configurations sharing a cache are kept separately
+    """
+
+    def __init__(
+        self, ocr: OCR, cache: OCRCache = None, ocr_config: Optional[str] = None
+    ):
+        self.ocr = ocr
+        self.cache = cache if cache is not None else MemoryOCRCache()
+        self.ocr_config = ocr_config
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+
+    def perform_ocr(self, image: object) -> dict:
+        """Perform OCR on a given image, or get its result from the cache.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+
+        :return: results dictionary containing bboxes and text for each detected word
+        """
+        key = self.get_cache_key(image)
+        ocr_result = self.cache.get(key)
+        if ocr_result is not None:
+            self.__count(hit=True)
+            return ocr_result
+
+        self.__count(hit=False)
+        ocr_result = self.ocr.perform_ocr(image)
+        self.cache.set(key, ocr_result)
+        return ocr_result
+
+    def get_cache_key(self, image: object) -> str:
+        """Get the cache key of an image: a hash of its content and the OCR config.
+
+        :param image: PIL Image/numpy array or file path(str)
+
+        :return: The key, as a hex string
+        """
+        image_hash = hashlib.sha256()
+        image_hash.update(type(self.ocr).__qualname__.encode())
+        if self.ocr_config is not None:
+            image_hash.update(self.ocr_config.encode())
+        if isinstance(image, str):
+            # The file content, and not the decoded image,
+            # as the OCR reads the file itself
+            image_hash.update(b"file")
+            with open(image, "rb") as image_file:
+                for block in iter(lambda: image_file.read(FILE_READ_SIZE), b""):
+                    image_hash.update(block)
+        elif isinstance(image, Image.Image):
+            image_hash.update(f"image {image.mode} {image.size}".encode())
+            image_hash.update(image.tobytes())
+        else:
+            image_hash.update(f"array {image.dtype} {image.shape}".encode())
+            image_hash.update(image.tobytes())
+        return image_hash.hexdigest()
+
+    def __count(self, hit: bool) -> None:
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
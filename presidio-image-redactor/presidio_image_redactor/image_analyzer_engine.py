@@ -1,10 +1,14 @@
-from typing import List
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Tuple
 
 from presidio_analyzer import AnalyzerEngine, RecognizerResult
 
 from presidio_image_redactor import OCR, TesseractOCR
 from presidio_image_redactor.entities import ImageRecognizerResult
 
+DEFAULT_BATCH_SIZE = 16
+
 
 class ImageAnalyzerEngine:
     """ImageAnalyzerEngine class.
@@ -42,6 +46,60 @@ class ImageAnalyzerEngine:
         )
         return bboxes
 
+    def analyze_batch(
+        self,
+        images: Iterable[object],
+        n_workers: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **kwargs,
+    ) -> Iterator[List[ImageRecognizerResult]]:
+        """Analyse a batch of images, e.g. the pages of a scanned document.
+
+        OCR is performed on the images concurrently by n_workers threads,
+        and the extracted texts are passed through the analyzer together,
+        in batches of batch_size texts (one by one, if the AnalyzerEngine
+        has no analyze_batch method).
+        Results are returned lazily, in the same order as the images.
+
+        :param images: an iterable of PIL Images/numpy arrays or file paths(str)
+        :param n_workers: Number of threads performing OCR concurrently
+        :param batch_size: Number of texts to buffer when running the NLP pipeline.
+        Bounds the number of images (and their OCR results) held in memory
+        :param kwargs: Additional values for the analyze_batch (or analyze) method
+        in AnalyzerEngine
+
+        :return: a generator of lists of the extracted entities with image
+        bounding boxes, one list per image
+        """
+        ocr_results = self.ocr.perform_ocr_batch(images, n_workers=n_workers)
+        # The OCR results whose text is in the NLP pipeline, in order
+        pending = deque()
+        texts = self.__get_texts(ocr_results, pending)
+        if hasattr(self.analyzer_engine, "analyze_batch"):
+            analyzer_results = self.analyzer_engine.analyze_batch(
+                texts, language="en", batch_size=batch_size, **kwargs
+            )
+        else:
+            # Versions of presidio-analyzer without AnalyzerEngine.analyze_batch
+            analyzer_results = (
+                self.analyzer_engine.analyze(text=text, language="en", **kwargs)
+                for text in texts
+            )
+        for analyzer_result in analyzer_results:
+            ocr_result, text = pending.popleft()
+            yield self.map_analyzer_results_to_bounding_boxes(
+                analyzer_result, ocr_result, text
+            )
+
+    def __get_texts(
+        self, ocr_results: Iterator[dict], pending: Deque[Tuple[dict, str]]
+    ) -> Iterator[str]:
+        """Get the text of each OCR result, keeping both in pending."""
+        for ocr_result in ocr_results:
+            text = self.ocr.get_text_from_ocr_dict(ocr_result)
+            pending.append((ocr_result, text))
+            yield text
+
     @staticmethod
     def map_analyzer_results_to_bounding_boxes(
         text_analyzer_results: List[RecognizerResult], ocr_result: dict, text: str
@@ -50,6 +108,8 @@ class ImageAnalyzerEngine:
 
         Matching is based on the position of the recognized entity from analyzer
         and word (in ocr dict) in the text.
+        The start positions of the words in the text are computed once,
+        and the words of each entity are found by a binary search over them.
 
         :param text_analyzer_results: PII entities recognized by presidio analyzer
         :param ocr_result: dict results with words and bboxes from OCR
@@ -60,58 +120,83 @@ class ImageAnalyzerEngine:
         if (not ocr_result) or (not text_analyzer_results):
             return []
 
-        bboxes = []
-        proc_indexes = 0
-        indexes = len(text_analyzer_results)
-
-        pos = 0
-        iter_ocr = enumerate(ocr_result["text"])
-        for index, word in iter_ocr:
-            if not word:
-                pos += 1
-            else:
-                for element in text_analyzer_results:
-                    text_element = text[element.start : element.end]
-                    # check position and text of ocr word matches recognized entity
-                    if (
-                        max(pos, element.start) < min(element.end, pos + len(word))
-                    ) and ((text_element in word) or (word in text_element)):
-                        bboxes.append(
-                            ImageRecognizerResult(
-                                element.entity_type,
-                                element.start,
-                                element.end,
-                                element.score,
-                                ocr_result["left"][index],
-                                ocr_result["top"][index],
-                                ocr_result["width"][index],
-                                ocr_result["height"][index],
-                            )
+        words = ocr_result["text"]
+        word_starts = ImageAnalyzerEngine._get_word_starts(words)
+
+        # The bounding boxes of each entity, with the index of its first word,
+        # so they can be returned in the order of the words in the text
+        entities_bboxes = []
+        for element in text_analyzer_results:
+            word_indexes = ImageAnalyzerEngine._get_entity_word_indexes(
+                element, words, word_starts, text
+            )
+            if not word_indexes:
+                continue
+            entities_bboxes.append(
+                (
+                    word_indexes[0],
+                    [
+                        ImageRecognizerResult(
+                            element.entity_type,
+                            element.start,
+                            element.end,
+                            element.score,
+                            ocr_result["left"][index],
+                            ocr_result["top"][index],
+                            ocr_result["width"][index],
+                            ocr_result["height"][index],
                         )
+                        for index in word_indexes
+                    ],
+                )
+            )
 
-                        # add bounding boxes for all words in ocr dict
-                        # contained within the text of recognized entity
-                        # based on relative position in the full text
-                        while pos + len(word) < element.end:
-                            index, word = next(iter_ocr)
-                            if word:
-                                bboxes.append(
-                                    ImageRecognizerResult(
-                                        element.entity_type,
-                                        element.start,
-                                        element.end,
-                                        element.score,
-                                        ocr_result["left"][index],
-                                        ocr_result["top"][index],
-                                        ocr_result["width"][index],
-                                        ocr_result["height"][index],
-                                    )
-                                )
-                            pos += len(word) + 1
-                        proc_indexes += 1
-
-                if proc_indexes == indexes:
-                    break
-                pos += len(word) + 1
+        entities_bboxes.sort(key=lambda entity_bboxes: entity_bboxes[0])
+        return [bbox for _, bboxes in entities_bboxes for bbox in bboxes]
 
-        return bboxes
+    @staticmethod
+    def _get_word_starts(words: List[str]) -> List[int]:
+        """Get the start position of each word in the text joined from the words.
+
+        :param words: The words of the ocr dict, joined by a single separator
+        :return: The start positions, in the order of the words
+        """
+        word_starts = []
+        pos = 0
+        for word in words:
+            word_starts.append(pos)
+            pos += len(word) + 1
+        return word_starts
+
+    @staticmethod
+    def _get_entity_word_indexes(
+        element: RecognizerResult, words: List[str], word_starts: List[int], text: str
+    ) -> List[int]:
+        """Get the indexes of the words of a recognized entity.
+
+        The entity words are the words overlapping the entity, starting from
+        the first one which contains the entity text or is contained in it.
+
+        :param element: The recognized entity
+        :param words: The words of the ocr dict
+        :param word_starts: The start position of each word in the text
+        :param text: text the entity is based on
+        :return: The indexes of the entity words, in the order of the words
+        """
+        text_element = text[element.start : element.end]
+        # The words starting before the entity end, from the word the entity
+        # starts in (or the word before it, if it starts at a separator)
+        first = max(bisect_right(word_starts, element.start) - 1, 0)
+        last = bisect_left(word_starts, element.end)
+        for index in range(first, last):
+            word = words[index]
+            pos = word_starts[index]
+            if (max(pos, element.start) < min(element.end, pos + len(word))) and (
+                (text_element in word) or (word in text_element)
+            ):
+                return [
+                    word_index
+                    for word_index in range(index, last)
+                    if words[word_index]
+                ]
+        return []
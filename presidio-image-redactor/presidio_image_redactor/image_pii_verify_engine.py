@@ -1,25 +1,24 @@
-from PIL import Image, ImageChops
-from presidio_image_redactor.image_analyzer_engine import ImageAnalyzerEngine
-import matplotlib
-import io
-from matplotlib import pyplot as plt
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
+from presidio_image_redactor.image_analyzer_engine import ImageAnalyzerEngine
 
-def fig2img(fig):
-    """Convert a Matplotlib figure to a PIL Image and return it."""
 
-    buf = io.BytesIO()
-    fig.savefig(buf)
-    buf.seek(0)
-    img = Image.open(buf)
-    return img
+class ImagePiiVerifyEngine:
+    """ImagePiiVerifyEngine class only supporting Pii verification currently.
 
+    :param image_analyzer_engine: Engine which performs OCR + PII detection.
+    """
 
-class ImagePiiVerifyEngine:
-    """ImagePiiVerifyEngine class only supporting Pii verification currently."""
+    BOX_COLOR = (0, 0, 255)
+    LABEL_COLOR = (0, 0, 0)
+    LABEL_FILL = (230, 230, 230)
+    LABEL_PADDING = 3
+    LABEL_OFFSET = 3
 
-    def __init__(self):
-        self.analyzer_engine = ImageAnalyzerEngine()
+    def __init__(self, image_analyzer_engine: ImageAnalyzerEngine = None):
+        if not image_analyzer_engine:
+            image_analyzer_engine = ImageAnalyzerEngine()
+        self.analyzer_engine = image_analyzer_engine
 
     def verify(self, image: Image) -> Image:
         """Annotate image with the detect PII entity.
@@ -30,33 +29,44 @@ class ImagePiiVerifyEngine:
         :return: the annotated image
         """
 
-        image = ImageChops.duplicate(image)
-        image_x, image_y = image.size
-        analyzer_engine = ImageAnalyzerEngine()
-        bboxes = analyzer_engine.analyze(image)
-        fig, ax = plt.subplots()
-        image_r = 70
-        fig.set_size_inches(image_x / image_r, image_y / image_r)
+        bboxes = self.analyzer_engine.analyze(image)
         if len(bboxes) == 0:
-            return image
-        else:
-            for box in bboxes:
-                entity_type = box.entity_type
-                x0 = box.left
-                y0 = box.top
-                x1 = x0 + box.width
-                y1 = y0 + box.height
-                rect = matplotlib.patches.Rectangle(
-                    (x0, y0), x1 - x0, y1 - y0, edgecolor="b", facecolor="none"
-                )
-                ax.add_patch(rect)
-                ax.annotate(
-                    entity_type,
-                    xy=(x0 - 3, y0 - 3),
-                    xycoords="data",
-                    bbox=dict(boxstyle="round4,pad=.5", fc="0.9"),
-                )
-            ax.imshow(image)
-            im_from_fig = fig2img(fig)
-            im_resized = im_from_fig.resize((image_x, image_y))
-            return im_resized
+            return ImageChops.duplicate(image)
+
+        image = image.convert("RGB")
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.load_default()
+
+        for box in bboxes:
+            x0 = box.left
+            y0 = box.top
+            x1 = x0 + box.width
+            y1 = y0 + box.height
+            draw.rectangle([x0, y0, x1, y1], outline=self.BOX_COLOR)
+            self.__draw_label(draw, font, box.entity_type, x0, y0)
+
+        return image
+
+    def __draw_label(
+        self,
+        draw: ImageDraw.ImageDraw,
+        font: ImageFont.ImageFont,
+        label: str,
+        x: int,
+        y: int,
+    ) -> None:
+        """Draw a label in a box, ending just above and left of (x, y)."""
+        left, top, right, bottom = draw.textbbox((0, 0), label, font=font)
+        text_x = x - self.LABEL_OFFSET
+        text_y = y - self.LABEL_OFFSET - bottom
+        draw.rectangle(
+            [
+                text_x + left - self.LABEL_PADDING,
+                text_y + top - self.LABEL_PADDING,
+                text_x + right + self.LABEL_PADDING,
+                text_y + bottom + self.LABEL_PADDING,
+            ],
+            fill=self.LABEL_FILL,
+            outline=self.LABEL_COLOR,
+        )
+        draw.text((text_x, text_y), label, fill=self.LABEL_COLOR, font=font)
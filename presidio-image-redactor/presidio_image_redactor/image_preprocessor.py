@@ -0,0 +1,124 @@
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from presidio_image_redactor.entities import InvalidParamException
+
+
+class ImagePreprocessor:
+    """ImagePreprocessor class that prepares images for OCR.
+
+    Very high resolution scans make OCR slow without improving its accuracy,
+    so images can be downscaled before OCR. The bounding boxes found on the
+    preprocessed image are scaled back to the original image by PreprocessingOCR.
+
+    :param grayscale: Whether to convert the image to grayscale
+    :param binarize: Whether to convert the image to black and white,
+    using a threshold computed from the image histogram (Otsu's method)
+    :param target_dpi: The resolution to downscale images to, when their
+    resolution (read from the image file) is higher
+    :param max_size: The maximal width and height in pixels to downscale images to
+    """
+
+    def __init__(
+        self,
+        grayscale: bool = False,
+        binarize: bool = False,
+        target_dpi: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ):
+        if target_dpi is not None and target_dpi <= 0:
+            raise InvalidParamException(
+                "Invalid input, target_dpi must be a positive number"
+            )
+        if max_size is not None and max_size <= 0:
+            raise InvalidParamException(
+                "Invalid input, max_size must be a positive number"
+            )
+        self.grayscale = grayscale
+        self.binarize = binarize
+        self.target_dpi = target_dpi
+        self.max_size = max_size
+
+    def preprocess(self, image: object) -> Tuple[Image.Image, float]:
+        """Preprocess an image for OCR.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+
+        :return: the preprocessed image, and the scale it was resized by
+        """
+        if isinstance(image, str):
+            image = Image.open(image)
+        elif not isinstance(image, Image.Image):
+            image = Image.fromarray(image)
+
+        if self.grayscale or self.binarize:
+            image = image.convert("L")
+
+        scale = self.get_scale(image)
+        if scale < 1:
+            size = (
+                max(round(image.width * scale), 1),
+                max(round(image.height * scale), 1),
+            )
+            dpi = image.info.get("dpi")
+            # Reducing the image by an integer factor first is a few times
+            # faster than resampling it, and the difference does not affect OCR
+            image = image.resize(size, Image.LANCZOS, reducing_gap=2.0)
+            if dpi:
+                # The OCR may read the resolution of the image
+                image.info["dpi"] = tuple(value * scale for value in dpi)
+
+        if self.binarize:
+            threshold = self.get_binarization_threshold(image)
+            image = image.point(
+                [255 if value > threshold else 0 for value in range(256)]
+            )
+
+        return image, scale
+
+    def get_scale(self, image: Image.Image) -> float:
+        """Get the scale to downscale an image by, or 1 to keep its size.
+
+        :param image: PIL Image to be processed
+        :return: the scale, no more than 1
+        """
+        scale = 1.0
+        dpi = image.info.get("dpi")
+        if self.target_dpi and dpi and max(dpi) > self.target_dpi:
+            scale = min(scale, self.target_dpi / max(dpi))
+        if self.max_size and max(image.size) > self.max_size:
+            scale = min(scale, self.max_size / max(image.size))
+        return scale
+
+    @staticmethod
+    def get_binarization_threshold(image: Image.Image) -> int:
+        """Get the threshold separating the dark and light pixels of an image.
+
+        The threshold maximizes the variance between the two groups of pixels
+        (Otsu's method).
+
+        :param image: grayscale PIL Image
+        :return: the threshold, pixels above it are light
+        """
+        histogram = image.histogram()
+        total_count = sum(histogram)
+        total_sum = sum(value * count for value, count in enumerate(histogram))
+
+        best_threshold = 0
+        best_variance = -1.0
+        dark_count = 0
+        dark_sum = 0
+        for threshold, count in enumerate(histogram):
+            dark_count += count
+            dark_sum += threshold * count
+            light_count = total_count - dark_count
+            if dark_count == 0 or light_count == 0:
+                continue
+            dark_mean = dark_sum / dark_count
+            light_mean = (total_sum - dark_sum) / light_count
+            variance = dark_count * light_count * (dark_mean - light_mean) ** 2
+            if variance > best_variance:
+                best_variance = variance
+                best_threshold = threshold
+        return best_threshold
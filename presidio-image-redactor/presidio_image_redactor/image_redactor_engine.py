@@ -1,8 +1,10 @@
-from typing import Union, Tuple
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Union, Tuple
 
-from PIL import Image, ImageDraw, ImageChops
+from PIL import Image, ImageDraw, ImageChops, ImageSequence
 
 from presidio_image_redactor import ImageAnalyzerEngine
+from presidio_image_redactor.entities import ImageRecognizerResult
 
 
 class ImageRedactorEngine:
@@ -31,9 +33,80 @@ class ImageRedactorEngine:
         :return: the redacted image
         """
 
-        image = ImageChops.duplicate(image)
-
         bboxes = self.image_analyzer_engine.analyze(image)
+        return self.__redact_bboxes(image, bboxes, fill)
+
+    def redact_batch(
+        self,
+        images: Iterable[Image.Image],
+        fill: Union[int, Tuple[int, int, int]] = (0, 0, 0),
+        n_workers: int = 1,
+    ) -> Iterator[Image.Image]:
+        """Redact a batch of images, e.g. the scanned images of a folder.
+
+        OCR is performed on the images concurrently by n_workers threads,
+        and the extracted texts are analyzed together.
+        The images are read lazily, and the redacted images are returned lazily,
+        in the same order as the images, so only a bounded number of images
+        is held in memory.
+        Please notice, this method duplicates the images, creates new instances and
+        manipulate them.
+
+        :param images: an iterable of PIL Images to be processed
+        :param fill: colour to fill the shape - int (0-255) for
+        grayscale or Tuple(R, G, B) for RGB
+        :param n_workers: Number of threads performing OCR concurrently
+
+        :return: a generator of the redacted images, one per input image
+        """
+        # The images being analyzed, in order
+        pending = deque()
+        bboxes_per_image = self.image_analyzer_engine.analyze_batch(
+            self.__get_images(images, pending), n_workers=n_workers
+        )
+        for bboxes in bboxes_per_image:
+            yield self.__redact_bboxes(pending.popleft(), bboxes, fill)
+
+    def redact_pages(
+        self,
+        image: Image.Image,
+        fill: Union[int, Tuple[int, int, int]] = (0, 0, 0),
+        n_workers: int = 1,
+    ) -> List[Image.Image]:
+        """Redact all the pages (frames) of a multi-page image, e.g. a TIFF scan.
+
+        The pages are redacted as a batch (see redact_batch).
+        The redacted document can be saved with:
+        pages[0].save(path, save_all=True, append_images=pages[1:])
+
+        :param image: multi-page PIL Image to be processed
+        :param fill: colour to fill the shape - int (0-255) for
+        grayscale or Tuple(R, G, B) for RGB
+        :param n_workers: Number of threads performing OCR concurrently
+
+        :return: the redacted pages, in order
+        """
+        # Each page is copied when read, as reading the next page changes the image
+        pages = (page.copy() for page in ImageSequence.Iterator(image))
+        return list(self.redact_batch(pages, fill, n_workers))
+
+    @staticmethod
+    def __get_images(
+        images: Iterable[Image.Image], pending: Deque[Image.Image]
+    ) -> Iterator[Image.Image]:
+        """Get the images, keeping them in pending."""
+        for image in images:
+            pending.append(image)
+            yield image
+
+    @staticmethod
+    def __redact_bboxes(
+        image: Image.Image,
+        bboxes: List[ImageRecognizerResult],
+        fill: Union[int, Tuple[int, int, int]],
+    ) -> Image.Image:
+        """Fill the bounding boxes on a copy of the image."""
+        image = ImageChops.duplicate(image)
         draw = ImageDraw.Draw(image)
 
         for box in bboxes:
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
 
 
 class OCR(ABC):
@@ -14,6 +17,35 @@ class OCR(ABC):
         """
         pass
 
+    def perform_ocr_batch(
+        self, images: Iterable[object], n_workers: int = 1
+    ) -> Iterator[dict]:
+        """Perform OCR on a batch of images, optionally using a pool of threads.
+
+        The images are read lazily, and at most 2 * n_workers images are
+        in progress at a time. Results are returned in the same order as the images.
+        Using multiple threads pays off when the OCR runs outside of the
+        Python interpreter (e.g. Tesseract, running as a separate process).
+
+        :param images: an iterable of PIL Images/numpy arrays or file paths(str)
+        :param n_workers: Number of threads performing OCR concurrently
+
+        :return: a generator of the results dictionaries, one per image
+        """
+        if n_workers <= 1:
+            for image in images:
+                yield self.perform_ocr(image)
+            return
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            pending = deque()
+            for image in images:
+                pending.append(executor.submit(self.perform_ocr, image))
+                if len(pending) >= 2 * n_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
     @staticmethod
     def get_text_from_ocr_dict(ocr_result: dict, separator: str = " ") -> str:
         """Combine the text from the OCR dict to full text.
@@ -0,0 +1,116 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from presidio_image_redactor.entities import InvalidParamException
+
+
+class OCRCache(ABC):
+    """OCRCache class that stores OCR results by a key of the image and OCR config.
+
+    Implementations are used by CachedOCR, possibly from multiple threads,
+    so they have to be thread safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """Get the OCR result of a key.
+
+        :param key: The key of the image and OCR config
+        :return: The OCR results dictionary, or None if it is not in the cache
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, ocr_result: dict) -> None:
+        """Store the OCR result of a key.
+
+        :param key: The key of the image and OCR config
+        :param ocr_result: The OCR results dictionary
+        """
+        pass
+
+
+class MemoryOCRCache(OCRCache):
+    """OCRCache keeping the OCR results of the most recently used keys in memory.
+
+    :param max_size: The number of OCR results to keep
+    """
+
+    def __init__(self, max_size: int = 128):
+        if max_size <= 0:
+            raise InvalidParamException(
+                "Invalid input, max_size must be a positive number"
+            )
+        self.max_size = max_size
+        self.__ocr_results = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get the OCR result of a key, marking it as recently used."""
+        with self.__lock:
+            ocr_result = self.__ocr_results.get(key)
+            if ocr_result is None:
+                return None
+            self.__ocr_results.move_to_end(key)
+        # Callers get their own copy, so changing it does not change the cache
+        return copy.deepcopy(ocr_result)
+
+    def set(self, key: str, ocr_result: dict) -> None:
+        """Store the OCR result of a key, removing the least recently used one."""
+        ocr_result = copy.deepcopy(ocr_result)
+        with self.__lock:
+            self.__ocr_results[key] = ocr_result
+            self.__ocr_results.move_to_end(key)
+            if len(self.__ocr_results) > self.max_size:
+                self.__ocr_results.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of OCR results in the cache."""
+        return len(self.__ocr_results)
+
+
+class DiskOCRCache(OCRCache):
+    """OCRCache storing the OCR results as JSON files in a directory.
+
+    The results are kept between runs and can be shared by multiple processes.
+
+    :param directory: The directory to store the results in, created if missing
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get the OCR result of a key from its file."""
+        try:
+            with open(self.__get_path(key), encoding="utf-8") as ocr_result_file:
+                return json.load(ocr_result_file)
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, ocr_result: dict) -> None:
+        """Store the OCR result of a key in its file.
+
+        The result is written to a temporary file which then replaces the file,
+        so readers never see a partially written result.
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                json.dump(ocr_result, temp_file)
+            os.replace(temp_path, self.__get_path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
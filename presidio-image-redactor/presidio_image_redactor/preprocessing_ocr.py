@@ -0,0 +1,66 @@
+import math
+
+from presidio_image_redactor.image_preprocessor import ImagePreprocessor
+from presidio_image_redactor.ocr import OCR
+
+
+class PreprocessingOCR(OCR):
+    """OCR class that preprocesses images before performing OCR with another OCR.
+
+    The bounding boxes found on a downscaled image are scaled back to
+    the original image, so the results can be used to redact it.
+
+    :param ocr: The OCR object performing OCR on the preprocessed images
+    :param image_preprocessor: The preprocessing to perform on the images
+    """
+
+    def __init__(self, ocr: OCR, image_preprocessor: ImagePreprocessor):
+        self.ocr = ocr
+        self.image_preprocessor = image_preprocessor
+
+    def perform_ocr(self, image: object) -> dict:
+        """Preprocess a given image and perform OCR on it.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+
+        :return: results dictionary containing bboxes and text for each detected word,
+        with the bboxes in the coordinates of the given image
+        """
+        preprocessed_image, scale = self.image_preprocessor.preprocess(image)
+        ocr_result = self.ocr.perform_ocr(preprocessed_image)
+        return self.scale_ocr_result(ocr_result, scale)
+
+    @staticmethod
+    def scale_ocr_result(ocr_result: dict, scale: float) -> dict:
+        """Scale the bounding boxes of an OCR result of a resized image back.
+
+        Each bounding box is extended to whole pixels, so it covers its word
+        in the original image.
+
+        :param ocr_result: results dictionary containing bboxes and text for each word
+        :param scale: The scale the image was resized by
+        :return: a copy of the results dictionary, with the scaled bounding boxes
+        """
+        scaled_ocr_result = dict(ocr_result)
+        if scale == 1 or not ocr_result:
+            return scaled_ocr_result
+
+        lefts = []
+        tops = []
+        widths = []
+        heights = []
+        for left, top, width, height in zip(
+            ocr_result["left"],
+            ocr_result["top"],
+            ocr_result["width"],
+            ocr_result["height"],
+        ):
+            lefts.append(math.floor(left / scale))
+            tops.append(math.floor(top / scale))
+            widths.append(math.ceil((left + width) / scale) - lefts[-1])
+            heights.append(math.ceil((top + height) / scale) - tops[-1])
+        scaled_ocr_result["left"] = lefts
+        scaled_ocr_result["top"] = tops
+        scaled_ocr_result["width"] = widths
+        scaled_ocr_result["height"] = heights
+        return scaled_ocr_result
@@ -8,7 +8,6 @@ requirements = [
     "pillow",
     "pytesseract==0.3.7",
     "presidio-analyzer>=1.9.0",
-    "matplotlib==3.3.4",
     "pydantic==1.7.4",
 ]
 
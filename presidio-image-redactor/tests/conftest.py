@@ -1,7 +1,8 @@
 import pytest
+from PIL import Image
 from presidio_analyzer.recognizer_result import RecognizerResult
 
-from presidio_image_redactor import ImageAnalyzerEngine
+from presidio_image_redactor import ImageAnalyzerEngine, OCR
 from presidio_image_redactor.entities import ImageRecognizerResult
 
 
@@ -45,3 +46,36 @@ def get_image_recognizerresult():
 @pytest.fixture(scope="module")
 def image_analyzer_engine():
     return ImageAnalyzerEngine()
+
+
+class WordsOCR(OCR):
+    """OCR returning one line of words per image, from the words of its width."""
+
+    def __init__(self, words_per_width):
+        self.words_per_width = words_per_width
+
+    def perform_ocr(self, image: Image) -> dict:
+        words = self.words_per_width[image.width]
+        word_count = len(words)
+        return {
+            "text": words,
+            "left": [10 * index for index in range(word_count)],
+            "top": [5] * word_count,
+            "width": [8] * word_count,
+            "height": [10] * word_count,
+        }
+
+
+@pytest.fixture(scope="module")
+def images_and_ocr():
+    words_per_width = {
+        100: ["Email", "john@microsoft.com", "or", "212-555-5555"],
+        110: ["No", "PII", "here"],
+        120: [],
+        130: ["", "Contact:", "jane@microsoft.com"],
+    }
+    images = [
+        Image.new("RGB", (width, 20), (255, 255, 255))
+        for width in [100, 110, 120, 130, 100]
+    ]
+    return images, WordsOCR(words_per_width)
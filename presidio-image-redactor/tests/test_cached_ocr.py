@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import (
+    OCR,
+    CachedOCR,
+    DiskOCRCache,
+    MemoryOCRCache,
+)
+from presidio_image_redactor.entities import InvalidParamException
+
+
+class CountingOCR(OCR):
+    def __init__(self):
+        self.calls = 0
+
+    def perform_ocr(self, image: object) -> dict:
+        self.calls += 1
+        return {"text": ["", f"call{self.calls}"], "left": [0, 10]}
+
+
+def create_image(color=(255, 255, 255), size=(20, 10), mode="RGB"):
+    return Image.new(mode, size, color)
+
+
+def test_given_identical_images_then_ocr_is_performed_once():
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+
+    first_result = cached_ocr.perform_ocr(create_image())
+    second_result = cached_ocr.perform_ocr(create_image())
+
+    assert first_result == second_result == {"text": ["", "call1"], "left": [0, 10]}
+    assert ocr.calls == 1
+    assert (cached_ocr.hits, cached_ocr.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        create_image(color=(255, 255, 254)),
+        create_image(size=(10, 20)),
+        create_image(color=255, mode="L"),
+        np.full((10, 20, 3), 255, dtype=np.uint8),
+    ],
+)
+def test_given_different_image_then_ocr_is_performed_again(image):
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+
+    cached_ocr.perform_ocr(create_image())
+    cached_ocr.perform_ocr(image)
+
+    assert ocr.calls == 2
+    assert (cached_ocr.hits, cached_ocr.misses) == (0, 2)
+
+
+def test_given_identical_arrays_and_files_then_ocr_is_performed_once_for_each(
+    tmp_path,
+):
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+    path = str(tmp_path / "image.png")
+    create_image().save(path)
+
+    for _ in range(2):
+        cached_ocr.perform_ocr(np.full((10, 20, 3), 255, dtype=np.uint8))
+        cached_ocr.perform_ocr(path)
+
+    assert ocr.calls == 2
+    assert (cached_ocr.hits, cached_ocr.misses) == (2, 2)
+
+
+def test_given_different_ocr_config_then_results_are_cached_separately():
+    ocr = CountingOCR()
+    cache = MemoryOCRCache()
+
+    CachedOCR(ocr, cache, ocr_config="eng").perform_ocr(create_image())
+    CachedOCR(ocr, cache, ocr_config="heb").perform_ocr(create_image())
+    CachedOCR(ocr, cache, ocr_config="eng").perform_ocr(create_image())
+
+    assert ocr.calls == 2
+
+
+def test_given_cached_result_is_changed_then_the_cache_does_not_change():
+    cached_ocr = CachedOCR(CountingOCR())
+
+    cached_ocr.perform_ocr(create_image())["text"].append("changed")
+
+    assert cached_ocr.perform_ocr(create_image())["text"] == ["", "call1"]
+
+
+def test_given_memory_cache_is_full_then_least_recently_used_result_is_removed():
+    cache = MemoryOCRCache(max_size=2)
+    cache.set("a", {"text": ["a"]})
+    cache.set("b", {"text": ["b"]})
+    cache.get("a")
+    cache.set("c", {"text": ["c"]})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": ["a"]}
+    assert cache.get("c") == {"text": ["c"]}
+
+
+def test_given_invalid_max_size_then_memory_cache_fails():
+    with pytest.raises(
+        InvalidParamException, match="Invalid input, max_size must be a positive number"
+    ):
+        MemoryOCRCache(max_size=0)
+
+
+def test_given_disk_cache_then_results_are_kept_between_instances(tmp_path):
+    directory = str(tmp_path / "ocr_cache")
+    ocr = CountingOCR()
+
+    first_result = CachedOCR(ocr, DiskOCRCache(directory)).perform_ocr(
+        create_image()
+    )
+    cached_ocr = CachedOCR(ocr, DiskOCRCache(directory))
+    second_result = cached_ocr.perform_ocr(create_image())
+
+    assert first_result == second_result
+    assert ocr.calls == 1
+    assert (cached_ocr.hits, cached_ocr.misses) == (1, 0)
+    assert [path.suffix for path in (tmp_path / "ocr_cache").iterdir()] == [".json"]
+
+
+def test_given_missing_key_then_disk_cache_returns_none(tmp_path):
+    assert DiskOCRCache(str(tmp_path)).get("missing") is None
+
+
+def test_given_batch_with_repeated_images_then_ocr_is_performed_once_per_image():
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+    images = [create_image(color=(index % 3, 0, 0)) for index in range(12)]
+
+    results = list(cached_ocr.perform_ocr_batch(images, n_workers=1))
+
+    assert ocr.calls == 3
+    assert results[3] == results[0]
+    assert (cached_ocr.hits, cached_ocr.misses) == (9, 3)
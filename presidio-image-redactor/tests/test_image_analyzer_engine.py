@@ -113,3 +113,67 @@ def test_given_dif_len_entities_then_map_analyzer_returns_correct_outputand_len(
 
     assert len(expected_result) == len(mapped_entities)
     assert expected_result == mapped_entities
+
+
+def test_given_multiword_entity_with_dif_len_words_then_map_analyzer_returns_its_words(
+    get_ocr_analyzer_results,
+):
+    ocr_result, text, _ = get_ocr_analyzer_results
+
+    recognizer_result = [
+        RecognizerResult("ORGANIZATION", 7, 20, 0.85),
+        RecognizerResult("PERSON", 32, 37, 0.85),
+    ]
+    expected_result = [
+        ImageRecognizerResult("ORGANIZATION", 7, 20, 0.85, 322, 67, 191, 37),
+        ImageRecognizerResult("ORGANIZATION", 7, 20, 0.85, 530, 76, 87, 28),
+        ImageRecognizerResult("PERSON", 32, 37, 0.85, 896, 64, 183, 40),
+    ]
+    mapped_entities = ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes(
+        recognizer_result, ocr_result, text
+    )
+
+    assert expected_result == mapped_entities
+
+
+def test_given_entities_not_in_text_order_then_map_analyzer_returns_bboxes_in_order(
+    get_ocr_analyzer_results, get_image_recognizerresult
+):
+    ocr_result, text, recognizer_result = get_ocr_analyzer_results
+
+    mapped_entities = ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes(
+        list(reversed(recognizer_result)), ocr_result, text
+    )
+
+    assert get_image_recognizerresult == mapped_entities
+
+
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_given_images_then_analyze_batch_returns_the_results_of_analyze(
+    images_and_ocr, image_analyzer_engine, n_workers
+):
+    images, ocr = images_and_ocr
+    engine = ImageAnalyzerEngine(image_analyzer_engine.analyzer_engine, ocr)
+
+    results = list(engine.analyze_batch(iter(images), n_workers=n_workers))
+
+    assert results == [engine.analyze(image) for image in images]
+    assert [bool(bboxes) for bboxes in results] == [True, False, False, True, True]
+
+
+def test_given_analyzer_without_analyze_batch_then_analyze_batch_uses_analyze(
+    images_and_ocr, image_analyzer_engine
+):
+    images, ocr = images_and_ocr
+    analyzer_engine = image_analyzer_engine.analyzer_engine
+
+    class AnalyzerEngineWithoutBatch:
+        def analyze(self, **kwargs):
+            return analyzer_engine.analyze(**kwargs)
+
+    engine = ImageAnalyzerEngine(AnalyzerEngineWithoutBatch(), ocr)
+
+    results = list(engine.analyze_batch(iter(images), batch_size=2))
+
+    assert results == [engine.analyze(image) for image in images]
+    assert [bool(bboxes) for bboxes in results] == [True, False, False, True, True]
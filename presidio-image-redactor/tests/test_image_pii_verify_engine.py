@@ -0,0 +1,54 @@
+from unittest import mock
+
+from PIL import Image
+
+from presidio_image_redactor import ImageAnalyzerEngine, ImagePiiVerifyEngine
+from presidio_image_redactor.entities import ImageRecognizerResult
+
+
+def get_image_analyzer_engine(bboxes):
+    image_analyzer_engine = mock.Mock(spec=ImageAnalyzerEngine)
+    image_analyzer_engine.analyze.return_value = bboxes
+    return image_analyzer_engine
+
+
+def test_given_image_analyzer_engine_then_verify_uses_it():
+    image = Image.new("RGB", (200, 100), (255, 255, 255))
+    image_analyzer_engine = get_image_analyzer_engine([])
+
+    verify_engine = ImagePiiVerifyEngine(image_analyzer_engine)
+    verify_engine.verify(image)
+
+    assert verify_engine.analyzer_engine is image_analyzer_engine
+    image_analyzer_engine.analyze.assert_called_once_with(image)
+
+
+def test_given_no_entities_then_verify_returns_an_identical_copy():
+    image = Image.new("L", (200, 100), 255)
+
+    verified_image = ImagePiiVerifyEngine(get_image_analyzer_engine([])).verify(image)
+
+    assert verified_image is not image
+    assert verified_image.mode == image.mode
+    assert verified_image.tobytes() == image.tobytes()
+
+
+def test_given_entity_then_verify_draws_its_box_and_label():
+    image = Image.new("L", (200, 100), 255)
+    bboxes = [ImageRecognizerResult("PERSON", 0, 5, 0.85, 40, 40, 60, 20)]
+
+    verified_image = ImagePiiVerifyEngine(get_image_analyzer_engine(bboxes)).verify(
+        image
+    )
+
+    assert verified_image.mode == "RGB"
+    assert verified_image.size == image.size
+    # The box outline
+    assert verified_image.getpixel((40, 50)) == ImagePiiVerifyEngine.BOX_COLOR
+    assert verified_image.getpixel((100, 60)) == ImagePiiVerifyEngine.BOX_COLOR
+    # Inside the box
+    assert verified_image.getpixel((70, 50)) == (255, 255, 255)
+    # The label, above and left of the box
+    assert verified_image.getpixel((37, 30)) == ImagePiiVerifyEngine.LABEL_FILL
+    # The original image does not change
+    assert set(image.tobytes()) == {255}
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import ImagePreprocessor
+from presidio_image_redactor.entities import InvalidParamException
+
+
+def create_image(size=(200, 100), dpi=None):
+    image = Image.new("RGB", size, (255, 255, 255))
+    if dpi:
+        image.info["dpi"] = dpi
+    return image
+
+
+def test_given_default_preprocessor_then_image_does_not_change():
+    image = create_image()
+
+    preprocessed_image, scale = ImagePreprocessor().preprocess(image)
+
+    assert scale == 1
+    assert preprocessed_image.mode == "RGB"
+    assert preprocessed_image.tobytes() == image.tobytes()
+
+
+def test_given_grayscale_then_image_is_converted_to_grayscale():
+    preprocessed_image, scale = ImagePreprocessor(grayscale=True).preprocess(
+        create_image()
+    )
+
+    assert scale == 1
+    assert preprocessed_image.mode == "L"
+    assert preprocessed_image.size == (200, 100)
+
+
+def test_given_binarize_then_image_has_only_black_and_white_pixels():
+    image = Image.new("L", (200, 100), 200)
+    image.paste(50, (0, 0, 100, 100))
+    image.paste(90, (0, 0, 10, 10))
+
+    preprocessed_image, _ = ImagePreprocessor(binarize=True).preprocess(image)
+
+    assert 50 <= ImagePreprocessor.get_binarization_threshold(image) < 200
+    assert preprocessed_image.getpixel((5, 5)) == 0
+    assert preprocessed_image.getpixel((50, 50)) == 0
+    assert preprocessed_image.getpixel((150, 50)) == 255
+    assert set(preprocessed_image.tobytes()) == {0, 255}
+
+
+@pytest.mark.parametrize(
+    "dpi, expected_scale, expected_size",
+    [
+        ((600, 600), 0.5, (100, 50)),
+        ((1200, 1200), 0.25, (50, 25)),
+        ((300, 300), 1, (200, 100)),
+        ((150, 150), 1, (200, 100)),
+        (None, 1, (200, 100)),
+    ],
+)
+def test_given_target_dpi_then_images_with_higher_dpi_are_downscaled(
+    dpi, expected_scale, expected_size
+):
+    image = create_image(dpi=dpi)
+
+    preprocessed_image, scale = ImagePreprocessor(target_dpi=300).preprocess(image)
+
+    assert scale == expected_scale
+    assert preprocessed_image.size == expected_size
+    if dpi and scale < 1:
+        assert preprocessed_image.info["dpi"] == (300, 300)
+
+
+def test_given_max_size_then_larger_images_are_downscaled():
+    preprocessor = ImagePreprocessor(max_size=100, target_dpi=300)
+
+    preprocessed_image, scale = preprocessor.preprocess(create_image(dpi=(400, 400)))
+
+    assert scale == 0.5
+    assert preprocessed_image.size == (100, 50)
+    assert preprocessor.preprocess(create_image(size=(100, 80)))[1] == 1
+
+
+@pytest.mark.parametrize(
+    "image",
+    [np.full((100, 200, 3), 255, dtype=np.uint8), "file"],
+)
+def test_given_array_or_file_then_image_is_preprocessed(image, tmp_path):
+    if isinstance(image, str):
+        image = str(tmp_path / "image.png")
+        create_image(dpi=(600, 600)).save(image, dpi=(600, 600))
+
+    preprocessed_image, scale = ImagePreprocessor(
+        grayscale=True, max_size=100
+    ).preprocess(image)
+
+    assert scale == 0.5
+    assert preprocessed_image.mode == "L"
+    assert preprocessed_image.size == (100, 50)
+
+
+@pytest.mark.parametrize(
+    "params, expected_error",
+    [
+        ({"target_dpi": 0}, "Invalid input, target_dpi must be a positive number"),
+        ({"max_size": -1}, "Invalid input, max_size must be a positive number"),
+    ],
+)
+def test_given_invalid_params_then_preprocessor_fails(params, expected_error):
+    with pytest.raises(InvalidParamException, match=expected_error):
+        ImagePreprocessor(**params)
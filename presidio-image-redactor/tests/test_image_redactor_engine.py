@@ -0,0 +1,52 @@
+import io
+
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import ImageAnalyzerEngine, ImageRedactorEngine
+
+
+@pytest.fixture(scope="module")
+def image_redactor_engine(images_and_ocr, image_analyzer_engine):
+    _, ocr = images_and_ocr
+    return ImageRedactorEngine(
+        ImageAnalyzerEngine(image_analyzer_engine.analyzer_engine, ocr)
+    )
+
+
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_given_images_then_redact_batch_returns_the_redacted_images_in_order(
+    images_and_ocr, image_redactor_engine, n_workers
+):
+    images, _ = images_and_ocr
+
+    redacted_images = list(
+        image_redactor_engine.redact_batch(iter(images), (255, 0, 0), n_workers)
+    )
+
+    assert [image.tobytes() for image in redacted_images] == [
+        image_redactor_engine.redact(image, (255, 0, 0)).tobytes()
+        for image in images
+    ]
+    # The second word of the first image is redacted
+    assert redacted_images[0].getpixel((12, 10)) == (255, 0, 0)
+    assert redacted_images[1].tobytes() == images[1].tobytes()
+    assert images[0].getpixel((12, 10)) == (255, 255, 255)
+
+
+def test_given_multi_page_image_then_redact_pages_returns_the_redacted_pages(
+    images_and_ocr, image_redactor_engine
+):
+    images, _ = images_and_ocr
+    # Each page has the width of an image, to get the OCR result of that image
+    pages = [image.copy() for image in images]
+    file = io.BytesIO()
+    pages[0].save(file, format="TIFF", save_all=True, append_images=pages[1:])
+    file.seek(0)
+    multi_page_image = Image.open(file)
+
+    redacted_pages = image_redactor_engine.redact_pages(multi_page_image, 1, 2)
+
+    assert [page.tobytes() for page in redacted_pages] == [
+        image_redactor_engine.redact(page, 1).tobytes() for page in pages
+    ]
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from presidio_image_redactor import OCR
+
+
+class DelayedOCR(OCR):
+    def perform_ocr(self, image: object) -> dict:
+        # Finish later images first
+        time.sleep(0.01 * (5 - image % 5))
+        return {"text": [str(image)]}
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_given_images_then_perform_ocr_batch_returns_results_in_order(n_workers):
+    results = DelayedOCR().perform_ocr_batch(range(12), n_workers=n_workers)
+
+    assert [result["text"] for result in results] == [[str(i)] for i in range(12)]
+
+
+def test_given_many_images_then_perform_ocr_batch_reads_a_bounded_number():
+    read_images = []
+
+    def images():
+        for image in range(20):
+            read_images.append(image)
+            yield image
+
+    results = DelayedOCR().perform_ocr_batch(images(), n_workers=2)
+
+    assert next(results) == {"text": ["0"]}
+    assert len(read_images) <= 4
+    assert len(list(results)) == 19
@@ -0,0 +1,70 @@
+from PIL import Image
+
+from presidio_image_redactor import OCR, ImagePreprocessor, PreprocessingOCR
+
+
+class SizeOCR(OCR):
+    """OCR returning one word, with a bbox in the middle of the image."""
+
+    def __init__(self):
+        self.images = []
+
+    def perform_ocr(self, image: Image) -> dict:
+        self.images.append(image)
+        return {
+            "text": ["", "word"],
+            "left": [0, image.width // 4],
+            "top": [0, image.height // 4],
+            "width": [image.width, image.width // 2],
+            "height": [image.height, image.height // 2],
+            "conf": [-1, 95],
+        }
+
+
+def test_given_downscaled_image_then_bboxes_are_scaled_back():
+    ocr = SizeOCR()
+    preprocessing_ocr = PreprocessingOCR(ocr, ImagePreprocessor(max_size=100))
+
+    ocr_result = preprocessing_ocr.perform_ocr(
+        Image.new("RGB", (400, 200), (255, 255, 255))
+    )
+
+    assert ocr.images[0].size == (100, 50)
+    assert ocr_result == {
+        "text": ["", "word"],
+        "left": [0, 100],
+        "top": [0, 48],
+        "width": [400, 200],
+        "height": [200, 100],
+        "conf": [-1, 95],
+    }
+
+
+def test_given_image_which_is_not_resized_then_ocr_result_does_not_change():
+    ocr = SizeOCR()
+    preprocessing_ocr = PreprocessingOCR(ocr, ImagePreprocessor(grayscale=True))
+    image = Image.new("RGB", (400, 200), (255, 255, 255))
+
+    ocr_result = preprocessing_ocr.perform_ocr(image)
+
+    assert ocr.images[0].mode == "L"
+    assert ocr_result == SizeOCR().perform_ocr(image)
+
+
+def test_given_scale_then_bboxes_cover_the_scaled_back_words():
+    ocr_result = {
+        "text": ["word"],
+        "left": [3],
+        "top": [5],
+        "width": [3],
+        "height": [2],
+    }
+
+    scaled_ocr_result = PreprocessingOCR.scale_ocr_result(ocr_result, 0.4)
+
+    # 3 / 0.4 = 7.5 and (3 + 3) / 0.4 = 15
+    assert scaled_ocr_result["left"] == [7]
+    assert scaled_ocr_result["width"] == [8]
+    assert scaled_ocr_result["top"] == [12]
+    assert scaled_ocr_result["height"] == [6]
+    assert ocr_result["left"] == [3]